@@ -0,0 +1,105 @@
+"""A* benchmark against the previous implementation (linear scan of the open set, scores in
+dicts), run it from the project directory with:
+
+    python -m benchmarks.a_star
+"""
+
+import random
+import time
+
+import maze.heuristics as heuristics
+import maze.maze as m
+import maze.maze_tools as mt
+
+SIZES = [100, 300, 1000]
+
+
+def reference_a_star(maze: m.Maze) -> list[int]:
+    """The previous A*, kept as a baseline
+
+    Args:
+        maze (Maze): A generated maze
+
+    Returns:
+        list[int]: Indexes of the cells of the shortest path
+    """
+    def heuristic(c1: int, c2: int) -> int:
+        return heuristics.manhattan(maze, c1, c2)
+
+    start = maze.start
+    goal = maze.end
+
+    closedSet = set()
+    openSet = {start}
+    cameFrom = {}
+    gScore = {start: 0}
+    fScore = {start: heuristic(start, goal)}
+
+    while len(openSet) > 0:
+        current = min(openSet, key=lambda x: fScore[x])
+        if current == goal:
+            total_path = [current]
+            while current in cameFrom:
+                current = cameFrom[current]
+                total_path.insert(0, current)
+            return total_path
+
+        openSet.remove(current)
+        closedSet.add(current)
+
+        for neighbor in maze.get_open_neighbors(current):
+            if neighbor in closedSet:
+                continue
+
+            tentative_gScore = gScore[current] + 1
+            if neighbor not in openSet:
+                openSet.add(neighbor)
+            elif tentative_gScore >= gScore[neighbor]:
+                continue
+
+            cameFrom[neighbor] = current
+            gScore[neighbor] = tentative_gScore
+            fScore[neighbor] = gScore[neighbor] + heuristic(neighbor, goal)
+
+    return []
+
+
+def build_maze(size: int) -> m.Maze:
+    """Generates a size x size maze
+
+    Args:
+        size (int): Width and height of the maze
+
+    Returns:
+        Maze: The generated maze
+    """
+    random.seed(0)
+    maze = m.Maze(size, size)
+    mt.MazeGenerator.randomized_kruskal(maze)
+    return maze
+
+
+def main():
+    mt.Window.GENERATE_ANIMATION = False
+    mt.Window.SOLVE_ANIMATION = False
+
+    print(f"{'size':>11} {'path':>7} {'previous (s)':>13} {'current (s)':>12} {'speedup':>8}")
+    for size in SIZES:
+        maze = build_maze(size)
+
+        start = time.perf_counter()
+        reference_path = reference_a_star(maze)
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        path = mt.MazeSolver.a_star(maze)
+        current_time = time.perf_counter() - start
+
+        assert [cell.id for cell in path] == reference_path
+        print(
+            f"{size:>5}x{size:<5} {len(path):>7} {reference_time:>13.3f} {current_time:>12.3f} {reference_time / current_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Number of cells expanded by the bidirectional breadth-first search compared with the
+one-sided one and Dijkstra, on the mazes of every generator. Run it from the project
+directory with:
+
+    python -m benchmarks.bidirectional_bfs
+"""
+
+import random
+
+import maze.maze as m
+import maze.maze_tools as mt
+import maze.stats as run_stats
+
+SIZE = 200
+SEEDS = range(5)
+SOLVERS = {
+    "bfs": mt.MazeSolver.breadth_first_search,
+    "dijkstra": mt.MazeSolver.dijkstra,
+    "bidirectional": mt.MazeSolver.bidirectional_breadth_first_search,
+}
+
+
+def main():
+    mt.Window.GENERATE_ANIMATION = False
+    mt.Window.SOLVE_ANIMATION = False
+
+    print(f"Average expanded cells over {len(SEEDS)} mazes of {SIZE}x{SIZE}\n")
+    print(
+        f"{'generator':>20} "
+        + " ".join(f"{name:>13}" for name in SOLVERS)
+        + f" {'reduction':>10}"
+    )
+    for name, generator in mt.MazeGenerator.ALGORITHMS.items():
+        expanded = {solver: 0 for solver in SOLVERS}
+        for seed in SEEDS:
+            random.seed(seed)
+            maze = m.Maze(SIZE, SIZE)
+            generator(maze)
+            for solver_name, solver in SOLVERS.items():
+                stats = run_stats.measure(solver, maze)
+                expanded[solver_name] += stats.cells_expanded / len(SEEDS)
+
+        print(
+            f"{name:>20} "
+            + " ".join(f"{count:>13.0f}" for count in expanded.values())
+            + f" {expanded['bfs'] / expanded['bidirectional']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Cold import time of the generation and solving core, each import in a new interpreter, and
+check that no display or keyboard module comes with it. Run it from the project directory with:
+
+    python -m benchmarks.cold_import
+"""
+
+import subprocess
+import sys
+
+MODULES = ["maze.maze", "maze.events", "maze.maze_tools"]
+REPEAT = 10
+DISPLAY_MODULES = ["pygame", "keyboard"]
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(name for name in {display_modules!r} if name in sys.modules))
+"""
+
+
+def cold_import(module: str) -> tuple[float, str]:
+    """Imports a module in a new interpreter
+
+    Args:
+        module (str): Name of the module
+
+    Returns:
+        tuple[float, str]: Import time in seconds, and the display modules that got imported
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(module=module, display_modules=DISPLAY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split(" ")
+    return float(output[0]), output[1].strip()
+
+
+def main():
+    print(f"{'module':>18} {'best (ms)':>10} {'median (ms)':>12}  display modules")
+    for module in MODULES:
+        runs = [cold_import(module) for _ in range(REPEAT)]
+        times = sorted(elapsed for elapsed, _ in runs)
+        loaded = runs[-1][1] or "none"
+        print(
+            f"{module:>18} {times[0] * 1e3:>10.2f} {times[len(times) // 2] * 1e3:>12.2f}  {loaded}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Animated hunt and kill benchmark (needs pygame, runs offscreen), run it from the project
+directory with:
+
+    python -m benchmarks.hunt_and_kill_animation
+
+The time spent per frame should stay flat as the maze grows, each frame redrawing only the cells
+changed since the previous one.
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import maze.maze as m
+import maze.maze_tools as mt
+
+SIZES = [10, 20, 30, 40]
+
+
+def time_animated_run(size: int) -> tuple[int, float]:
+    """Runs an animated hunt and kill over a size x size maze, as fast as the window allows
+
+    Args:
+        size (int): Width and height of the maze
+
+    Returns:
+        tuple[int, float]: Number of frames drawn and time spent in seconds
+    """
+    random.seed(0)
+    maze = m.Maze(size, size)
+    mt.MazeDrawer(mt.MazeGenerator(0), mt.MazeSolver(0), maze)
+    mt.MazeDrawer.draw_maze(maze)
+
+    frames = 0
+    refresh = mt.MazeDrawer.refresh_drawing_on_screen
+
+    def counting_refresh(maze: m.Maze) -> None:
+        nonlocal frames
+        frames += 1
+        refresh(maze)
+
+    mt.MazeDrawer.refresh_drawing_on_screen = counting_refresh
+    try:
+        start = time.perf_counter()
+        mt.MazeGenerator.hunt_and_kill(maze)
+        elapsed = time.perf_counter() - start
+    finally:
+        mt.MazeDrawer.refresh_drawing_on_screen = refresh
+
+    return frames, elapsed
+
+
+def main():
+    mt.Window.GENERATE_ANIMATION = True
+    mt.Window.FPS = 0  # No frame limit
+
+    print(f"{'size':>9} {'frames':>7} {'ms/frame':>9}")
+    for size in SIZES:
+        frames, elapsed = time_animated_run(size)
+        per_frame = elapsed / frames
+        print(f"{size:>4}x{size:<4} {frames:>7} {per_frame * 1e3:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Solving time and expanded nodes of A* and Dijkstra on the grid compared with the junction
+graph (corridors collapsed into weighted edges), on the mazes of every generator. Run it from
+the project directory with:
+
+    python -m benchmarks.junction_graph
+"""
+
+import random
+import time
+
+import maze.maze as m
+import maze.maze_tools as mt
+import maze.stats as run_stats
+
+SIZE = 200
+SEED = 0
+SOLVERS = {
+    "a_star": mt.MazeSolver.a_star,
+    "dijkstra": mt.MazeSolver.dijkstra,
+}
+
+
+def measure(solver, maze: m.Maze, contracted: bool) -> tuple[float, int, int]:
+    start = time.perf_counter()
+    path = solver(maze, contracted=contracted)
+    elapsed = time.perf_counter() - start
+
+    # Counted apart, so the time is not the one of a run building its events
+    expanded = run_stats.measure(solver, maze, contracted=contracted).cells_expanded
+    return elapsed, expanded, len(path)
+
+
+def main():
+    mt.Window.GENERATE_ANIMATION = False
+    mt.Window.SOLVE_ANIMATION = False
+
+    print(f"Mazes of {SIZE}x{SIZE} ({SIZE * SIZE} cells), times in ms\n")
+    print(
+        f"{'generator':>20} {'nodes':>7} {'build':>7} "
+        + " ".join(
+            f"{solver + ' ' + side:>16} {'expanded':>9}"
+            for solver in SOLVERS
+            for side in ("grid", "graph")
+        )
+    )
+    for name, generator in mt.MazeGenerator.ALGORITHMS.items():
+        random.seed(SEED)
+        maze = m.Maze(SIZE, SIZE)
+        generator(maze)
+
+        start = time.perf_counter()
+        graph = maze.get_junction_graph()
+        build = time.perf_counter() - start
+
+        columns = []
+        for solver in SOLVERS.values():
+            grid_time, grid_expanded, grid_length = measure(solver, maze, False)
+            graph_time, graph_expanded, graph_length = measure(solver, maze, True)
+            assert grid_length == graph_length
+            columns.append(f"{grid_time * 1000:>16.1f} {grid_expanded:>9}")
+            columns.append(f"{graph_time * 1000:>16.1f} {graph_expanded:>9}")
+
+        print(f"{name:>20} {len(graph):>7} {build * 1000:>7.0f} " + " ".join(columns))
+
+
+if __name__ == "__main__":
+    main()
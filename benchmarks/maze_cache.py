@@ -0,0 +1,62 @@
+"""Time to get a big maze by generating it, then out of the on-disk cache, in an empty
+temporary cache. The example of the README is run first in a new interpreter, with the default
+Window flags and no window. Run it from the project directory with:
+
+    python -m benchmarks.maze_cache
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import maze.cache as cache
+
+GENERATORS = ["sidewinder", "depth_first_search"]
+SIZE = 1000
+SEED = 0
+REPEAT = 5
+
+README_EXAMPLE = """
+from maze.cache import MazeCache
+
+maze = MazeCache().generate("wilson", 50, 50, seed=42)
+"""
+
+
+def check_readme_example() -> None:
+    """Runs the README example twice in new interpreters (generated then cached), failing if it
+    raises"""
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, MAZE_CACHE_DIR=directory)
+        for _ in range(2):
+            subprocess.run([sys.executable, "-c", README_EXAMPLE], env=env, check=True)
+
+
+def main():
+    check_readme_example()
+
+    print(f"{SIZE}x{SIZE} mazes, seed {SEED}\n")
+    print(f"{'':>20} {'generated (s)':>14} {'cached (ms)':>12} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        maze_cache = cache.MazeCache(directory)
+        for name in GENERATORS:
+            start = time.perf_counter()
+            generated = maze_cache.generate(name, SIZE, SIZE, SEED)
+            miss = time.perf_counter() - start
+
+            hits = []
+            for _ in range(REPEAT):
+                start = time.perf_counter()
+                cached = maze_cache.generate(name, SIZE, SIZE, SEED)
+                hits.append(time.perf_counter() - start)
+            if cached.walls != generated.walls:
+                raise AssertionError(f"Different maze out of the cache for {name}")
+
+            hit = min(hits)
+            print(f"{name:>20} {miss:>14.2f} {hit * 1e3:>12.1f} {miss / hit:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Save and load throughput of maze files, and solving of a 100M cells maze memory-mapped from
+the disk with a breadth-first search (the only solver not allocating arrays as big as the
+maze). Run it from the project directory with:
+
+    python -m benchmarks.maze_file
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import maze.maze as m
+import maze.maze_file as mf
+import maze.maze_tools as mt
+import maze.stats as run_stats
+
+SIZES = [100, 500, 1000, 2000]
+HUGE_SIZE = 10000  # 100M cells
+SEED = 0
+
+
+def binary_tree_walls(width: int, height: int, first_row: int, rows: int, rng) -> bytes:
+    """Walls of some rows of a binary tree maze, every cell opening its east or south wall,
+    vectorized so huge mazes can be written quickly
+
+    Args:
+        width (int): Width of the maze
+        height (int): Height of the maze
+        first_row (int): First row wanted
+        rows (int): Number of rows wanted
+        rng (Generator): NumPy random generator
+
+    Returns:
+        bytes: OPEN_EAST | OPEN_SOUTH state of each cell of the rows
+    """
+    walls = np.where(
+        rng.integers(0, 2, size=(rows, width), dtype=np.uint8) == 1, m.OPEN_EAST, m.OPEN_SOUTH
+    ).astype(np.uint8)
+    walls[:, -1] = m.OPEN_SOUTH
+    if first_row + rows == height:
+        walls[-1, :] = m.OPEN_EAST
+        walls[-1, -1] = 0
+    return walls.tobytes()
+
+
+def best_time(function, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def round_trip(directory: str) -> None:
+    print(
+        f"{'size':>11} {'file (MB)':>10} {'save (MB/s)':>12} {'unpack (MB/s)':>14} "
+        f"{'load (MB/s)':>12} {'map (ms)':>9}"
+    )
+    for size in SIZES:
+        maze = m.Maze(size, size)
+        maze.walls[:] = binary_tree_walls(size, size, 0, size, np.random.default_rng(SEED))
+        path = os.path.join(directory, f"{size}.maze")
+
+        save_time = best_time(lambda: mf.save(path, maze, "binary_tree", SEED))
+        with open(path, "rb") as f:
+            data = f.read()[mf.HEADER.size :]
+        unpack_time = best_time(lambda: mf.unpack_walls(data, maze.size))
+        load_time = best_time(lambda: mf.load(path))
+        map_time = best_time(lambda: mf.MappedMaze(path).close())
+
+        header, loaded = mf.load(path)
+        assert loaded.walls == maze.walls and header.seed == SEED
+
+        megabytes = os.path.getsize(path) / 1e6
+        print(
+            f"{size:>5}x{size:<5} {megabytes:>10.2f} {megabytes / save_time:>12.0f} "
+            f"{megabytes / unpack_time:>14.0f} {megabytes / load_time:>12.0f} {map_time * 1e3:>9.3f}"
+        )
+
+
+def huge_maze(directory: str) -> None:
+    path = os.path.join(directory, "huge.maze")
+    rng = np.random.default_rng(SEED)
+
+    # Written in place through the mapping, the maze never being in memory as a whole
+    start = time.perf_counter()
+    with mf.MappedMaze.create(path, HUGE_SIZE, HUGE_SIZE, "binary_tree", SEED) as maze:
+        rows = mf.CHUNK_CELLS // HUGE_SIZE
+        for first_row in range(0, HUGE_SIZE, rows):
+            rows = min(rows, HUGE_SIZE - first_row)
+            chunk = mf.pack_walls(binary_tree_walls(HUGE_SIZE, HUGE_SIZE, first_row, rows, rng))
+            offset = first_row * HUGE_SIZE // mf.CELLS_PER_BYTE
+            maze.walls.buffer[offset : offset + len(chunk)] = chunk
+    write_time = time.perf_counter() - start
+
+    print(
+        f"\n{HUGE_SIZE}x{HUGE_SIZE} maze ({HUGE_SIZE * HUGE_SIZE} cells): "
+        f"{os.path.getsize(path) / 1e6:.0f} MB written in {write_time:.2f}s"
+    )
+
+    start = time.perf_counter()
+    with mf.MappedMaze(path) as maze:
+        map_time = time.perf_counter() - start
+
+        # A search between two cells in the middle, only touching the pages around them
+        maze.start = maze.get_index(HUGE_SIZE // 2, HUGE_SIZE // 2)
+        maze.end = maze.get_index(HUGE_SIZE // 2 + 100, HUGE_SIZE // 2 + 100)
+        start = time.perf_counter()
+        path_cells = mt.MazeSolver.breadth_first_search(maze)
+        solve_time = time.perf_counter() - start
+
+        # Again while counting the cells and tracing the allocations, which slows it down
+        stats = run_stats.measure(mt.MazeSolver.breadth_first_search, maze, trace_memory=True)
+        expanded = stats.cells_expanded
+        peak_memory = stats.memory_peak
+
+    print(f"mapped in {map_time * 1e3:.3f} ms")
+    print(
+        f"breadth-first search: {solve_time * 1e3:.0f} ms, {expanded} cells expanded, "
+        f"path of {len(path_cells)} cells"
+    )
+    print(
+        f"peak memory allocated: {peak_memory / 1e6:.1f} MB "
+        f"(a Maze of this size allocates {14 * HUGE_SIZE * HUGE_SIZE / 1e9:.1f} GB)"
+    )
+
+
+def main():
+    mt.Window.SOLVE_ANIMATION = False
+    print("Load times include allocating the Maze, unpack times only decode the walls\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        round_trip(directory)
+        huge_maze(directory)
+
+
+if __name__ == "__main__":
+    main()
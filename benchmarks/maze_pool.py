@@ -0,0 +1,55 @@
+"""Generation of many small mazes in a loop, each one allocated anew or checked out of a
+MazePool, and the part of the time spent on getting the mazes. Run it from the project
+directory with:
+
+    python -m benchmarks.maze_pool
+"""
+
+import random
+import time
+
+import maze.maze as m
+import maze.maze_tools as mt
+
+COUNT = 10000
+SIZE = 50
+GENERATOR = "sidewinder"
+
+
+def new_mazes(generator) -> float:
+    start = time.perf_counter()
+    for seed in range(COUNT):
+        random.seed(seed)
+        maze = m.Maze(SIZE, SIZE)
+        if generator is not None:
+            generator(maze)
+    return time.perf_counter() - start
+
+
+def pooled_mazes(generator) -> float:
+    pool = m.MazePool()
+    start = time.perf_counter()
+    for seed in range(COUNT):
+        random.seed(seed)
+        with pool.maze(SIZE, SIZE) as maze:
+            if generator is not None:
+                generator(maze)
+    return time.perf_counter() - start
+
+
+def main():
+    mt.Window.GENERATE_ANIMATION = False
+    generator = mt.get_algorithm(mt.MazeGenerator, GENERATOR)
+
+    print(f"{COUNT} mazes of {SIZE}x{SIZE} generated with {GENERATOR}\n")
+    print(f"{'':>8} {'mazes only (ms)':>16} {'with generation (s)':>20} {'mazes part':>11}")
+    for name, loop in (("new", new_mazes), ("pooled", pooled_mazes)):
+        mazes_only = loop(None)
+        total = loop(generator)
+        print(
+            f"{name:>8} {mazes_only * 1e3:>16.1f} {total:>20.2f} {mazes_only / total:>11.2%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Time spent drawing each frame of an animated generation (needs pygame, runs offscreen), run
+it from the project directory with:
+
+    python -m benchmarks.rendering
+
+Sidewinder only colors the current cell on each step, so the time per frame is mostly the
+drawer's. It should not grow with the maze, and stay well below 1000 / Window.FPS ms.
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import maze.maze as m
+import maze.maze_tools as mt
+
+SIZES = [50, 100, 200]
+
+
+def time_animated_run(size: int) -> tuple[int, float]:
+    """Runs an animated sidewinder over a size x size maze, as fast as the window allows
+
+    Args:
+        size (int): Width and height of the maze
+
+    Returns:
+        tuple[int, float]: Number of frames drawn and time spent in seconds
+    """
+    random.seed(0)
+    maze = m.Maze(size, size)
+    mt.MazeDrawer(mt.MazeGenerator(0), mt.MazeSolver(0), maze)
+    mt.MazeDrawer.draw_maze(maze)
+
+    frames = 0
+    refresh = mt.MazeDrawer.refresh_drawing_on_screen
+
+    def counting_refresh(maze: m.Maze) -> None:
+        nonlocal frames
+        frames += 1
+        refresh(maze)
+
+    mt.MazeDrawer.refresh_drawing_on_screen = counting_refresh
+    try:
+        start = time.perf_counter()
+        mt.MazeGenerator.sidewinder(maze)
+        elapsed = time.perf_counter() - start
+    finally:
+        mt.MazeDrawer.refresh_drawing_on_screen = refresh
+
+    return frames, elapsed
+
+
+def main():
+    mt.Window.GENERATE_ANIMATION = True
+    target_fps = mt.Window.FPS
+    mt.Window.FPS = 0  # No frame limit
+
+    print(f"{'size':>9} {'frames':>7} {'ms/frame':>9} {'max fps':>8}  (target {target_fps} fps)")
+    for size in SIZES:
+        frames, elapsed = time_animated_run(size)
+        per_frame = elapsed / frames
+        print(f"{size:>4}x{size:<4} {frames:>7} {per_frame * 1e3:>9.3f} {1 / per_frame:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""Benchmark of every generator and solver of MazeGenerator.ALGORITHMS and MazeSolver.ALGORITHMS,
+headless, over a ladder of maze sizes with fixed seeds. Wall time, peak memory and number of
+steps of each run are written to a JSON file, and can be compared with a baseline written by an
+earlier run. Run it from the project directory with:
+
+    python -m benchmarks.suite [--sizes SIZE ...] [--seed SEED] [--budget SECONDS] [--output FILE]
+                               [--baseline FILE] [--threshold FRACTION]
+
+The exit status is 1 when a run got slower (or used more memory) than the baseline by more than
+the threshold.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import maze.maze as m
+import maze.maze_tools as mt
+
+SIZES = [10, 50, 100, 500, 1000, 2000]
+SEED = 0
+BUDGET = 30.0  # Seconds a single run may be predicted to take before bigger sizes are skipped
+REPEAT = 3  # Runs shorter than a second are repeated, the best time being kept
+THRESHOLD = 0.10  # Slowdown (or memory growth) from the baseline reported as a regression
+MIN_SECONDS = 0.005  # Shorter runs are too noisy to be compared
+MIN_PEAK_MEMORY = 100_000  # Smaller peaks (in bytes) are not worth comparing
+SOLVER_MAZE = "depth_first_search"  # Generator of the mazes solved, its long corridors being the hardest
+
+
+def measure(algorithm, make_maze, seed: int) -> dict:
+    """Runs an algorithm on new mazes: timed runs, a run tracing the memory allocations and one
+    counting the steps, the random module being seeded the same way before each of them
+
+    Args:
+        algorithm (function): A generator or a solver
+        make_maze (function): Builds the maze to run the algorithm on
+        seed (int): Seed of the random module
+
+    Returns:
+        dict: Wall time in seconds, peak memory in bytes and number of steps
+    """
+    best = float("inf")
+    for _ in range(REPEAT):
+        maze = make_maze()
+        random.seed(seed)
+        start = time.perf_counter()
+        result = algorithm(maze)
+        best = min(best, time.perf_counter() - start)
+        if best >= 1:
+            break
+
+    maze = make_maze()
+    random.seed(seed)
+    tracemalloc.start()
+    algorithm(maze)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    maze = make_maze()
+    random.seed(seed)
+    steps = sum(1 for _ in algorithm.steps(maze, emit=True))
+
+    measures = {"seconds": best, "peak_memory": peak_memory, "steps": steps}
+    if isinstance(result, list):
+        measures["path_length"] = len(result)
+    return measures
+
+
+def run_suite(
+    sizes: list[int], seed: int, budget: float, names: list[str] = None, log=print
+) -> dict:
+    """Benchmarks every generator, then every solver on mazes of SOLVER_MAZE
+
+    Args:
+        sizes (list[int]): Widths (and heights) of the mazes, smallest first
+        seed (int): Seed of the random module
+        budget (float): Seconds a run may be predicted to take, from the previous size, before
+        the bigger sizes are skipped for its algorithm
+        names (list[str], optional): Names of the only algorithms to run, all of them if None.
+        Defaults to None.
+        log (function, optional): Called with a line for each run. Defaults to print.
+
+    Returns:
+        dict: The results, by "generator:NAME:SIZE" or "solver:NAME:SIZE" key
+    """
+    mt.Window.GENERATE_ANIMATION = False
+    mt.Window.SOLVE_ANIMATION = False
+
+    generators = mt.get_algorithms(mt.MazeGenerator)
+    solvers = mt.get_algorithms(mt.MazeSolver)
+    solver_mazes = {}
+
+    def solver_maze(size: int):
+        # Generated once per size, then copied for every run
+        if size not in solver_mazes:
+            random.seed(seed)
+            maze = m.Maze(size, size)
+            generators[SOLVER_MAZE](maze)
+            solver_mazes[size] = bytes(maze.walls)
+
+        def make_maze() -> m.Maze:
+            maze = m.Maze(size, size)
+            maze.walls[:] = solver_mazes[size]
+            maze.is_generated = True
+            return maze
+
+        return make_maze
+
+    results = {}
+    for kind, algorithms in (("generator", generators), ("solver", solvers)):
+        for name, algorithm in algorithms.items():
+            if names is not None and name not in names:
+                continue
+
+            previous = None
+            for size in sizes:
+                key = f"{kind}:{name}:{size}"
+                if previous is not None:
+                    predicted = previous[1] * (size / previous[0]) ** 2
+                    if predicted > budget:
+                        log(f"{key:<50} skipped (~{predicted:.0f}s predicted)")
+                        continue
+
+                if kind == "generator":
+                    make_maze = lambda size=size: m.Maze(size, size)
+                else:
+                    make_maze = solver_maze(size)
+
+                result = {"kind": kind, "algorithm": name, "size": size, "cells": size * size}
+                result.update(measure(algorithm, make_maze, seed))
+                results[key] = result
+                previous = (size, result["seconds"])
+                log(
+                    f"{key:<50} {result['seconds'] * 1e3:>10.1f} ms "
+                    f"{result['peak_memory'] / 1e6:>8.2f} MB {result['steps']:>10} steps"
+                )
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> tuple[list[str], list[str]]:
+    """Compares results with a baseline
+
+    Args:
+        results (dict): Results of run_suite
+        baseline (dict): Results of an earlier run
+        threshold (float): Relative growth of the time or memory reported as a regression
+
+    Returns:
+        tuple[list[str], list[str]]: The regressions, and the runs whose steps changed (their
+        algorithm doesn't do the same work anymore)
+    """
+    regressions = []
+    changes = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        reference = baseline[key]
+
+        if min(result["seconds"], reference["seconds"]) >= MIN_SECONDS:
+            ratio = result["seconds"] / reference["seconds"]
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{key}: {reference['seconds'] * 1e3:.1f} ms -> "
+                    f"{result['seconds'] * 1e3:.1f} ms (x{ratio:.2f})"
+                )
+
+        if min(result["peak_memory"], reference["peak_memory"]) >= MIN_PEAK_MEMORY:
+            ratio = result["peak_memory"] / reference["peak_memory"]
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{key}: {reference['peak_memory'] / 1e6:.2f} MB -> "
+                    f"{result['peak_memory'] / 1e6:.2f} MB (x{ratio:.2f})"
+                )
+
+        if result["steps"] != reference["steps"]:
+            changes.append(f"{key}: {reference['steps']} -> {result['steps']} steps")
+
+    return regressions, changes
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Benchmarks every generator and solver over several maze sizes",
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=SIZES, help="widths (and heights) of the mazes"
+    )
+    parser.add_argument("--seed", type=int, default=SEED, help="seed of every run")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=BUDGET,
+        help="seconds a run may be predicted to take before bigger sizes are skipped",
+    )
+    parser.add_argument(
+        "--algorithms", nargs="+", default=None, help="only run these algorithms (all by default)"
+    )
+    parser.add_argument(
+        "--output", "-o", default="benchmark_results.json", help="where to write the results"
+    )
+    parser.add_argument("--baseline", default=None, help="results of an earlier run to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="relative slowdown (or memory growth) reported as a regression, e.g. 0.1 for 10%%",
+    )
+    args = parser.parse_args(argv)
+
+    if args.algorithms is not None:
+        known = {**mt.get_algorithms(mt.MazeGenerator), **mt.get_algorithms(mt.MazeSolver)}
+        unknown = [name for name in args.algorithms if name not in known]
+        if len(unknown) > 0:
+            parser.error(
+                f"unknown algorithms: {', '.join(unknown)} (expected some of: {', '.join(known)})"
+            )
+
+    # Read first, so a bad baseline doesn't waste a whole run
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("seed") != args.seed:
+            parser.error(f"the baseline was run with seed {baseline.get('seed')}, not {args.seed}")
+
+    results = run_suite(sorted(args.sizes), args.seed, args.budget, args.algorithms)
+    with open(args.output, "w") as f:
+        json.dump(
+            {
+                "seed": args.seed,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nResults written to {args.output}")
+
+    if baseline is None:
+        return 0
+
+    regressions, changes = compare(results, baseline["results"], args.threshold)
+    for change in changes:
+        print(f"Steps changed: {change}")
+    for regression in regressions:
+        print(f"Regression: {regression}")
+    if len(regressions) == 0:
+        print(f"No regression above {args.threshold:.0%} against {args.baseline}")
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Tiled generation of a big maze with 1, 2 and 4 processes, the speedup over a single one, and
+the time of the parallel check that the result is perfect. Run it from the project directory
+with:
+
+    python -m benchmarks.tiled
+
+The speedup cannot go above the number of CPUs of the machine, which is printed first.
+"""
+
+import os
+import time
+
+import maze.tiled as tiled
+
+GENERATOR = "sidewinder"
+SIZE = 2000
+TILE_SIZE = 500
+WORKERS = [1, 2, 4]
+
+
+def main():
+    cells = SIZE * SIZE
+    print(f"{SIZE}x{SIZE} maze by {GENERATOR}, tiles of {TILE_SIZE}, {os.cpu_count()} CPUs\n")
+    print(f"{'workers':>8} {'generate (s)':>13} {'cells/s':>12} {'speedup':>8} {'verify (s)':>11}")
+
+    reference = None
+    first = None
+    for workers in WORKERS:
+        start = time.perf_counter()
+        walls = tiled.generate_walls(GENERATOR, SIZE, SIZE, TILE_SIZE, seed=0, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tiled.verify_perfect(walls, SIZE, SIZE, TILE_SIZE, workers=workers)
+        verify = time.perf_counter() - start
+
+        # The maze must not depend on the number of workers
+        if reference is None:
+            reference, first = walls, elapsed
+        elif walls != reference:
+            raise AssertionError(f"Different maze with {workers} workers")
+
+        print(
+            f"{workers:>8} {elapsed:>13.2f} {cells / elapsed:>12.0f} "
+            f"{first / elapsed:>7.2f}x {verify:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Size and speed of the traces of an Aldous-Broder generation (millions of steps, most of them
+being a single move of the random walk). Run it from the project directory with:
+
+    python -m benchmarks.trace [SIZE]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import maze.maze as m
+import maze.maze_tools as mt
+import maze.trace as trace
+
+SIZE = 500
+SEED = 0
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZE
+    path = os.path.join(tempfile.mkdtemp(), "aldous_broder.trace")
+
+    start = time.perf_counter()
+    with open(path, "wb") as f, trace.TraceWriter(f, m.Maze(size, size), SEED) as writer:
+        writer.record(mt.MazeGenerator.aldous_broder)
+    record_time = time.perf_counter() - start
+
+    file_size = os.path.getsize(path)
+    steps = writer.step_count
+    print(f"Aldous-Broder on {size}x{size}: {steps} steps")
+    print(f"{'trace size':>16} {file_size / 1e6:>8.1f} MB ({file_size / steps:.2f} bytes/step)")
+    print(f"{'recording':>16} {record_time:>8.2f} s")
+
+    start = time.perf_counter()
+    loaded = trace.Trace.load(path)
+    print(f"{'loading':>16} {(time.perf_counter() - start) * 1e3:>8.1f} ms")
+
+    replayer = trace.TraceReplayer(loaded)
+    start = time.perf_counter()
+    replayer.seek(steps // 2)
+    print(f"{'seek to middle':>16} {time.perf_counter() - start:>8.2f} s")
+
+    start = time.perf_counter()
+    replayer.seek(steps)
+    print(f"{'rest of it':>16} {time.perf_counter() - start:>8.2f} s")
+
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
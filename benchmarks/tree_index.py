@@ -0,0 +1,61 @@
+"""Tree index benchmark: one-time build, then many random path queries compared with solving
+each of them with a breadth-first search. Run it from the project directory with:
+
+    python -m benchmarks.tree_index
+"""
+
+import random
+import time
+
+import maze.maze as m
+import maze.maze_tools as mt
+from maze.tree_index import TreeIndex
+
+SIZES = [100, 300, 1000]
+QUERIES = 1000
+BFS_QUERIES = 20  # Enough to get the time of a single search
+
+
+def main():
+    mt.Window.GENERATE_ANIMATION = False
+    mt.Window.SOLVE_ANIMATION = False
+
+    print(
+        f"{'size':>11} {'build (s)':>10} {'distance (us)':>14} {'path (us)':>10} {'bfs (us)':>12}"
+    )
+    for size in SIZES:
+        random.seed(0)
+        maze = m.Maze(size, size)
+        mt.MazeGenerator.randomized_kruskal(maze)
+        queries = [
+            (random.randrange(maze.size), random.randrange(maze.size))
+            for _ in range(QUERIES)
+        ]
+
+        start = time.perf_counter()
+        index = TreeIndex(maze)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for cell1, cell2 in queries:
+            index.distance(cell1, cell2)
+        distance_time = (time.perf_counter() - start) / QUERIES
+
+        start = time.perf_counter()
+        for cell1, cell2 in queries:
+            index.path(cell1, cell2)
+        path_time = (time.perf_counter() - start) / QUERIES
+
+        start = time.perf_counter()
+        for cell1, cell2 in queries[:BFS_QUERIES]:
+            maze.start, maze.end = cell1, cell2
+            mt.MazeSolver.breadth_first_search(maze)
+        bfs_time = (time.perf_counter() - start) / BFS_QUERIES
+
+        print(
+            f"{size:>5}x{size:<5} {build_time:>10.3f} {distance_time * 1e6:>14.1f} {path_time * 1e6:>10.1f} {bfs_time * 1e6:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
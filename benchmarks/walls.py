@@ -0,0 +1,42 @@
+"""Wall enumeration benchmark, run it from the project directory with:
+
+    python -m benchmarks.walls
+"""
+
+import time
+
+import maze.maze as m
+
+SIZES = [10, 50, 100, 250, 500, 1000]
+
+
+def time_edge_index(size: int, repeat: int = 3) -> float:
+    """Times the construction of the wall index of a size x size maze
+
+    Args:
+        size (int): Width and height of the maze
+        repeat (int, optional): Number of runs, the best one is kept. Defaults to 3.
+
+    Returns:
+        float: Best time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        m.EdgeIndex(size, size)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'size':>11} {'walls':>10} {'time (ms)':>10} {'ns/wall':>8}")
+    for size in SIZES:
+        elapsed = time_edge_index(size)
+        walls = 2 * size * (size - 1)
+        print(
+            f"{size:>5}x{size:<5} {walls:>10} {elapsed * 1e3:>10.3f} {elapsed * 1e9 / walls:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
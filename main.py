@@ -20,9 +20,6 @@ def main():
 
     # Intializing variables
 
-    _ = mt.MazeGenerator(0)  # Needed to init the MazeBuilder.ALGORITHMS list
-    _ = mt.MazeSolver(0)  # Needed to init the MazeSolver.ALGORITHMS list
-
     alg_gen, alg_sol, width, height = -1, -1, -1, -1
     build_anim, solve_anim = "", ""
 
@@ -30,7 +27,7 @@ def main():
 
     for i in range(len(mt.MazeGenerator.ALGORITHMS)):
         print(
-            f"{vc.CMDColors.YELLOW} {i}: {list(mt.MazeGenerator.ALGORITHMS.keys())[i]} {vc.CMDColors.RESET}"
+            f"{vc.CMDColors.YELLOW} {i}: {mt.get_title(list(mt.MazeGenerator.ALGORITHMS)[i])} {vc.CMDColors.RESET}"
         )
 
     print()
@@ -42,7 +39,7 @@ def main():
 
     for i in range(len(mt.MazeSolver.ALGORITHMS)):
         print(
-            f"{vc.CMDColors.YELLOW} {i}: {list(mt.MazeSolver.ALGORITHMS.keys())[i]} {vc.CMDColors.RESET}"
+            f"{vc.CMDColors.YELLOW} {i}: {mt.get_title(list(mt.MazeSolver.ALGORITHMS)[i])} {vc.CMDColors.RESET}"
         )
 
     print()
@@ -0,0 +1,185 @@
+"""Headless generation of many mazes over a pool of processes. Usable from the command line with:
+
+    python -m maze.batch ALGORITHM WIDTH HEIGHT --count COUNT [--seed-start SEED] [--workers WORKERS] --output FILE
+
+Every maze is written as a record made of a RECORD_HEADER (seed, width, height) followed by
+its walls, one OPEN_EAST | OPEN_SOUTH byte per cell.
+"""
+
+import argparse
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Iterator
+
+import maze.maze as m
+import maze.maze_tools as mt
+
+RECORD_HEADER = struct.Struct("<qII")
+
+# Set in each worker process by _init_worker
+_generator = None
+_size = None
+_pool = None  # The mazes of a worker are reused from one seed to the next
+
+
+class BatchReport:
+    def __init__(self, count: int, cells: int, elapsed: float):
+        """Throughput of a batch generation
+
+        Args:
+            count (int): Number of mazes generated
+            cells (int): Total number of cells generated
+            elapsed (float): Wall time in seconds
+        """
+        self.count = count
+        self.cells = cells
+        self.elapsed = elapsed
+
+    def __str__(self):
+        return (
+            f"Generated {self.count} mazes in {self.elapsed:.2f}s "
+            f"({self.mazes_per_second:.1f} mazes/s, {self.cells_per_second:.0f} cells/s)"
+        )
+
+    @property
+    def mazes_per_second(self) -> float:
+        return self.count / self.elapsed if self.elapsed > 0 else float("inf")
+
+    @property
+    def cells_per_second(self) -> float:
+        return self.cells / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def get_algorithm_names() -> list[str]:
+    """Gets the names of the generation algorithms, as accepted by generate_batch
+
+    Returns:
+        list[str]: Names of the algorithms (e.g. "depth_first_search")
+    """
+    return list(mt.MazeGenerator.ALGORITHMS)
+
+
+def get_generator(algorithm: str) -> mt.MazeGenerator:
+    """Gets the generator of an algorithm from its name
+
+    Args:
+        algorithm (str): Name of the algorithm (e.g. "depth_first_search")
+
+    Raises:
+        ValueError: If there is no algorithm with this name
+
+    Returns:
+        MazeGenerator: The generator
+    """
+    return mt.MazeGenerator(algorithm)
+
+
+def _init_worker(algorithm: str, width: int, height: int) -> None:
+    global _generator, _size, _pool
+
+    mt.Window.GENERATE_ANIMATION = False
+    _generator = get_generator(algorithm)
+    _size = (width, height)
+    _pool = m.MazePool(max_per_size=1)
+
+
+def _generate(seed: int) -> bytes:
+    with _pool.maze(*_size) as maze:
+        _generator.generate(maze, seed=seed)
+        return RECORD_HEADER.pack(seed, maze.width, maze.height) + maze.walls
+
+
+def generate_batch(
+    algorithm: str,
+    width: int,
+    height: int,
+    seeds: range,
+    stream: BinaryIO,
+    workers: int = None,
+) -> BatchReport:
+    """Generates one maze per seed across a pool of processes, writing them to the stream as
+    soon as they are done (in the seeds order)
+
+    Args:
+        algorithm (str): Name of the algorithm (e.g. "depth_first_search")
+        width (int): Width of the mazes
+        height (int): Height of the mazes
+        seeds (range): Seeds of the mazes, one maze being generated per seed
+        stream (BinaryIO): Where to write the records
+        workers (int, optional): Number of processes, one per CPU if None. Defaults to None.
+
+    Returns:
+        BatchReport: Throughput of the generation
+    """
+    get_generator(algorithm)  # Fails early on unknown names
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(algorithm, width, height),
+    ) as executor:
+        # Big enough chunks so small mazes don't spend their time in inter-process messages
+        chunksize = max(1, len(seeds) // (4 * workers))
+        for record in executor.map(_generate, seeds, chunksize=chunksize):
+            stream.write(record)
+
+    return BatchReport(len(seeds), len(seeds) * width * height, time.perf_counter() - start)
+
+
+def read_batch(stream: BinaryIO) -> Iterator[tuple[int, m.Maze]]:
+    """Reads back the mazes written by generate_batch
+
+    Args:
+        stream (BinaryIO): Where to read the records
+
+    Yields:
+        tuple[int, Maze]: The seed and the maze of each record
+    """
+    while header := stream.read(RECORD_HEADER.size):
+        seed, width, height = RECORD_HEADER.unpack(header)
+        maze = m.Maze(width, height)
+        maze.walls[:] = stream.read(width * height)
+        maze.walls_version += 1
+        maze.is_generated = True
+        yield seed, maze
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m maze.batch",
+        description="Generates many mazes without any window, across a pool of processes",
+    )
+    parser.add_argument("algorithm", choices=get_algorithm_names())
+    parser.add_argument("width", type=int, help="width of the mazes")
+    parser.add_argument("height", type=int, help="height of the mazes")
+    parser.add_argument("--count", "-n", type=int, required=True, help="number of mazes")
+    parser.add_argument(
+        "--seed-start", type=int, default=0, help="seed of the first maze, the next ones follow"
+    )
+    parser.add_argument(
+        "--workers", "-j", type=int, default=None, help="number of processes (one per CPU by default)"
+    )
+    parser.add_argument("--output", "-o", required=True, help="output file")
+    args = parser.parse_args(argv)
+
+    if args.width < 1 or args.height < 1:
+        parser.error("the mazes must be at least 1x1")
+
+    with open(args.output, "wb") as f:
+        report = generate_batch(
+            args.algorithm,
+            args.width,
+            args.height,
+            range(args.seed_start, args.seed_start + args.count),
+            f,
+            args.workers,
+        )
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
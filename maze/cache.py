@@ -0,0 +1,233 @@
+"""On-disk cache of generated mazes, so the same maze is only generated once. A maze is stored as
+a packed maze file (see maze.maze_file) named after the hash of everything it depends on: the
+generator, the size, the seed and the code of the generation itself, any change to which makes
+the old files unreachable until they get evicted.
+
+Several processes can share a cache: the files are written under a temporary name and renamed
+once complete, so a reader sees a whole maze or none. The least recently used files are evicted
+once the cache gets bigger than its maximum size.
+"""
+
+import functools
+import hashlib
+import os
+import tempfile
+import time
+
+import maze.maze as m
+import maze.maze_file as mf
+import maze.maze_tools as mt
+
+MAX_BYTES = 256 * 1024 * 1024
+EXTENSION = ".maze"
+STALE_SECONDS = 3600  # Temporary files older than this were left by a writer that died
+
+# The modules the walls of a generated maze depend on
+CODE_FILES = ["maze.py", "maze_tools.py", "streaming.py", "disjoint_set.py"]
+
+
+def get_default_directory() -> str:
+    """Gets the directory of the cache when none is given: MAZE_CACHE_DIR if set, maze/ under
+    the user cache directory otherwise
+
+    Returns:
+        str: Path of the directory
+    """
+    if "MAZE_CACHE_DIR" in os.environ:
+        return os.environ["MAZE_CACHE_DIR"]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return os.path.join(os.path.expanduser(cache_home), "maze")
+
+
+@functools.cache
+def get_code_version() -> str:
+    """Gets a hash of the code of the generation, read once per process
+
+    Returns:
+        str: The hash, in hexadecimal
+    """
+    digest = hashlib.sha256()
+    package = os.path.dirname(os.path.abspath(__file__))
+    for name in CODE_FILES:
+        with open(os.path.join(package, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def get_key(algorithm: str, width: int, height: int, seed: int) -> str:
+    """Gets the key of a maze in the cache
+
+    Args:
+        algorithm (str): Name of the generator (e.g. "depth_first_search")
+        width (int): Width of the maze
+        height (int): Height of the maze
+        seed (int): Seed of the generation
+
+    Returns:
+        str: The key, in hexadecimal
+    """
+    key = f"{algorithm}:{width}x{height}:{seed}:{get_code_version()}:{mf.VERSION}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class MazeCache:
+    def __init__(self, directory: str = None, max_bytes: int = MAX_BYTES):
+        """Cache of generated mazes in a directory, made on first use
+
+        Args:
+            directory (str, optional): Where the mazes are stored, get_default_directory() if
+            None. Defaults to None.
+            max_bytes (int, optional): Size of the cache above which the least recently used
+            mazes are evicted. Defaults to MAX_BYTES.
+        """
+        self.directory = directory or get_default_directory()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def get_path(self, algorithm: str, width: int, height: int, seed: int) -> str:
+        """Gets the path where a maze is stored, whether it is in the cache or not (see get_key)"""
+        return os.path.join(self.directory, get_key(algorithm, width, height, seed) + EXTENSION)
+
+    def get(self, algorithm: str, width: int, height: int, seed: int) -> m.Maze:
+        """Loads a maze from the cache
+
+        Args:
+            algorithm (str): Name of the generator (e.g. "depth_first_search")
+            width (int): Width of the maze
+            height (int): Height of the maze
+            seed (int): Seed of the generation
+
+        Returns:
+            Maze: The maze, None if it is not in the cache
+        """
+        path = self.get_path(algorithm, width, height, seed)
+        try:
+            header, maze = mf.load(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except ValueError:
+            # Truncated or foreign file, replaced by the next put
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        if (header.algorithm, header.width, header.height, header.seed) != (
+            algorithm,
+            width,
+            height,
+            seed,
+        ):
+            self.misses += 1
+            return None
+
+        # Marked as used for the eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:  # Evicted by another process meanwhile, the maze is loaded
+            pass
+        self.hits += 1
+        return maze
+
+    def put(self, maze: m.Maze, algorithm: str, seed: int) -> None:
+        """Stores a maze in the cache, then evicts the least recently used ones if needed
+
+        Args:
+            maze (Maze): The generated maze
+            algorithm (str): Name of its generator (e.g. "depth_first_search")
+            seed (int): Seed of its generation
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.get_path(algorithm, maze.width, maze.height, seed)
+
+        # Written aside then renamed, which replaces the file at once even if another process
+        # is putting the same maze
+        fd, temporary_path = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                mf.write(f, maze, algorithm, seed)
+            os.replace(temporary_path, path)
+        except BaseException:
+            self._remove(temporary_path)
+            raise
+
+        self.evict()
+
+    def generate(self, algorithm: str, width: int, height: int, seed: int) -> m.Maze:
+        """Loads a maze from the cache, generating and storing it first if it is not there
+
+        Args:
+            algorithm (str): Name of the generator (e.g. "depth_first_search")
+            width (int): Width of the maze
+            height (int): Height of the maze
+            seed (int): Seed of the generation
+
+        Raises:
+            ValueError: If there is no generator with this name, or the seed is None
+
+        Returns:
+            Maze: The maze
+        """
+        if seed is None:
+            # A random maze would be stored under the key of "None" and loaded for every later call
+            raise ValueError("A seed is needed to cache a maze")
+        maze = self.get(algorithm, width, height, seed)
+        if maze is None:
+            maze = m.Maze(width, height)
+            mt.MazeGenerator(algorithm).generate(maze, seed=seed)
+            self.put(maze, algorithm, seed)
+        return maze
+
+    def get_entries(self) -> list[tuple[float, int, str]]:
+        """Gets the mazes in the cache, the least recently used first
+
+        Returns:
+            list[tuple[float, int, str]]: Last use time, size in bytes and path of each maze
+        """
+        entries = []
+        try:
+            files = os.scandir(self.directory)
+        except FileNotFoundError:
+            return entries
+
+        now = time.time()
+        with files:
+            for file in files:
+                try:
+                    stat = file.stat()
+                except FileNotFoundError:  # Evicted by another process meanwhile
+                    continue
+                if file.name.endswith(EXTENSION):
+                    entries.append((stat.st_mtime, stat.st_size, file.path))
+                elif file.name.endswith(".tmp") and now - stat.st_mtime > STALE_SECONDS:
+                    self._remove(file.path)
+        entries.sort()
+        return entries
+
+    def size(self) -> int:
+        """Gets the size of the mazes in the cache, in bytes"""
+        return sum(size for _, size, _ in self.get_entries())
+
+    def evict(self) -> None:
+        """Removes the least recently used mazes until the cache fits in max_bytes"""
+        entries = self.get_entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Removes every maze from the cache"""
+        for _, _, path in self.get_entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        # Another process may have removed it first
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
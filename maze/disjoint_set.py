@@ -0,0 +1,70 @@
+from array import array
+
+
+class DisjointSet:
+    def __init__(self, size: int):
+        """Union-find over the integers 0 to size - 1, each one starting alone in its set
+
+        Args:
+            size (int): Number of elements
+        """
+        self.parent = array("q", range(size))
+        self.rank = bytearray(size)
+
+    def find(self, element: int) -> int:
+        """Finds the representative of the set of an element, compressing the path on the way
+
+        Args:
+            element (int): The element to look for
+
+        Returns:
+            int: The representative of its set
+        """
+        parent = self.parent
+
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+
+        return root
+
+    def union(self, element1: int, element2: int) -> bool:
+        """Joins the sets of two elements, the shallower tree going under the deeper one
+
+        Args:
+            element1 (int): The first element
+            element2 (int): The second element
+
+        Returns:
+            bool: True if both sets were distinct and got joined, False otherwise
+        """
+        root1 = self.find(element1)
+        root2 = self.find(element2)
+
+        if root1 == root2:
+            return False
+
+        rank = self.rank
+        if rank[root1] < rank[root2]:
+            root1, root2 = root2, root1
+
+        self.parent[root2] = root1
+        if rank[root1] == rank[root2]:
+            rank[root1] += 1
+
+        return True
+
+    def belong_to_distinct_sets(self, element1: int, element2: int) -> bool:
+        """Checks if two elements are in distinct sets
+
+        Args:
+            element1 (int): The first element
+            element2 (int): The second element
+
+        Returns:
+            bool: True if they are in distinct sets, False otherwise
+        """
+        return self.find(element1) != self.find(element2)
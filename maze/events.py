@@ -0,0 +1,62 @@
+"""Step events of the generation and solving algorithms.
+
+The algorithms are written as Python generators: each `yield` is one step, made of a tuple of
+events. An event is a tuple starting with one of the opcodes below, followed by its cell
+indexes. Algorithms only yield when asked to emit, so runs nobody watches build no event at all.
+"""
+
+from collections.abc import Generator
+
+CELL_VISITED = 0  # (CELL_VISITED, cell): the cell joined the maze (generators only)
+WALL_OPENED = 1  # (WALL_OPENED, cell1, cell2): the wall between both cells was opened
+FRONTIER_PUSH = 2  # (FRONTIER_PUSH, cell): the cell entered the frontier (stack, queue, heap)
+FRONTIER_POP = 3  # (FRONTIER_POP, cell): the cell left the frontier, it is done with
+PATH_FOUND = 4  # (PATH_FOUND, cells): indexes of the cells of the path, from start to end
+CURRENT_CELL = 5  # (CURRENT_CELL, cell): where the algorithm stands, until the next step
+CELL_FILLED = 6  # (CELL_FILLED, cell): the cell was filled as a dead end (dead_end_filling)
+
+NAMES = {
+    CELL_VISITED: "cell visited",
+    WALL_OPENED: "wall opened",
+    FRONTIER_PUSH: "frontier push",
+    FRONTIER_POP: "frontier pop",
+    PATH_FOUND: "path found",
+    CURRENT_CELL: "current cell",
+    CELL_FILLED: "cell filled",
+}
+
+
+def run(steps: Generator) -> object:
+    """Runs the steps of an algorithm to the end, ignoring their events
+
+    Args:
+        steps (Generator): The steps of the algorithm
+
+    Returns:
+        object: What the algorithm returned (the path for the solvers)
+    """
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def observe(steps: Generator, on_step) -> Generator:
+    """Passes each step of an algorithm to a function on its way, what the algorithm returns
+    being returned as well
+
+    Args:
+        steps (Generator): The steps of the algorithm
+        on_step (function): Called with the events of each step
+
+    Returns:
+        Generator: The same steps
+    """
+    while True:
+        try:
+            step = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        on_step(step)
+        yield step
@@ -0,0 +1,334 @@
+"""Offscreen export of the animation of a generation (and of its solving) to a sequence of PNG
+images or to an animated GIF, without any display. Usable from the command line with:
+
+    python -m maze.export GENERATOR WIDTH HEIGHT --output DIR|FILE.gif [--solver SOLVER] [--seed SEED] [--every STEPS | --frames FRAMES] [--fps FPS]
+
+Frames are encoded in a pool of processes while the next ones are drawn, and GIF frames are
+written to the file in order as soon as they are encoded, so only the frames waiting for the pool
+are kept in memory. GIFs need Pillow.
+"""
+
+import argparse
+import os
+import random
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import maze.maze as m
+import maze.maze_tools as mt
+import visual.colors as vc
+
+# Frames waiting to be encoded, per process, before the drawing waits for them
+PENDING_FRAMES_PER_WORKER = 4
+
+
+def _save_png(path: str, data: bytes, size: tuple[int, int]) -> None:
+    import pygame
+
+    pygame.image.save(pygame.image.fromstring(data, size, "RGB"), path)
+
+
+def _encode_gif_frame(data: bytes, previous: bytes, size: tuple[int, int], duration: int) -> bytes:
+    from PIL import GifImagePlugin, Image, ImageChops
+
+    # The drawing only uses the colors of the palette, no dithering is needed
+    colors = [
+        vc.Color.WHITE,
+        vc.Color.BLACK,
+        vc.Color.RED,
+        vc.Color.BLUE,
+        vc.Color.GREEN,
+        vc.Color.YELLOW,
+    ]
+    palette = Image.new("P", (1, 1))
+    palette.putpalette([channel for color in colors for channel in color])
+    image = Image.frombytes("RGB", size, data)
+    frame = image.quantize(palette=palette, dither=0)
+
+    if previous is None:
+        # The first frame starts the file, with the header making the animation loop
+        chunks, _ = GifImagePlugin.getheader(frame, info={"loop": 0})
+        box = (0, 0) + size
+    else:
+        # Only the part changed since the previous frame is stored, as Pillow's save_all does
+        chunks = []
+        box = ImageChops.difference(Image.frombytes("RGB", size, previous), image).getbbox()
+        box = box or (0, 0, 1, 1)  # An unchanged frame still lasts its duration
+    chunks += GifImagePlugin.getdata(frame.crop(box), offset=box[:2], duration=duration)
+    return b"".join(chunks)
+
+
+class FrameWriter:
+    def __init__(self, path: str, fps: int = 30, workers: int = None):
+        """Writes frames to a directory of PNG images, or to an animated GIF if the path ends
+        with .gif, encoding them in a pool of processes
+
+        Args:
+            path (str): Directory of the images, or path of the GIF
+            fps (int, optional): Frames per second of the GIF. Defaults to 30.
+            workers (int, optional): Number of processes, one per CPU if None. Defaults to None.
+
+        Raises:
+            ImportError: If a GIF is asked for without Pillow installed
+        """
+        self.path = path
+        self.fps = fps
+        self.is_gif = path.lower().endswith(".gif")
+        self.frame_count = 0
+
+        if self.is_gif:
+            try:
+                import PIL  # noqa: F401
+            except ImportError:
+                raise ImportError("Pillow is needed to export GIFs: pip install Pillow")
+            self._file = None  # Opened with the first frame
+            self._previous = None  # Data of the last frame added, the next one being compared to
+        else:
+            os.makedirs(path, exist_ok=True)
+
+        workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._pending = deque()
+        self._max_pending = PENDING_FRAMES_PER_WORKER * workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, surface) -> None:
+        """Queues a frame for encoding, only waiting if too many frames are already queued
+
+        Args:
+            surface (pygame.Surface): The frame
+        """
+        data = mt.pygame.image.tostring(surface, "RGB")
+        size = surface.get_size()
+
+        if self.is_gif:
+            duration = max(1, round(1000 / self.fps))
+            future = self._executor.submit(_encode_gif_frame, data, self._previous, size, duration)
+            self._previous = data
+        else:
+            path = os.path.join(self.path, f"frame_{self.frame_count:06d}.png")
+            future = self._executor.submit(_save_png, path, data, size)
+        self.frame_count += 1
+
+        self._pending.append(future)
+        while len(self._pending) > self._max_pending:
+            self._collect(self._pending.popleft())
+
+    def _collect(self, future: Future) -> None:
+        frame = future.result()
+        if self.is_gif:
+            if self._file is None:
+                self._file = open(self.path, "wb")
+            self._file.write(frame)
+
+    def close(self) -> None:
+        """Waits for every frame to be encoded, then ends the GIF"""
+        try:
+            while len(self._pending) > 0:
+                self._collect(self._pending.popleft())
+        finally:
+            self._executor.shutdown()
+            if self.is_gif and self._file is not None:
+                self._file.write(b";")  # GIF trailer
+                self._file.close()
+
+
+def _steps(algorithm, maze: m.Maze, rng: random.Random):
+    # Only the generators draw random numbers
+    if algorithm in mt.MazeGenerator.ALGORITHMS.values():
+        return algorithm.steps(maze, rng, emit=True)
+    return algorithm.steps(maze, emit=True)
+
+
+def count_steps(algorithms: list, width: int, height: int, seed: int) -> int:
+    """Runs the algorithms on a scratch maze, counting their steps
+
+    Args:
+        algorithms (list): The algorithms run one after the other (e.g. a generator then a solver)
+        width (int): Width of the maze
+        height (int): Height of the maze
+        seed (int): Seed of the generation
+
+    Returns:
+        int: Total number of steps
+    """
+    rng = random.Random(seed)
+    maze = m.Maze(width, height)
+    count = 0
+    for algorithm in algorithms:
+        for _ in _steps(algorithm, maze, rng):
+            count += 1
+        maze.reset_cells_state()
+    return count
+
+
+def get_frame_steps(total_steps: int, frames: int) -> list[int]:
+    """Spreads frames evenly over a run, the first one showing the untouched maze and the last one
+    the end result
+
+    Args:
+        total_steps (int): Number of steps of the run (see count_steps)
+        frames (int): Number of frames wanted
+
+    Returns:
+        list[int]: Number of steps done before each frame, some repeated if there are fewer steps
+        than frames
+    """
+    if frames == 1:
+        return [total_steps]
+    return [total_steps * i // (frames - 1) for i in range(frames)]
+
+
+def export(
+    path: str,
+    generator,
+    width: int,
+    height: int,
+    solver=None,
+    seed: int = None,
+    every: int = 1,
+    frames: int = None,
+    fps: int = 30,
+    workers: int = None,
+) -> int:
+    """Draws the animation of a generation (and of its solving) offscreen, one frame every few
+    steps, and writes it to PNG images or to a GIF
+
+    Args:
+        path (str): Directory of the images, or path of the GIF
+        generator (function): A generator (e.g. MazeGenerator.wilson)
+        width (int): Width of the maze
+        height (int): Height of the maze
+        solver (function, optional): A solver run once the maze is generated. Defaults to None.
+        seed (int, optional): Seed of the generation, a random one if None. Defaults to None.
+        every (int, optional): Steps between two frames, counted over all the algorithms.
+        Defaults to 1.
+        frames (int, optional): Number of frames wanted instead, exactly, the steps being counted
+        by a first run (see get_frame_steps). Defaults to None.
+        fps (int, optional): Frames per second of the GIF. Defaults to 30.
+        workers (int, optional): Number of encoding processes, one per CPU if None. Defaults to None.
+
+    Returns:
+        int: Number of frames written
+    """
+    algorithms = [generator] if solver is None else [generator, solver]
+    if seed is None:
+        seed = int.from_bytes(os.urandom(8), "little") >> 1
+    frame_steps = None
+    if frames is not None:
+        frame_steps = deque(get_frame_steps(count_steps(algorithms, width, height, seed), frames))
+
+    def count_frames(step_number: int) -> int:
+        # Frames showing the maze once this many steps are done
+        if frame_steps is None:
+            return 1 if step_number % every == 0 else 0
+        count = 0
+        while len(frame_steps) > 0 and frame_steps[0] == step_number:
+            frame_steps.popleft()
+            count += 1
+        return count
+
+    # Nothing is shown, the window only lives in memory whatever driver the caller set, which
+    # is put back once the display is opened
+    driver = os.environ.get("SDL_VIDEODRIVER")
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    try:
+        mt.Window()
+    finally:
+        if driver is None:
+            del os.environ["SDL_VIDEODRIVER"]
+        else:
+            os.environ["SDL_VIDEODRIVER"] = driver
+
+    rng = random.Random(seed)
+    maze = m.Maze(width, height)
+    mt.MazeDrawer.fit_to_window(maze)
+    area = mt.MazeDrawer.maze_area(maze)
+
+    with FrameWriter(path, fps, workers) as writer:
+
+        def add_frames(count: int) -> None:
+            if count > 0:
+                mt.MazeDrawer.render(maze)
+                for _ in range(count):
+                    writer.add(mt.Window.SCREEN.subsurface(area))
+
+        add_frames(count_frames(0))
+
+        # Counted over all the algorithms, like the steps of count_steps
+        step_number = 0
+        for algorithm in algorithms:
+            mt.MazeDrawer.clear_cell_colors()
+            for step in _steps(algorithm, maze, rng):
+                step_number += 1
+                count = count_frames(step_number)
+                mt.MazeDrawer.apply_events(maze, step, count > 0)
+                add_frames(count)
+
+            maze.is_generated = True
+            maze.reset_cells_state()
+
+        # The end result, whatever the number of steps (already shown if the frames were
+        # spread over the steps counted)
+        if frame_steps is None:
+            add_frames(1 if step_number % every != 0 else 0)
+        else:
+            add_frames(len(frame_steps))
+
+    return writer.frame_count
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m maze.export",
+        description="Exports the animation of a generation (and solving) without any display",
+    )
+    parser.add_argument("generator", help="e.g. depth_first_search")
+    parser.add_argument("width", type=int, help="width of the maze")
+    parser.add_argument("height", type=int, help="height of the maze")
+    parser.add_argument(
+        "--output", "-o", required=True, help="directory of PNG images, or a .gif file"
+    )
+    parser.add_argument("--solver", default=None, help="e.g. a_star")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the generation")
+    skipping = parser.add_mutually_exclusive_group()
+    skipping.add_argument("--every", type=int, default=1, help="steps between two frames")
+    skipping.add_argument("--frames", type=int, default=None, help="number of frames wanted")
+    parser.add_argument("--fps", type=int, default=30, help="frames per second of the GIF")
+    parser.add_argument(
+        "--workers", "-j", type=int, default=None, help="encoding processes (one per CPU by default)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.width < 1 or args.height < 1:
+        parser.error("the maze must be at least 1x1")
+    if args.every < 1 or (args.frames is not None and args.frames < 1):
+        parser.error("--every and --frames must be at least 1")
+    try:
+        generator = mt.get_algorithm(mt.MazeGenerator, args.generator)
+        solver = None if args.solver is None else mt.get_algorithm(mt.MazeSolver, args.solver)
+    except ValueError as e:
+        parser.error(str(e))
+
+    count = export(
+        args.output,
+        generator,
+        args.width,
+        args.height,
+        solver,
+        args.seed,
+        args.every,
+        args.frames,
+        args.fps,
+        args.workers,
+    )
+    print(f"Exported {count} frames to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
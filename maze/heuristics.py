@@ -0,0 +1,34 @@
+"""Heuristics for MazeSolver.a_star, estimating the distance between two cells from their grid
+coordinates, so they don't depend on the maze being drawn"""
+
+import maze.maze as m
+
+
+def manhattan(maze: m.Maze, cell1: int, cell2: int) -> int:
+    """Manhattan distance, never overestimating the path length in a maze
+
+    Args:
+        maze (Maze): The maze of both cells
+        cell1 (int): Index of the first cell
+        cell2 (int): Index of the second cell
+
+    Returns:
+        int: The estimated distance
+    """
+    row1, col1 = divmod(cell1, maze.width)
+    row2, col2 = divmod(cell2, maze.width)
+    return abs(row1 - row2) + abs(col1 - col2)
+
+
+def zero(maze: m.Maze, cell1: int, cell2: int) -> int:
+    """No estimation at all, which makes A* behave like Dijkstra
+
+    Args:
+        maze (Maze): The maze of both cells
+        cell1 (int): Index of the first cell
+        cell2 (int): Index of the second cell
+
+    Returns:
+        int: Always 0
+    """
+    return 0
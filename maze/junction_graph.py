@@ -0,0 +1,153 @@
+import heapq
+
+import maze.events as events
+import maze.maze as m
+
+
+class JunctionGraph:
+    def __init__(self, maze: m.Maze):
+        """Graph of the maze where every corridor (run of cells with exactly two openings) is
+        collapsed into a single weighted edge, so only junctions, dead ends, the start and the
+        goal are left as nodes. Built in O(N)
+
+        Args:
+            maze (Maze): A generated maze
+        """
+        self.maze = maze
+        self.walls_version = maze.walls_version
+        self.start = maze.start
+        self.end = maze.end
+
+        self.is_node = bytearray(maze.size)
+        for cell in range(maze.size):
+            if len(maze.get_open_neighbors(cell)) != 2:
+                self.is_node[cell] = 1
+        self.is_node[self.start] = 1
+        self.is_node[self.end] = 1
+
+        # Node -> list of (neighbor node, corridor length, first cell of the corridor)
+        self.edges = {}
+        for node in range(maze.size):
+            if self.is_node[node]:
+                self.edges[node] = [
+                    self._follow_corridor(node, first_step)
+                    for first_step in maze.get_open_neighbors(node)
+                ]
+
+    def __len__(self):
+        return len(self.edges)
+
+    def _follow_corridor(self, node: int, first_step: int) -> tuple[int, int, int]:
+        previous, current, length = node, first_step, 1
+        while not self.is_node[current]:
+            neighbor1, neighbor2 = self.maze.get_open_neighbors(current)
+            previous, current = current, neighbor2 if neighbor1 == previous else neighbor1
+            length += 1
+        return current, length, first_step
+
+    def is_up_to_date(self) -> bool:
+        """Checks if the graph still matches its maze (walls, start and goal)
+
+        Returns:
+            bool: True if it does, False if it must be built again
+        """
+        return (
+            self.walls_version == self.maze.walls_version
+            and self.start == self.maze.start
+            and self.end == self.maze.end
+        )
+
+    def search(self, heuristic=None) -> list[int]:
+        """Shortest path from the start to the goal, searched with A* over the junctions then
+        expanded back to every cell
+
+        Args:
+            heuristic (function, optional): Estimation of the distance between two cells (see
+            maze.heuristics), Dijkstra is run if None. Defaults to None.
+
+        Returns:
+            list[int]: Indexes of the cells of the path, empty if there is none
+        """
+        return events.run(self.search_steps(heuristic))
+
+    def search_steps(self, heuristic=None, emit: bool = False):
+        """The search of search, as a generator of steps (see maze.events) whose events only
+        concern the nodes
+
+        Args:
+            heuristic (function, optional): Estimation of the distance between two cells (see
+            maze.heuristics), Dijkstra is run if None. Defaults to None.
+            emit (bool, optional): Yields the events of each step. Defaults to False.
+
+        Returns:
+            list[int]: Indexes of the cells of the path, empty if there is none
+        """
+        maze = self.maze
+        goal = self.end
+
+        def estimate(cell: int) -> int:
+            return 0 if heuristic is None else heuristic(maze, cell, goal)
+
+        # Parent node of each reached node, along with the first cell of the corridor taken
+        came_from = {self.start: None}
+        g_score = {self.start: 0}
+        closed = set()
+        open_set = [(estimate(self.start), self.start)]
+        skipped = []  # Pops of the outdated entries since the last step
+
+        if emit:
+            yield ((events.FRONTIER_PUSH, self.start),)
+
+        while len(open_set) > 0:
+            current = heapq.heappop(open_set)[1]
+            if current in closed:
+                if emit:
+                    skipped.append((events.FRONTIER_POP, current))
+                continue
+            closed.add(current)
+
+            if current == goal:
+                if emit:
+                    yield tuple(skipped) + ((events.FRONTIER_POP, current),)
+                return self._expand(came_from)
+
+            if emit:
+                step = skipped + [(events.FRONTIER_POP, current), (events.CURRENT_CELL, current)]
+                skipped = []
+
+            for neighbor, length, first_step in self.edges[current]:
+                tentative_g_score = g_score[current] + length
+                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                    g_score[neighbor] = tentative_g_score
+                    came_from[neighbor] = (current, first_step)
+                    heapq.heappush(
+                        open_set, (tentative_g_score + estimate(neighbor), neighbor)
+                    )
+
+                    if emit:
+                        step.append((events.FRONTIER_PUSH, neighbor))
+
+            if emit:
+                yield tuple(step)
+
+        if emit and len(skipped) > 0:
+            yield tuple(skipped)
+        return []
+
+    def _expand(self, came_from: dict) -> list[int]:
+        corridors = []
+        node = self.end
+        while came_from[node] is not None:
+            corridors.append(came_from[node])
+            node = came_from[node][0]
+        corridors.reverse()
+
+        path = [self.start]
+        for node, first_step in corridors:
+            previous, current = node, first_step
+            path.append(current)
+            while not self.is_node[current]:
+                neighbor1, neighbor2 = self.maze.get_open_neighbors(current)
+                previous, current = current, neighbor2 if neighbor1 == previous else neighbor1
+                path.append(current)
+        return path
@@ -1,11 +1,47 @@
+from array import array
+from contextlib import contextmanager
+
+# Each cell only stores the state of its east and south walls, the west and north ones
+# being owned by its left and top neighbors. Wall ids follow the same layout: 2 * cell for
+# the east wall of the cell and 2 * cell + 1 for its south wall
+OPEN_EAST = 1
+OPEN_SOUTH = 2
+
+
 class Wall:
-    def __init__(self):
+    def __init__(self, maze: "Maze" = None, wall: int = -1):
+        """View over a wall of the maze, its state being stored in the maze arrays
+
+        Args:
+            maze (Maze, optional): The maze owning the wall, None for borders. Defaults to None.
+            wall (int, optional): Id of the wall in the maze. Defaults to -1.
+        """
+        self.maze = maze
+        self.id = wall
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __eq__(self, wall: "Wall"):
+        if isinstance(wall, self.__class__):
+            return self.maze is wall.maze and self.id == wall.id
+        return False
 
-        self.is_opened = False
+    @property
+    def is_opened(self) -> bool:
+        return self.maze is not None and self.maze.is_wall_opened(self.id)
 
-        # Each wall separates a cell from another, except borders
-        self.cell1 = None
-        self.cell2 = None
+    @property
+    def cell1(self) -> "Cell":
+        if self.maze is None:
+            return None
+        return self.maze.cell(self.maze.get_wall_cells(self.id)[0])
+
+    @property
+    def cell2(self) -> "Cell":
+        if self.maze is None:
+            return None
+        return self.maze.cell(self.maze.get_wall_cells(self.id)[1])
 
     def is_border(self):
         """Checks if the wall is a border
@@ -13,15 +49,17 @@ class Wall:
         Returns:
             bool: True if the wall is a border, False otherwise
         """
-        return self.cell1 is None and self.cell2 is None
+        return self.maze is None
 
     def open(self) -> None:
         """Opens the wall"""
-        self.is_opened = True
+        if self.maze is not None:
+            self.maze.open_wall(*self.maze.get_wall_cells(self.id))
 
     def close(self) -> None:
         """Closes the wall"""
-        self.is_opened = False
+        if self.maze is not None:
+            self.maze.close_wall(*self.maze.get_wall_cells(self.id))
 
     def get_cells(self) -> list["Cell"]:
         """Get all cells of the wall (both cells actually)
@@ -32,39 +70,73 @@ class Wall:
         return [self.cell1, self.cell2]
 
 
+class EdgeIndex:
+    def __init__(self, width: int, height: int):
+        """Index of every interior wall of a maze, sorted by wall id (so in row-major order,
+        the east wall of a cell before its south one). Built in O(N) once per maze
+
+        Args:
+            width (int): Width of the maze
+            height (int): Height of the maze
+        """
+        self.width = width
+        self.walls = array("q")
+
+        # Whole rows are appended as ranges to stay out of a per-cell Python loop
+        for row_start in range(0, width * height, width):
+            row_end = row_start + width
+            if row_end < width * height:
+                self.walls.extend(range(2 * row_start, 2 * row_end - 2))
+                self.walls.append(2 * row_end - 1)
+            else:
+                self.walls.extend(range(2 * row_start, 2 * row_end - 2, 2))
+
+    def __len__(self):
+        return len(self.walls)
+
+    def __getitem__(self, position: int) -> tuple[int, int, int]:
+        """Gets an entry of the index
+
+        Args:
+            position (int): Position of the entry in the index
+
+        Returns:
+            tuple[int, int, int]: Id of the wall and indexes of both cells it separates
+        """
+        wall = self.walls[position]
+        cell = wall >> 1
+        return wall, cell, cell + (self.width if wall & 1 else 1)
+
+    def __iter__(self):
+        width = self.width
+        for wall in self.walls:
+            cell = wall >> 1
+            yield wall, cell, cell + (width if wall & 1 else 1)
+
+
 class Cell:
-    NUMBER_OF_CELLS = 0
+    def __init__(self, maze: "Maze", index: int):
+        """View over a cell of the maze, its state being stored in the maze arrays
 
-    def __init__(self):
-        self.id = Cell.NUMBER_OF_CELLS
-        Cell.NUMBER_OF_CELLS += 1
+        Args:
+            maze (Maze): The maze owning the cell
+            index (int): Index of the cell in the maze (row * width + col)
+        """
+        self.maze = maze
+        self.id = index
+        self.row, self.col = maze.get_coords(index)
 
-        # Will be filled when the maze will be built
+        # Will be filled when the maze will be drawn
         self.x = None
         self.y = None
         self.length = None
 
-        self.top_cell = None
-        self.bottom_cell = None
-        self.left_cell = None
-        self.right_cell = None
-        self.top_wall = Wall()
-        self.bottom_wall = Wall()
-        self.left_wall = Wall()
-        self.right_wall = Wall()
-
-        self.is_visited = False
-        self.is_start = False
-        self.is_end = False
         self.is_colored = False
-        self.distance = 0  # For Dijkstra algorithm
 
-        self.number_of_uses = 0
-        
     # Make cell hashable
     def __hash__(self):
         return hash(self.id)
-    
+
     def __lt__(self, other):
         return False
 
@@ -73,24 +145,94 @@ class Cell:
 
     def __eq__(self, cell: "Cell"):
         if isinstance(cell, self.__class__):
-            return self.id == cell.id
+            return self.maze is cell.maze and self.id == cell.id
         return False
-    
+
+    @property
+    def is_visited(self) -> bool:
+        return bool(self.maze.visited[self.id])
+
+    @is_visited.setter
+    def is_visited(self, visited: bool) -> None:
+        self.maze.visited[self.id] = visited
+
+    @property
+    def number_of_uses(self) -> int:
+        return self.maze.uses[self.id]
+
+    @number_of_uses.setter
+    def number_of_uses(self, uses: int) -> None:
+        self.maze.uses[self.id] = uses
+
+    @property
+    def distance(self) -> float:
+        """For Dijkstra algorithm"""
+        return self.maze.distance[self.id]
+
+    @distance.setter
+    def distance(self, distance: float) -> None:
+        self.maze.distance[self.id] = distance
+
+    @property
+    def is_start(self) -> bool:
+        return self.id == self.maze.start
+
+    @property
+    def is_end(self) -> bool:
+        return self.id == self.maze.end
+
+    @property
+    def top_cell(self) -> "Cell":
+        return self.maze.cell(self.maze.get_top(self.id))
+
+    @property
+    def bottom_cell(self) -> "Cell":
+        return self.maze.cell(self.maze.get_bottom(self.id))
+
+    @property
+    def left_cell(self) -> "Cell":
+        return self.maze.cell(self.maze.get_left(self.id))
+
+    @property
+    def right_cell(self) -> "Cell":
+        return self.maze.cell(self.maze.get_right(self.id))
+
+    @property
+    def top_wall(self) -> Wall:
+        return self._wall_with(self.maze.get_top(self.id))
+
+    @property
+    def bottom_wall(self) -> Wall:
+        return self._wall_with(self.maze.get_bottom(self.id))
+
+    @property
+    def left_wall(self) -> Wall:
+        return self._wall_with(self.maze.get_left(self.id))
+
+    @property
+    def right_wall(self) -> Wall:
+        return self._wall_with(self.maze.get_right(self.id))
+
+    def _wall_with(self, neighbor: int) -> Wall:
+        if neighbor is None:
+            return Wall()
+        return Wall(self.maze, self.maze.get_wall_between(self.id, neighbor))
+
     def get_visited_neighbors(self) -> list["Cell"]:
         """Get all neighbors of the cell that are visited
 
         Returns:
             list[Cell]: List of visited neighbors
         """
-        return list(filter(lambda c: c.is_visited, self.get_neighbors()))
-    
+        return self.maze.cells_of(self.maze.get_visited_neighbors(self.id))
+
     def has_visited_neighbor(self) -> bool:
         """Check if any neighbors are visited or not
 
         Returns:
             bool: True if there is at least one, else False
         """
-        return len(self.get_visited_neighbors()) > 0
+        return len(self.maze.get_visited_neighbors(self.id)) > 0
 
     def reset_state(self):
         self.is_visited = False
@@ -101,72 +243,25 @@ class Cell:
         return list(filter(lambda m: not m.is_border(), l))
 
     def get_opened_walls(self) -> list[Wall]:
-        l = []
-        if self.top_wall.is_opened:
-            l.append(self.top_wall)
-        if self.bottom_wall.is_opened:
-            l.append(self.bottom_wall)
-        if self.left_wall.is_opened:
-            l.append(self.left_wall)
-        if self.right_wall.is_opened:
-            l.append(self.right_wall)
-
-        return list(filter(lambda m: not m.is_border(), l))
+        return [wall for wall in self.get_walls() if wall.is_opened]
 
     def get_closed_walls(self) -> list[Wall]:
-        l = []
-        if not self.top_wall.is_opened:
-            l.append(self.top_wall)
-        if not self.bottom_wall.is_opened:
-            l.append(self.bottom_wall)
-        if not self.left_wall.is_opened:
-            l.append(self.left_wall)
-        if not self.right_wall.is_opened:
-            l.append(self.right_wall)
-
-        return list(filter(lambda m: not m.is_border(), l))
+        return [Wall(self.maze, wall) for wall in self.maze.get_closed_walls(self.id)]
 
     def is_edge_and_not_corner(self) -> bool:
         return self.is_edge() and not self.is_corner()
 
     def is_edge(self) -> bool:
-        return (
-            self.top_cell is None
-            or self.bottom_cell is None
-            or self.left_cell is None
-            or self.right_cell is None
-        )
+        return len(self.maze.get_neighbors(self.id)) < 4
 
     def is_corner(self) -> bool:
-        return (
-            (
-                self.top_cell is None
-                and self.bottom_cell is not None
-                and self.left_cell is None
-                and self.right_cell is not None
-            )
-            or (
-                self.top_cell is None
-                and self.bottom_cell is not None
-                and self.left_cell is not None
-                and self.right_cell is None
-            )
-            or (
-                self.top_cell is not None
-                and self.bottom_cell is None
-                and self.left_cell is None
-                and self.right_cell is not None
-            )
-            or (
-                self.top_cell is not None
-                and self.bottom_cell is None
-                and self.left_cell is not None
-                and self.right_cell is None
-            )
-        )
+        maze = self.maze
+        return (maze.get_top(self.id) is None) != (
+            maze.get_bottom(self.id) is None
+        ) and (maze.get_left(self.id) is None) != (maze.get_right(self.id) is None)
 
     def used_but_not_visited(self) -> bool:
-        self.number_of_uses += 1
+        self.maze.used_but_not_visited(self.id)
 
     def set_visited(self, visited: bool) -> None:
         """Sets the visited status of the cell
@@ -175,7 +270,7 @@ class Cell:
             visited (bool): The visited status to set
         """
         self.is_visited = visited
-        self.number_of_uses += 1
+        self.maze.uses[self.id] += 1
 
     def get_neighbors(self) -> list["Cell"]:
         """Returns a list of neighbors (not None) of the cell. The order of the return has a an importance to some point in the Eller algorithm
@@ -183,17 +278,7 @@ class Cell:
         Returns:
             list[Cell]: List of neighbors
         """
-        l = []
-        if self.left_cell is not None:
-            l.append(self.left_cell)
-        if self.right_cell is not None:
-            l.append(self.right_cell)
-        if self.top_cell is not None:
-            l.append(self.top_cell)
-        if self.bottom_cell is not None:
-            l.append(self.bottom_cell)
-
-        return l
+        return self.maze.cells_of(self.maze.get_neighbors(self.id))
 
     def get_neighbors_according_to_walls(self) -> list["Cell"]:
         """Get all neighbors of the cell according to the walls
@@ -201,16 +286,7 @@ class Cell:
         Returns:
             list[Cell]: List of neighbors according to the walls
         """
-        l = []
-        if self.top_cell is not None and self.top_wall.is_opened:
-            l.append(self.top_cell)
-        if self.bottom_cell is not None and self.bottom_wall.is_opened:
-            l.append(self.bottom_cell)
-        if self.left_cell is not None and self.left_wall.is_opened:
-            l.append(self.left_cell)
-        if self.right_cell is not None and self.right_wall.is_opened:
-            l.append(self.right_cell)
-        return l
+        return self.maze.cells_of(self.maze.get_open_neighbors(self.id))
 
     def has_unvisited_neighbor(self) -> bool:
         """Check if any neighbors are visited or not
@@ -218,7 +294,7 @@ class Cell:
         Returns:
             bool: True if there is at least one, else False
         """
-        return len(self.get_unvisited_neighbors()) > 0
+        return len(self.maze.get_unvisited_neighbors(self.id)) > 0
 
     def get_unvisited_neighbors(self) -> list["Cell"]:
         """Get all univisited neighbors of the cell (top, bottom, left and right)
@@ -226,16 +302,7 @@ class Cell:
         Returns:
             list["Cell"]: List of unvisited neighbors (cells)
         """
-        neighbors = []
-        if self.top_cell is not None and not self.top_cell.is_visited:
-            neighbors.append(self.top_cell)
-        if self.bottom_cell is not None and not self.bottom_cell.is_visited:
-            neighbors.append(self.bottom_cell)
-        if self.left_cell is not None and not self.left_cell.is_visited:
-            neighbors.append(self.left_cell)
-        if self.right_cell is not None and not self.right_cell.is_visited:
-            neighbors.append(self.right_cell)
-        return neighbors
+        return self.maze.cells_of(self.maze.get_unvisited_neighbors(self.id))
 
     def open_wall_with(self, cell: "Cell") -> None:
         """Opens the wall in the given direction for both cells (method called and parameter one)
@@ -243,18 +310,8 @@ class Cell:
         Args:
             cell (Cell): The cell to open the wall with
         """
-        if self.top_cell is cell:
-            self.top_wall.open()
-            cell.bottom_wall.open()
-        elif self.bottom_cell is cell:
-            self.bottom_wall.open()
-            cell.top_wall.open()
-        elif self.left_cell is cell:
-            self.left_wall.open()
-            cell.right_wall.open()
-        elif self.right_cell is cell:
-            self.right_wall.open()
-            cell.left_wall.open()
+        if cell is not None and cell.id in self.maze.get_neighbors(self.id):
+            self.maze.open_wall(self.id, cell.id)
 
     def get_direction(self, cell: "Cell") -> str:
         """Gets the direction to the given cell from this cell
@@ -281,12 +338,26 @@ class Maze:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-
-        self.cells = [[Cell() for _ in range(width)] for _ in range(height)]
-        self.cells[0][0].is_start = True
-        self.cells[-1][-1].is_end = True
-        self.link_cells()
-        self.link_walls()
+        self.size = width * height
+
+        # Every state lives in flat arrays indexed by row * width + col
+        self.walls = bytearray(self.size)  # OPEN_EAST | OPEN_SOUTH bits
+        self.visited = bytearray(self.size)
+        self.uses = array("I", bytes(4 * self.size))
+        self.distance = array("d", bytes(8 * self.size))  # For Dijkstra algorithm
+        # Bumped on every change of the walls, so caches built from them know they are stale
+        self.walls_version = 0
+
+        self.start = 0
+        self.end = self.size - 1
+
+        # Cell objects are only built when someone (mostly the drawer) asks for them, one by one
+        # in _cell_views until all of them are needed at once in _cells
+        self._cell_views = {}
+        self._cells = None
+        self._rows = None
+        self._edges = None
+        self._junction_graph = None
 
         self.is_generated = False
         self.is_solved = False
@@ -295,29 +366,52 @@ class Maze:
         s = ""
         for i in range(self.height):
             for j in range(self.width):
-                s += str(self.cells[i][j])
+                s += str(i * self.width + j)
             s += "\n"
         return s
 
-    def link_cells(self) -> None:
-        """Links all cells"""
-        for i in range(self.height):
-            for j in range(self.width):
-                cell = self.cells[i][j]
-                if i > 0:
-                    cell.top_cell = self.cells[i - 1][j]
-                if i < self.height - 1:
-                    cell.bottom_cell = self.cells[i + 1][j]
-                if j > 0:
-                    cell.left_cell = self.cells[i][j - 1]
-                if j < self.width - 1:
-                    cell.right_cell = self.cells[i][j + 1]
+    @property
+    def cells(self) -> list[list[Cell]]:
+        """Cells of the maze as rows, built on first access"""
+        if self._rows is None:
+            cells = self.get_cells()
+            self._rows = [
+                cells[i * self.width : (i + 1) * self.width] for i in range(self.height)
+            ]
+        return self._rows
 
-    def reset_cells_state(self):
-        """Resets the state of all cells"""
-        for i in range(self.height):
-            for j in range(self.width):
-                self.cells[i][j].reset_state()
+    def cell(self, index: int) -> Cell:
+        """Gets the cell view of the given index
+
+        Args:
+            index (int): Index of the cell, or None
+
+        Returns:
+            Cell: The cell, or None if index is None
+        """
+        if index is None:
+            return None
+        if self._cells is not None:
+            return self._cells[index]
+
+        cell = self._cell_views.get(index)
+        if cell is None:
+            cell = self._cell_views[index] = Cell(self, index)
+        return cell
+
+    def cells_of(self, indexes: list[int]) -> list[Cell]:
+        """Gets the cell views of the given indexes
+
+        Args:
+            indexes (list[int]): Indexes of the cells
+
+        Returns:
+            list[Cell]: List of cells
+        """
+        if self._cells is not None:
+            cells = self._cells
+            return [cells[i] for i in indexes]
+        return [self.cell(i) for i in indexes]
 
     def get_cells(self) -> list[Cell]:
         """Gets all cells
@@ -325,70 +419,342 @@ class Maze:
         Returns:
             list[Cell]: List of all cells
         """
-        return [cell for row in self.cells for cell in row]
+        if self._cells is None:
+            views = self._cell_views
+            self._cells = [views.get(i) or Cell(self, i) for i in range(self.size)]
+            self._cell_views = None
+        return self._cells
+
+    def reset_cells_state(self):
+        """Resets the state of all cells"""
+        self.visited[:] = bytes(self.size)
+
+    def reset(self) -> None:
+        """Puts the maze back in its untouched state, as built by __init__, without allocating
+        its arrays again: every wall closed, no cell visited nor used, the default start and end
+        """
+        # Each array is overwritten in place with zeros, seen as plain bytes
+        for buffer in (self.walls, self.visited, self.uses, self.distance):
+            view = memoryview(buffer).cast("B")
+            view[:] = bytes(len(view))
+        self.walls_version += 1
+
+        self.start = 0
+        self.end = self.size - 1
+        self._junction_graph = None
+
+        self.is_generated = False
+        self.is_solved = False
+
+    def get_index(self, row: int, col: int) -> int:
+        """Gets the index of a cell from its coordinates
+
+        Args:
+            row (int): Row of the cell
+            col (int): Column of the cell
+
+        Returns:
+            int: Index of the cell
+        """
+        return row * self.width + col
+
+    def get_coords(self, index: int) -> tuple[int, int]:
+        """Gets the coordinates of a cell from its index
+
+        Args:
+            index (int): Index of the cell
+
+        Returns:
+            tuple[int, int]: Row and column of the cell
+        """
+        return divmod(index, self.width)
+
+    def get_top(self, index: int) -> int:
+        return index - self.width if index >= self.width else None
+
+    def get_bottom(self, index: int) -> int:
+        return index + self.width if index + self.width < self.size else None
+
+    def get_left(self, index: int) -> int:
+        return index - 1 if index % self.width != 0 else None
+
+    def get_right(self, index: int) -> int:
+        return index + 1 if index % self.width != self.width - 1 else None
+
+    def get_neighbors(self, index: int) -> list[int]:
+        """Gets the neighbors of a cell, in the left, right, top, bottom order
+
+        Args:
+            index (int): Index of the cell
+
+        Returns:
+            list[int]: Indexes of the neighbors
+        """
+        width = self.width
+        col = index % width
+        l = []
+        if col != 0:
+            l.append(index - 1)
+        if col != width - 1:
+            l.append(index + 1)
+        if index >= width:
+            l.append(index - width)
+        if index + width < self.size:
+            l.append(index + width)
+        return l
+
+    def get_open_neighbors(self, index: int) -> list[int]:
+        """Gets the neighbors reachable through an opened wall, in the top, bottom, left, right order
+
+        Args:
+            index (int): Index of the cell
+
+        Returns:
+            list[int]: Indexes of the neighbors
+        """
+        width = self.width
+        walls = self.walls
+        col = index % width
+        l = []
+        if index >= width and walls[index - width] & OPEN_SOUTH:
+            l.append(index - width)
+        if walls[index] & OPEN_SOUTH:
+            l.append(index + width)
+        if col != 0 and walls[index - 1] & OPEN_EAST:
+            l.append(index - 1)
+        if walls[index] & OPEN_EAST:
+            l.append(index + 1)
+        return l
+
+    def get_unvisited_neighbors(self, index: int) -> list[int]:
+        """Gets the unvisited neighbors of a cell, in the top, bottom, left, right order
+
+        Args:
+            index (int): Index of the cell
+
+        Returns:
+            list[int]: Indexes of the neighbors
+        """
+        width = self.width
+        visited = self.visited
+        col = index % width
+        l = []
+        if index >= width and not visited[index - width]:
+            l.append(index - width)
+        if index + width < self.size and not visited[index + width]:
+            l.append(index + width)
+        if col != 0 and not visited[index - 1]:
+            l.append(index - 1)
+        if col != width - 1 and not visited[index + 1]:
+            l.append(index + 1)
+        return l
+
+    def get_visited_neighbors(self, index: int) -> list[int]:
+        """Gets the visited neighbors of a cell, in the left, right, top, bottom order
+
+        Args:
+            index (int): Index of the cell
+
+        Returns:
+            list[int]: Indexes of the neighbors
+        """
+        visited = self.visited
+        return [n for n in self.get_neighbors(index) if visited[n]]
+
+    def get_closed_walls(self, index: int) -> list[int]:
+        """Gets the ids of the closed walls of a cell (borders excluded), in the top, bottom, left, right order
+
+        Args:
+            index (int): Index of the cell
+
+        Returns:
+            list[int]: Ids of the walls
+        """
+        width = self.width
+        walls = self.walls
+        col = index % width
+        l = []
+        if index >= width and not walls[index - width] & OPEN_SOUTH:
+            l.append(2 * (index - width) + 1)
+        if index + width < self.size and not walls[index] & OPEN_SOUTH:
+            l.append(2 * index + 1)
+        if col != 0 and not walls[index - 1] & OPEN_EAST:
+            l.append(2 * (index - 1))
+        if col != width - 1 and not walls[index] & OPEN_EAST:
+            l.append(2 * index)
+        return l
+
+    def get_wall_between(self, cell1: int, cell2: int) -> int:
+        """Gets the id of the wall separating two adjacent cells
+
+        Args:
+            cell1 (int): Index of the first cell
+            cell2 (int): Index of the second cell
+
+        Returns:
+            int: Id of the wall
+        """
+        if cell1 > cell2:
+            cell1, cell2 = cell2, cell1
+        return 2 * cell1 + (cell2 - cell1 == self.width)
+
+    def get_wall_cells(self, wall: int) -> tuple[int, int]:
+        """Gets both cells separated by a wall
+
+        Args:
+            wall (int): Id of the wall
+
+        Returns:
+            tuple[int, int]: Indexes of the cells, the top or left one first
+        """
+        cell = wall >> 1
+        return cell, cell + (self.width if wall & 1 else 1)
+
+    def is_wall_opened(self, wall: int) -> bool:
+        return bool(self.walls[wall >> 1] & (OPEN_SOUTH if wall & 1 else OPEN_EAST))
+
+    def open_wall(self, cell1: int, cell2: int) -> None:
+        """Opens the wall between two adjacent cells
+
+        Args:
+            cell1 (int): Index of the first cell
+            cell2 (int): Index of the second cell
+        """
+        if cell1 > cell2:
+            cell1, cell2 = cell2, cell1
+        if cell2 - cell1 == self.width:
+            self.walls[cell1] |= OPEN_SOUTH
+        else:
+            self.walls[cell1] |= OPEN_EAST
+        self.walls_version += 1
+
+    def close_wall(self, cell1: int, cell2: int) -> None:
+        """Closes the wall between two adjacent cells
+
+        Args:
+            cell1 (int): Index of the first cell
+            cell2 (int): Index of the second cell
+        """
+        if cell1 > cell2:
+            cell1, cell2 = cell2, cell1
+        if cell2 - cell1 == self.width:
+            self.walls[cell1] &= ~OPEN_SOUTH
+        else:
+            self.walls[cell1] &= ~OPEN_EAST
+        self.walls_version += 1
+
+    def set_visited(self, index: int) -> None:
+        """Marks a cell as visited and counts it as used
+
+        Args:
+            index (int): Index of the cell
+        """
+        self.visited[index] = 1
+        self.uses[index] += 1
+
+    def used_but_not_visited(self, index: int) -> None:
+        self.uses[index] += 1
 
     def get_walls(self) -> list[Wall]:
-        """Gets all walls of the maze
+        """Gets all walls of the maze (borders excluded)
 
         Returns:
             list[Wall]: List of all walls
         """
-        walls = []
-        for i in range(self.height):
-            for j in range(self.width):
-                walls.append(self.cells[i][j].top_wall)
-                walls.append(self.cells[i][j].bottom_wall)
-                walls.append(self.cells[i][j].left_wall)
-                walls.append(self.cells[i][j].right_wall)
+        return [Wall(self, wall) for wall in self.get_edges().walls]
 
-        walls = list(
-            filter(lambda k: walls.count(k) != 1, walls)
-        )  # To remove the borders, because each border is in contact with one single cell
+    def get_edges(self) -> EdgeIndex:
+        """Gets the index of all walls of the maze (borders excluded), built on first access
 
-        # Now we remove occurrences of walls that are in contact with more than one cell (every wall is in contact with two cells or more lol)
-        walls_without_duplicates = []
-        for wall in walls:
-            if wall not in walls_without_duplicates:
-                walls_without_duplicates.append(wall)
+        Returns:
+            EdgeIndex: The index of the walls
+        """
+        if self._edges is None:
+            self._edges = EdgeIndex(self.width, self.height)
+        return self._edges
 
-        return list(filter(lambda m: not m.is_border(), walls_without_duplicates))
+    def get_junction_graph(self):
+        """Gets the graph of the maze with its corridors collapsed, built on first access and
+        again whenever the walls, the start or the end changed
 
-    def link_walls(self) -> None:
-        """Links all walls"""
-        for i in range(self.height):
-            for j in range(self.width):
-                cell = self.cells[i][j]
-                if i > 0:
-                    # Link the bottom wall of the cell above to the cell
-                    cell.top_cell.bottom_wall.cell1 = cell
-                    cell.top_cell.bottom_wall.cell2 = self.cells[i - 1][j]
-                    cell.top_cell.bottom_wall = cell.top_wall
-                if i < self.height - 1:
-                    # Link the top wall of the cell above to the cell
-                    cell.bottom_cell.top_wall.cell1 = cell
-                    cell.bottom_cell.top_wall.cell2 = self.cells[i + 1][j]
-                    cell.bottom_cell.top_wall = cell.bottom_wall
-                if j > 0:
-                    # Link the right wall of the cell above to the cell
-                    cell.left_cell.right_wall.cell1 = cell
-                    cell.left_cell.right_wall.cell2 = self.cells[i][j - 1]
-                    cell.left_cell.right_wall = cell.left_wall
-                if j < self.width - 1:
-                    cell.right_cell.left_wall.cell1 = cell
-                    cell.right_cell.left_wall.cell2 = self.cells[i][j + 1]
-                    # Link the left wall of the cell above to the cell
-                    cell.right_cell.left_wall = cell.right_wall
+        Returns:
+            JunctionGraph: The graph of the junctions of the maze
+        """
+        # Imported here as the junction graph module depends on this one
+        from maze.junction_graph import JunctionGraph
+
+        if self._junction_graph is None or not self._junction_graph.is_up_to_date():
+            self._junction_graph = JunctionGraph(self)
+        return self._junction_graph
 
     def has_unvisited_cells(self) -> bool:
-        cells = self.get_cells()
-        for cell in cells:
-            if not cell.is_visited:
-                return True
-        return False
-    
+        return 0 in self.visited
+
     def get_flat_coords(self, cell: Cell) -> list[int]:
-        for i in range(self.height):
-            for j in range(self.width):
-                if self.cells[i][j] is cell:
-                    return [i, j]
-        return [-1, -1]
+        if cell is None or cell.maze is not self:
+            return [-1, -1]
+        return [cell.row, cell.col]
+
+
+class MazePool:
+    def __init__(self, max_per_size: int = 8):
+        """Mazes kept once done with, by dimensions, so that repeated generations reuse them
+        instead of allocating new ones
+
+        Args:
+            max_per_size (int, optional): Mazes kept at most for each dimensions, the others
+            being left to the garbage collector. Defaults to 8.
+        """
+        self.max_per_size = max_per_size
+        self._free = {}  # (width, height) -> untouched mazes
+
+    def __len__(self):
+        return sum(len(mazes) for mazes in self._free.values())
+
+    def acquire(self, width: int, height: int) -> Maze:
+        """Checks out an untouched maze
+
+        Args:
+            width (int): Width of the maze
+            height (int): Height of the maze
+
+        Returns:
+            Maze: A maze from the pool, or a new one if there is none of these dimensions
+        """
+        mazes = self._free.get((width, height))
+        if mazes:
+            return mazes.pop()
+        return Maze(width, height)
+
+    def release(self, maze: Maze) -> None:
+        """Gives a maze back to the pool, reset to its untouched state. It must not be used
+        anymore by whoever acquired it
+
+        Args:
+            maze (Maze): The maze
+        """
+        mazes = self._free.setdefault((maze.width, maze.height), [])
+        if len(mazes) < self.max_per_size:
+            maze.reset()
+            mazes.append(maze)
+
+    @contextmanager
+    def maze(self, width: int, height: int):
+        """Checks out an untouched maze for the time of a with block
+
+        Args:
+            width (int): Width of the maze
+            height (int): Height of the maze
+
+        Yields:
+            Maze: The maze, given back to the pool at the end of the block
+        """
+        maze = self.acquire(width, height)
+        try:
+            yield maze
+        finally:
+            self.release(maze)
+
+    def clear(self) -> None:
+        """Drops every maze kept"""
+        self._free.clear()
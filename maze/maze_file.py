@@ -0,0 +1,465 @@
+"""Versioned binary files of generated mazes, readable into a Maze or memory-mapped so huge
+mazes can be read straight from the disk (see MappedMaze for what runs on them without using
+memory in proportion to the whole maze).
+
+A file starts with a HEADER (MAGIC, format version, flags, width, height, start, end, seed and
+the name of the generation algorithm), followed by the walls packed 2 bits per cell, 4 cells per
+byte: cell i lives in the bits 2 * (i % 4) and 2 * (i % 4) + 1 of byte i // 4, holding its
+OPEN_EAST | OPEN_SOUTH state.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from typing import BinaryIO
+
+import numpy as np
+
+import maze.maze as m
+
+MAGIC = b"MAZF"
+VERSION = 1
+HEADER = struct.Struct("<4sBBxxIIQQq32s")
+
+HAS_SEED = 0x01  # Flag set when the seed of the generation is known
+
+CELLS_PER_BYTE = 4
+CHUNK_CELLS = 1 << 22  # Cells packed or unpacked at once, so huge mazes don't need huge buffers
+
+
+class MazeHeader:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        start: int,
+        end: int,
+        algorithm: str = "",
+        seed: int = None,
+    ):
+        """What a maze file tells about its maze besides the walls
+
+        Args:
+            width (int): Width of the maze
+            height (int): Height of the maze
+            start (int): Index of the start cell
+            end (int): Index of the end cell
+            algorithm (str, optional): Name of the generation algorithm. Defaults to "".
+            seed (int, optional): Seed of the generation, None if unknown. Defaults to None.
+        """
+        self.width = width
+        self.height = height
+        self.start = start
+        self.end = end
+        self.algorithm = algorithm
+        self.seed = seed
+
+    def __str__(self):
+        seed = "unknown seed" if self.seed is None else f"seed {self.seed}"
+        return f"{self.width}x{self.height} maze by {self.algorithm or 'unknown algorithm'}, {seed}"
+
+    @property
+    def size(self) -> int:
+        return self.width * self.height
+
+    @property
+    def body_size(self) -> int:
+        """Number of bytes of the packed walls"""
+        return -(-self.size // CELLS_PER_BYTE)
+
+    def pack(self) -> bytes:
+        return HEADER.pack(
+            MAGIC,
+            VERSION,
+            0 if self.seed is None else HAS_SEED,
+            self.width,
+            self.height,
+            self.start,
+            self.end,
+            0 if self.seed is None else self.seed,
+            self.algorithm.encode(),
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "MazeHeader":
+        """Reads a header
+
+        Args:
+            data (bytes): At least the HEADER.size first bytes of a maze file
+
+        Raises:
+            ValueError: If the data is not a maze file, or of an unknown version
+
+        Returns:
+            MazeHeader: The header
+        """
+        if len(data) < HEADER.size or data[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a maze file")
+        magic, version, flags, width, height, start, end, seed, algorithm = HEADER.unpack_from(
+            data
+        )
+        if version != VERSION:
+            raise ValueError(f"Unsupported maze file version {version}")
+        return cls(
+            width,
+            height,
+            start,
+            end,
+            algorithm.rstrip(b"\0").decode(),
+            seed if flags & HAS_SEED else None,
+        )
+
+
+def pack_walls(walls: bytes) -> bytes:
+    """Packs walls stored one byte per cell (like Maze.walls) into 2 bits per cell
+
+    Args:
+        walls (bytes): OPEN_EAST | OPEN_SOUTH state of each cell
+
+    Returns:
+        bytes: The packed walls
+    """
+    cells = np.frombuffer(walls, dtype=np.uint8)
+    padding = -len(cells) % CELLS_PER_BYTE
+    if padding:
+        cells = np.concatenate((cells, np.zeros(padding, dtype=np.uint8)))
+    cells = cells.reshape(-1, CELLS_PER_BYTE) & 3
+    return (cells[:, 0] | cells[:, 1] << 2 | cells[:, 2] << 4 | cells[:, 3] << 6).tobytes()
+
+
+def unpack_walls(data: bytes, size: int) -> bytes:
+    """Unpacks walls packed by pack_walls back to one byte per cell
+
+    Args:
+        data (bytes): The packed walls
+        size (int): Number of cells
+
+    Returns:
+        bytes: OPEN_EAST | OPEN_SOUTH state of each cell
+    """
+    packed = np.frombuffer(data, dtype=np.uint8, count=-(-size // CELLS_PER_BYTE))
+    cells = np.empty((len(packed), CELLS_PER_BYTE), dtype=np.uint8)
+    for position in range(CELLS_PER_BYTE):
+        np.bitwise_and(packed >> 2 * position, 3, out=cells[:, position])
+    return cells.reshape(-1)[:size].tobytes()
+
+
+def write(stream: BinaryIO, maze: m.Maze, algorithm: str = "", seed: int = None) -> None:
+    """Writes a maze to a stream
+
+    Args:
+        stream (BinaryIO): Where to write the maze
+        maze (Maze): The maze
+        algorithm (str, optional): Name of the generation algorithm. Defaults to "".
+        seed (int, optional): Seed of the generation, None if unknown. Defaults to None.
+    """
+    header = MazeHeader(maze.width, maze.height, maze.start, maze.end, algorithm, seed)
+    write_walls(stream, header, maze.walls)
+
+
+def write_walls(stream: BinaryIO, header: MazeHeader, walls: bytes) -> None:
+    """Writes a maze to a stream from its walls alone, without any Maze being built
+
+    Args:
+        stream (BinaryIO): Where to write the maze
+        header (MazeHeader): The header of the maze
+        walls (bytes): OPEN_EAST | OPEN_SOUTH state of each cell
+    """
+    stream.write(header.pack())
+    walls = memoryview(walls)
+    for chunk_start in range(0, header.size, CHUNK_CELLS):
+        stream.write(pack_walls(walls[chunk_start : chunk_start + CHUNK_CELLS]))
+
+
+def read(stream: BinaryIO) -> tuple[MazeHeader, m.Maze]:
+    """Reads a maze from a stream, all of it being loaded in memory
+
+    Args:
+        stream (BinaryIO): Where to read the maze
+
+    Raises:
+        ValueError: If the stream holds no maze file, or a truncated one
+
+    Returns:
+        tuple[MazeHeader, Maze]: The header and the maze
+    """
+    header = MazeHeader.unpack(stream.read(HEADER.size))
+    maze = m.Maze(header.width, header.height)
+    maze.start = header.start
+    maze.end = header.end
+
+    for chunk_start in range(0, maze.size, CHUNK_CELLS):
+        cells = min(CHUNK_CELLS, maze.size - chunk_start)
+        data = stream.read(-(-cells // CELLS_PER_BYTE))
+        if len(data) * CELLS_PER_BYTE < cells:
+            raise ValueError("The maze file is truncated")
+        maze.walls[chunk_start : chunk_start + cells] = unpack_walls(data, cells)
+
+    maze.walls_version += 1
+    maze.is_generated = True
+    return header, maze
+
+
+def save(path: str, maze: m.Maze, algorithm: str = "", seed: int = None) -> None:
+    """Writes a maze to a file
+
+    Args:
+        path (str): Path of the file
+        maze (Maze): The maze
+        algorithm (str, optional): Name of the generation algorithm. Defaults to "".
+        seed (int, optional): Seed of the generation, None if unknown. Defaults to None.
+    """
+    with open(path, "wb") as f:
+        write(f, maze, algorithm, seed)
+
+
+def load(path: str) -> tuple[MazeHeader, m.Maze]:
+    """Reads a maze from a file, all of it being loaded in memory (see MappedMaze otherwise)
+
+    Args:
+        path (str): Path of the file
+
+    Returns:
+        tuple[MazeHeader, Maze]: The header and the maze
+    """
+    with open(path, "rb") as f:
+        return read(f)
+
+
+class PackedWalls:
+    def __init__(self, buffer, size: int):
+        """Walls packed 2 bits per cell, indexed like Maze.walls (one OPEN_EAST | OPEN_SOUTH
+        value per cell) without unpacking them
+
+        Args:
+            buffer (buffer): The packed walls, writable to open or close walls
+            size (int): Number of cells
+        """
+        self.buffer = buffer
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            if step != 1:
+                return bytes(self[cell] for cell in range(start, stop, step))
+            if start >= stop:
+                return b""
+            # Unpacked from the byte holding the first cell
+            first = start & ~3
+            return unpack_walls(self.buffer[first >> 2 :], stop - first)[start - first :]
+
+        if index < 0:
+            index += self.size
+        return self.buffer[index >> 2] >> ((index & 3) << 1) & 3
+
+    def __setitem__(self, index, walls) -> None:
+        if isinstance(index, slice):
+            self._set_slice(index, bytes(walls))
+            return
+
+        if index < 0:
+            index += self.size
+        shift = (index & 3) << 1
+        byte = self.buffer[index >> 2]
+        self.buffer[index >> 2] = byte & ~(3 << shift) | (walls & 3) << shift
+
+    def _set_slice(self, index: slice, walls: bytes) -> None:
+        start, stop, step = index.indices(self.size)
+        cells = range(start, stop, step)
+        if len(walls) != len(cells):
+            raise ValueError(f"Cannot set {len(walls)} walls to a slice of {len(cells)} cells")
+        if step != 1:
+            for cell, cell_walls in zip(cells, walls):
+                self[cell] = cell_walls
+            return
+
+        # The cells sharing a byte with cells out of the slice are set one by one, the others
+        # are packed all at once
+        aligned_start = min((start + 3) & ~3, stop)
+        aligned_stop = max(stop & ~3, aligned_start)
+        for cell in range(start, aligned_start):
+            self[cell] = walls[cell - start]
+        for cell in range(aligned_stop, stop):
+            self[cell] = walls[cell - start]
+        if aligned_start < aligned_stop:
+            self.buffer[aligned_start >> 2 : aligned_stop >> 2] = pack_walls(
+                walls[aligned_start - start : aligned_stop - start]
+            )
+
+    def __iter__(self):
+        for chunk_start in range(0, self.size, CHUNK_CELLS):
+            cells = min(CHUNK_CELLS, self.size - chunk_start)
+            yield from unpack_walls(self.buffer[chunk_start >> 2 :], cells)
+
+    def __bytes__(self):
+        return b"".join(
+            unpack_walls(
+                self.buffer[chunk_start >> 2 :], min(CHUNK_CELLS, self.size - chunk_start)
+            )
+            for chunk_start in range(0, self.size, CHUNK_CELLS)
+        )
+
+
+class MappedMaze(m.Maze):
+    def __init__(self, path: str, writable: bool = False):
+        """A maze file mapped in memory: only the pages of the walls actually read are loaded,
+        and the other arrays of the maze are only allocated when first used. Every generator
+        and solver works on it as on any maze, but only breadth_first_search keeps its memory in
+        proportion to the cells it explores. The other solvers allocate arrays of one or more
+        bytes per cell of the maze (dead_end_filling unpacks the walls too), and so do the
+        generators (the visited array)
+
+        Args:
+            path (str): Path of the file
+            writable (bool, optional): Whether opening or closing walls writes to the file.
+            Defaults to False.
+
+        Raises:
+            ValueError: If the file is not a maze file, or a truncated one
+        """
+        with open(path, "r+b" if writable else "rb") as f:
+            self.header = MazeHeader.unpack(f.read(HEADER.size))
+            if os.fstat(f.fileno()).st_size < HEADER.size + self.header.body_size:
+                raise ValueError("The maze file is truncated")
+            self._mmap = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            )
+
+        self.width = self.header.width
+        self.height = self.header.height
+        self.size = self.header.size
+        self.start = self.header.start
+        self.end = self.header.end
+
+        self._body = memoryview(self._mmap)[HEADER.size : HEADER.size + self.header.body_size]
+        self.walls = PackedWalls(self._body, self.size)
+        self.walls_version = 0
+
+        self._visited = None
+        self._uses = None
+        self._distance = None
+
+        self._cell_views = {}
+        self._cells = None
+        self._rows = None
+        self._edges = None
+        self._junction_graph = None
+
+        self.is_generated = True
+        self.is_solved = False
+
+    @classmethod
+    def create(cls, path: str, width: int, height: int, algorithm: str = "", seed: int = None):
+        """Creates a maze file with every wall closed, without building the maze in memory,
+        and maps it so it can be generated in place
+
+        Args:
+            path (str): Path of the file
+            width (int): Width of the maze
+            height (int): Height of the maze
+            algorithm (str, optional): Name of the generation algorithm. Defaults to "".
+            seed (int, optional): Seed of the generation, None if unknown. Defaults to None.
+
+        Returns:
+            MappedMaze: The writable mapped maze
+        """
+        header = MazeHeader(width, height, 0, width * height - 1, algorithm, seed)
+        with open(path, "wb") as f:
+            f.write(header.pack())
+            f.truncate(HEADER.size + header.body_size)  # Sparse zeros, so closed walls
+        maze = cls(path, writable=True)
+        maze.is_generated = False
+        return maze
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps the file, flushing the walls written if any"""
+        self.walls = None
+        self._body.release()
+        self._mmap.close()
+
+    def reset(self) -> None:
+        """Closes every wall of the file and drops the other arrays, which will be allocated
+        again when used (see Maze.reset)"""
+        for chunk_start in range(0, len(self._body), CHUNK_CELLS):
+            chunk_end = min(chunk_start + CHUNK_CELLS, len(self._body))
+            self._body[chunk_start:chunk_end] = bytes(chunk_end - chunk_start)
+        self.walls_version += 1
+
+        self._visited = None
+        self._uses = None
+        self._distance = None
+        self.start = 0
+        self.end = self.size - 1
+        self._junction_graph = None
+
+        self.is_generated = False
+        self.is_solved = False
+
+    @property
+    def visited(self) -> bytearray:
+        if self._visited is None:
+            self._visited = bytearray(self.size)
+        return self._visited
+
+    @visited.setter
+    def visited(self, visited: bytearray) -> None:
+        self._visited = visited
+
+    @property
+    def uses(self) -> array:
+        if self._uses is None:
+            self._uses = array("I", bytes(4 * self.size))
+        return self._uses
+
+    @uses.setter
+    def uses(self, uses: array) -> None:
+        self._uses = uses
+
+    @property
+    def distance(self) -> array:
+        if self._distance is None:
+            self._distance = array("d", bytes(8 * self.size))
+        return self._distance
+
+    @distance.setter
+    def distance(self, distance: array) -> None:
+        self._distance = distance
+
+    def get_open_neighbors(self, index: int) -> list[int]:
+        """Gets the neighbors reachable through an opened wall, in the top, bottom, left, right
+        order, reading the packed walls directly
+
+        Args:
+            index (int): Index of the cell
+
+        Returns:
+            list[int]: Indexes of the neighbors
+        """
+        width = self.width
+        body = self._body
+        walls = body[index >> 2] >> ((index & 3) << 1)
+        l = []
+        if index >= width:
+            top = index - width
+            if body[top >> 2] >> ((top & 3) << 1) & m.OPEN_SOUTH:
+                l.append(top)
+        if walls & m.OPEN_SOUTH:
+            l.append(index + width)
+        if index % width != 0:
+            left = index - 1
+            if body[left >> 2] >> ((left & 3) << 1) & m.OPEN_EAST:
+                l.append(left)
+        if walls & m.OPEN_EAST:
+            l.append(index + 1)
+        return l
@@ -1,351 +1,429 @@
+from array import array
 from collections import deque
+import functools
 import heapq
 
 import os
-import keyboard
 
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
 
-import pygame
 import random
 from abc import abstractmethod
+from collections.abc import Generator  # Not from typing, which is slow to import
 
+import maze.events as events
+import maze.heuristics as heuristics
 import maze.maze as m
+from maze.disjoint_set import DisjointSet
 import visual.colors as vc
 
+# Only imported once a window is opened, so mazes can be generated and solved without a display
+pygame = None
+keyboard = None
 
-class SetTool:
-    @staticmethod
-    def belong_to_distinct_sets(
-        sets: list[m.Cell], cell1: m.Cell, cell2: m.Cell
-    ) -> bool:
-        for set_ in sets:
-            if cell1 in set_ and cell2 in set_:
-                return False
-        return True
 
-    @staticmethod
-    def join_sets(sets: list[m.Cell], cell1: m.Cell, cell2: m.Cell) -> None:
-        s = 0
+def register(registry: dict):
+    """Adds an algorithm to a registry under its function name, once and for all when the
+    algorithm is defined. The registry is kept sorted by name, which is the order of the menus
 
-        for i in range(0, len(sets)):
-            if cell1 in sets[i]:
-                s = i
-                sets[i].append(cell2)
-                break
-        for i in range(0, len(sets)):
-            if cell2 in sets[i] and cell1 not in sets[i]:
-                # Merging the rest
-                for j in range(0, len(sets[i])):
-                    if sets[i][j].id != cell2.id:
-                        sets[s].append(sets[i][j])
-                del sets[i]
-                break
+    Args:
+        registry (dict): The ALGORITHMS of MazeGenerator or MazeSolver
+    """
 
+    def decorator(algorithm):
+        registry[algorithm.__name__] = algorithm
+        entries = sorted(registry.items())
+        registry.clear()
+        registry.update(entries)
+        return algorithm
 
-class MazeGenerator:
-    ALGORITHMS = []
+    return decorator
 
-    def __init__(self, num: int):
-        self.num = num
 
-        # This block of code allows me to retreive every method of this class (except the "system" and hidden ones)
-        MazeGenerator.ALGORITHMS = {
-            method_name.title().replace("_", " "): getattr(self, method)
-            for method_name, method in zip(dir(self), dir(self))
-            if callable(getattr(self, method_name))
-            and not method_name.startswith("__")
-            and method_name.lower() != "generate"
-        }
+def get_title(name: str) -> str:
+    """Gets the name of an algorithm as shown to the user
 
-        self.algorithm = list(MazeGenerator.ALGORITHMS.values())[num]
+    Args:
+        name (str): Name of the algorithm (e.g. "depth_first_search")
 
-    def generate(self, maze: m.Maze) -> None:
-        self.algorithm(maze)
-        maze.is_generated = True
-        maze.reset_cells_state()
+    Returns:
+        str: Its title (e.g. "Depth First Search")
+    """
+    return name.replace("_", " ").title()
 
-    @staticmethod
-    def depth_first_search(maze: m.Maze) -> None:
-        """Depth First Search algorithm (iterative, cuz the recursive one overflows the stack)
 
-        Args:
-            maze (Maze): An untouched maze object to be built upon
-        """
-        maze.cells[0][0].set_visited(True)
-        stack = [maze.cells[0][0]]
-        chosen_cell = None
+def get_algorithms(registry: type) -> dict:
+    """Gets every generation or solving algorithm by name
 
-        while len(stack) != 0:
+    Args:
+        registry (type): MazeGenerator or MazeSolver
 
-            current_cell = stack.pop()
+    Returns:
+        dict: The algorithms by name (e.g. "depth_first_search")
+    """
+    return dict(registry.ALGORITHMS)
 
-            if current_cell.has_unvisited_neighbor():
-                stack.append(current_cell)
-                chosen_cell = random.choice(current_cell.get_unvisited_neighbors())
-                current_cell.open_wall_with(chosen_cell)
-                chosen_cell.set_visited(True)
-                stack.append(chosen_cell)
 
-            else:
-                current_cell.used_but_not_visited()
+def get_algorithm(registry: type, name: str):
+    """Gets a generation or solving algorithm from its name
 
-            if Window.GENERATE_ANIMATION:
-                MazeDrawer.colorize_all_cells(
-                    [c for c in maze.get_cells() if c is not chosen_cell]
-                )
-                MazeDrawer.colorize_cell(
-                    current_cell, imposed_color=vc.Color.BLUE, priority=1
-                )
-                MazeDrawer.refresh_drawing_on_screen(
-                    maze
-                )  # Needs to be here to refresh the drawing on screen each time
+    Args:
+        registry (type): MazeGenerator or MazeSolver
+        name (str): Name of the algorithm (e.g. "depth_first_search")
 
-    @staticmethod
-    def randomized_kruskal(maze: m.Maze) -> None:
-        # Only for coloring
-        visited_cells = []
-
-        sets = [[cell] for cell in maze.get_cells()]
-        walls = maze.get_walls()
-
-        random.shuffle(walls)
-        while len(walls) > 0:
-            current_wall = walls.pop()
-            if SetTool.belong_to_distinct_sets(
-                sets, current_wall.cell1, current_wall.cell2
-            ):
-                current_wall.open()
-                SetTool.join_sets(sets, current_wall.cell1, current_wall.cell2)
-
-            if Window.GENERATE_ANIMATION:
+    Raises:
+        ValueError: If there is no algorithm with this name
 
-                visited_cells.append(current_wall.cell1)
-                visited_cells.append(current_wall.cell2)
-                current_wall.cell1.set_visited(True)
-                current_wall.cell2.set_visited(True)
-
-                MazeDrawer.colorize_all_cells(
-                    visited_cells, imposed_color=vc.Color.YELLOW, priority=0
-                )
+    Returns:
+        function: The algorithm
+    """
+    algorithms = get_algorithms(registry)
+    if name not in algorithms:
+        raise ValueError(
+            f"Unknown algorithm '{name}', expected one of: {', '.join(algorithms)}"
+        )
+    return algorithms[name]
 
-                MazeDrawer.refresh_drawing_on_screen(
-                    maze
-                )  # Needs to be here to refresh the drawing on screen each time
 
-    @staticmethod
-    def randomized_prim(maze: m.Maze) -> None:
+def animated(animation_flag: str):
+    """Turns an algorithm written as a generator of steps (see maze.events) into a plain
+    function: animated in the window when the given Window flag is set and the window is open,
+    run headless otherwise. The generator itself stays reachable as the steps attribute of the
+    function
 
-        # For colorizing
-        visited_cells = []
+    Args:
+        animation_flag (str): Name of the Window flag enabling the animation
+    """
 
-        random_cell = random.choice(maze.get_cells())
-        random_cell.set_visited(True)
-        wall_list = []
-        wall_list += (
-            random_cell.get_closed_walls()
-        )  # Merging both lists (reminder: [1, 2] + [3, 4] = [1, 2, 3, 4])
+    def decorator(steps_function):
+        @functools.wraps(steps_function)
+        def algorithm(maze: m.Maze, *args, **kwargs):
+            if getattr(Window, animation_flag) and Window.SCREEN is not None:
+                return MazeDrawer.play(maze, steps_function(maze, *args, emit=True, **kwargs))
+            return events.run(steps_function(maze, *args, **kwargs))
 
-        visited_cells_between_wall = []
+        algorithm.steps = steps_function
+        return algorithm
 
-        while len(wall_list) > 0:
-            random_wall = random.choice(wall_list)
-            visited_cells_between_wall = [
-                cell for cell in random_wall.get_cells() if cell.is_visited
-            ]
+    return decorator
 
-            for cell in visited_cells_between_wall:
-                cell.used_but_not_visited()
 
-            if len(visited_cells_between_wall) == 1:
-                random_wall.open()
-                random_wall.cell1.set_visited(True)
-                random_wall.cell2.set_visited(True)
-                wall_list += random_wall.cell1.get_closed_walls()
-                wall_list += random_wall.cell2.get_closed_walls()
+class MazeGenerator:
+    ALGORITHMS = {}  # Name -> algorithm, filled by register as the algorithms are defined
 
-                # Because we don't want visited_cell to be None
-                if Window.GENERATE_ANIMATION:
+    def __init__(self, algorithm):
+        """Runs one of the generation algorithms of ALGORITHMS
 
-                    for cell in random_wall.get_cells():
-                        visited_cells.append(cell)
+        Args:
+            algorithm (int | str): Position of the algorithm in ALGORITHMS, or its name (e.g.
+            "depth_first_search")
 
-                    tmp = visited_cells.copy()
+        Raises:
+            ValueError: If there is no algorithm with this name
+        """
+        names = list(MazeGenerator.ALGORITHMS)
+        if isinstance(algorithm, str):
+            self.algorithm = get_algorithm(MazeGenerator, algorithm)
+            self.num = names.index(algorithm)
+        else:
+            self.num = algorithm
+            self.algorithm = MazeGenerator.ALGORITHMS[names[algorithm]]
+        self.name = names[self.num]
+        self.last_stats = None  # Statistics of the last generation, if asked for
+
+    def generate(
+        self,
+        maze: m.Maze,
+        stats: bool = False,
+        profile: bool = False,
+        trace_memory: bool = False,
+        seed: int = None,
+        rng: random.Random = None,
+    ) -> None:
+        """Generates the maze with the chosen algorithm
 
-                    for cell in tmp:
-                        if cell.number_of_uses > 1:
-                            visited_cells.remove(cell)
+        Args:
+            maze (Maze): An untouched maze object to be built upon
+            stats (bool, optional): Gathers the statistics of the run into last_stats (see
+            maze.stats). Defaults to False.
+            profile (bool, optional): Also profiles the run with cProfile. Defaults to False.
+            trace_memory (bool, optional): Also traces its memory allocations. Defaults to False.
+            seed (int, optional): Seed of a random.Random of its own, the same seed always
+            giving the same maze. Defaults to None.
+            rng (random.Random, optional): Source of randomness if no seed is given, the random
+            module if None. Defaults to None.
+        """
+        if seed is not None:
+            rng = random.Random(seed)
 
-                    MazeDrawer.colorize_all_cells(visited_cells)
-                    MazeDrawer.refresh_drawing_on_screen(
-                        maze
-                    )  # Needs to be here to refresh the drawing on screen each time
+        if stats or profile or trace_memory:
+            import maze.stats as run_stats  # Only loaded when asked for
 
-            wall_list.remove(random_wall)
+            self.last_stats = run_stats.measure(
+                self.algorithm, maze, rng=rng, profile=profile, trace_memory=trace_memory
+            )
+        else:
+            self.algorithm(maze, rng)
+        maze.is_generated = True
+        maze.reset_cells_state()
 
     @staticmethod
-    def aldous_broder(maze: m.Maze) -> None:
-
-        # For colorizing
-        visited_cells = []
-
-        current_cell = random.choice(maze.get_cells())
-        current_cell.set_visited(True)
+    @register(ALGORITHMS)
+    @animated("GENERATE_ANIMATION")
+    def depth_first_search(maze: m.Maze, rng: random.Random = None, emit: bool = False):
+        """Depth First Search algorithm (iterative, cuz the recursive one overflows the stack)
 
-        while maze.has_unvisited_cells():
+        Args:
+            maze (Maze): An untouched maze object to be built upon
+            rng (random.Random, optional): Source of randomness, the random module if None.
+            Defaults to None.
+            emit (bool, optional): Yields the events of each step (see maze.events). Defaults to False.
+        """
+        rng = rng or random  # The shared generator of the random module by default
+        maze.set_visited(0)
+        stack = [0]
 
-            if Window.GENERATE_ANIMATION:
-                visited_cells.append(current_cell)
+        if emit:
+            yield ((events.CELL_VISITED, 0), (events.FRONTIER_PUSH, 0))
 
-                tmp = visited_cells.copy()
+        while len(stack) != 0:
 
-                for cell in tmp:
-                    if cell.number_of_uses > 1:
-                        visited_cells.remove(cell)
+            current_cell = stack.pop()
+            unvisited_neighbors = maze.get_unvisited_neighbors(current_cell)
 
-                MazeDrawer.colorize_all_cells(visited_cells)
-                MazeDrawer.colorize_cell(
-                    current_cell, imposed_color=vc.Color.BLUE, priority=1
-                )
-                MazeDrawer.refresh_drawing_on_screen(
-                    maze
-                )  # Needs to be here to refresh the drawing on screen each time
+            if len(unvisited_neighbors) > 0:
+                stack.append(current_cell)
+                chosen_cell = rng.choice(unvisited_neighbors)
+                maze.open_wall(current_cell, chosen_cell)
+                maze.set_visited(chosen_cell)
+                stack.append(chosen_cell)
 
-            random_neighbor = random.choice(current_cell.get_neighbors())
+                if emit:
+                    yield (
+                        (events.WALL_OPENED, current_cell, chosen_cell),
+                        (events.CELL_VISITED, chosen_cell),
+                        (events.FRONTIER_PUSH, chosen_cell),
+                    )
 
-            if not random_neighbor.is_visited:
-                current_cell.open_wall_with(random_neighbor)
-                random_neighbor.set_visited(True)
             else:
-                current_cell.used_but_not_visited()
+                maze.used_but_not_visited(current_cell)
 
-            current_cell = random_neighbor
+                if emit:
+                    yield ((events.FRONTIER_POP, current_cell),)
 
     @staticmethod
-    def eller(maze: m.Maze) -> None:
-
-        row_number = 0
-
-        while row_number < maze.height - 1:
-            row = [[cell] for cell in maze.cells[row_number]]
-            sets = []
+    @register(ALGORITHMS)
+    @animated("GENERATE_ANIMATION")
+    def randomized_kruskal(maze: m.Maze, rng: random.Random = None, emit: bool = False):
+        rng = rng or random
+        sets = DisjointSet(maze.size)
+        walls = maze.get_edges().walls.tolist()
+
+        rng.shuffle(walls)
+        while len(walls) > 0:
+            cell1, cell2 = maze.get_wall_cells(walls.pop())
+            if sets.union(cell1, cell2):
+                maze.open_wall(cell1, cell2)
+
+                if emit:
+                    yield (
+                        (events.WALL_OPENED, cell1, cell2),
+                        (events.CELL_VISITED, cell1),
+                        (events.CELL_VISITED, cell2),
+                    )
 
-            # Randomly joining cells in distinct sets
-            i = 0
-            sets.append(row[0])
-            row.remove(row[0])
-            for set_ in row:
-                if random.getrandbits(1):
-                    sets[i].extend(set_)
-                else:
-                    sets.append(set_)
-                    i += 1
+            elif emit:
+                yield ((events.CURRENT_CELL, cell1), (events.CURRENT_CELL, cell2))
 
-            for i in range(0, len(sets)):
+    @staticmethod
+    @register(ALGORITHMS)
+    @animated("GENERATE_ANIMATION")
+    def randomized_prim(maze: m.Maze, rng: random.Random = None, emit: bool = False):
+        rng = rng or random
+        random_cell = rng.randrange(maze.size)
+        maze.set_visited(random_cell)
+        wall_list = []
+        wall_list += maze.get_closed_walls(
+            random_cell
+        )  # Merging both lists (reminder: [1, 2] + [3, 4] = [1, 2, 3, 4])
 
-                # Determining vertical connections and appending newly connected cell to the corresponding sets
-                random_vertical_connection = random.randint(0, len(sets[i]) - 1)
-                chosen_cell = sets[i][random_vertical_connection]
-                chosen_cell.open_wall_with(chosen_cell.bottom_cell)
-                sets[i].append(chosen_cell.bottom_cell)
+        if emit:
+            yield ((events.CELL_VISITED, random_cell),) + MazeGenerator._frontier_of(
+                maze, random_cell
+            )
 
-                for j in range(0, len(sets[i]) - 1):
-                    sets[i][j].set_visited(True)
+        visited_cells_between_wall = []
 
-                    # Opening the walls between adjacent cells in same set
-                    if len(sets[i]) > 1:
-                        sets[i][j].open_wall_with(sets[i][j + 1])
+        while len(wall_list) > 0:
+            # Swapping the chosen wall with the last one so it can be popped in O(1)
+            random_index = rng.randrange(len(wall_list))
+            random_wall = wall_list[random_index]
+            wall_list[random_index] = wall_list[-1]
+            wall_list.pop()
+            wall_cells = maze.get_wall_cells(random_wall)
+            visited_cells_between_wall = [
+                cell for cell in wall_cells if maze.visited[cell]
+            ]
 
-                    if Window.GENERATE_ANIMATION:
-                        MazeDrawer.colorize_all_cells(
-                            [cell for cell in maze.cells[row_number] if cell.is_visited]
-                        )
-                        MazeDrawer.colorize_cell(
-                            sets[i][0], imposed_color=vc.Color.BLUE, priority=1
-                        )
-                        MazeDrawer.refresh_drawing_on_screen(maze)
+            for cell in visited_cells_between_wall:
+                maze.used_but_not_visited(cell)
 
-            row_number += 1
+            if len(visited_cells_between_wall) == 1:
+                maze.open_wall(*wall_cells)
+                maze.set_visited(wall_cells[0])
+                maze.set_visited(wall_cells[1])
+                wall_list += maze.get_closed_walls(wall_cells[0])
+                wall_list += maze.get_closed_walls(wall_cells[1])
+
+                if emit:
+                    new_cell = (
+                        wall_cells[0]
+                        if visited_cells_between_wall[0] == wall_cells[1]
+                        else wall_cells[1]
+                    )
+                    yield (
+                        (events.WALL_OPENED, *wall_cells),
+                        (events.CELL_VISITED, new_cell),
+                    ) + MazeGenerator._frontier_of(maze, new_cell)
 
-        # Handling last row
-        sets = [cell for cell in maze.cells[-1]]
+    @staticmethod
+    def _frontier_of(maze: m.Maze, cell: int) -> tuple:
+        """FRONTIER_PUSH events of the cells next to the given one that are not in the maze yet"""
+        return tuple(
+            (events.FRONTIER_PUSH, neighbor)
+            for neighbor in maze.get_unvisited_neighbors(cell)
+        )
 
-        # Joining ALL adjacent sets of cells
-        for i in range(0, maze.width - 1):
-            sets[i].set_visited(True)
+    @staticmethod
+    @register(ALGORITHMS)
+    @animated("GENERATE_ANIMATION")
+    def aldous_broder(maze: m.Maze, rng: random.Random = None, emit: bool = False):
+        rng = rng or random
+        current_cell = rng.randrange(maze.size)
+        maze.set_visited(current_cell)
+        remaining_cells = maze.size - 1
+
+        if emit:
+            yield ((events.CELL_VISITED, current_cell), (events.CURRENT_CELL, current_cell))
+
+        while remaining_cells > 0:
+            random_neighbor = rng.choice(maze.get_neighbors(current_cell))
+
+            if not maze.visited[random_neighbor]:
+                maze.open_wall(current_cell, random_neighbor)
+                maze.set_visited(random_neighbor)
+                remaining_cells -= 1
+
+                if emit:
+                    yield (
+                        (events.WALL_OPENED, current_cell, random_neighbor),
+                        (events.CELL_VISITED, random_neighbor),
+                        (events.CURRENT_CELL, random_neighbor),
+                    )
+            else:
+                maze.used_but_not_visited(current_cell)
 
-            # Opening the walls between adjacent cells in same set
-            if i < maze.width:
-                sets[i].open_wall_with(sets[i + 1])
+                if emit:
+                    yield ((events.CURRENT_CELL, random_neighbor),)
 
-            if Window.GENERATE_ANIMATION:
-                MazeDrawer.colorize_all_cells(
-                    [cell for cell in maze.cells[-1] if cell.is_visited]
-                )
-                MazeDrawer.colorize_cell(
-                    sets[i], imposed_color=vc.Color.BLUE, priority=1
-                )
-                MazeDrawer.refresh_drawing_on_screen(maze)
+            current_cell = random_neighbor
 
     @staticmethod
-    def hunt_and_kill(maze: m.Maze) -> None:
-        current_cell = maze.cells[0][0]
+    @register(ALGORITHMS)
+    @animated("GENERATE_ANIMATION")
+    def eller(maze: m.Maze, rng: random.Random = None, emit: bool = False):
+        rng = rng or random
+        import maze.streaming as streaming  # Loaded with its command line only when needed
+
+        rows = streaming.eller_rows(maze.width, maze.height, rng)
+
+        for row_start, walls in zip(range(0, maze.size, maze.width), rows):
+            row = range(row_start, row_start + maze.width)
+            maze.walls[row_start : row_start + maze.width] = walls
+            maze.walls_version += 1
+
+            for cell in row:
+                maze.set_visited(cell)
+
+            if emit:
+                step = [(events.CURRENT_CELL, row_start)]
+                for cell in row:
+                    step.append((events.CELL_VISITED, cell))
+                    if maze.walls[cell] & m.OPEN_EAST:
+                        step.append((events.WALL_OPENED, cell, cell + 1))
+                    if maze.walls[cell] & m.OPEN_SOUTH:
+                        step.append((events.WALL_OPENED, cell, cell + maze.width))
+                yield tuple(step)
 
-        while maze.has_unvisited_cells():
-            current_cell.set_visited(True)
+    @staticmethod
+    @register(ALGORITHMS)
+    @animated("GENERATE_ANIMATION")
+    def hunt_and_kill(maze: m.Maze, rng: random.Random = None, emit: bool = False):
+        rng = rng or random
+        current_cell = 0
+
+        # Number of unvisited cells, overall and per row, so the hunt can resume from the first
+        # row that still has some instead of scanning the whole maze again
+        remaining_cells = maze.size
+        unvisited_in_row = array("l", [maze.width]) * maze.height
+        hunted_row = 0
+
+        if emit:
+            yield ((events.CELL_VISITED, current_cell), (events.CURRENT_CELL, current_cell))
+
+        while remaining_cells > 0:
+            maze.set_visited(current_cell)
+            remaining_cells -= 1
+            unvisited_in_row[current_cell // maze.width] -= 1
 
             # Performing a random walk until no neighbor is found
-            while current_cell.has_unvisited_neighbor():
-                if not current_cell.is_visited:
-                    current_cell.set_visited(True)
+            unvisited_neighbors = maze.get_unvisited_neighbors(current_cell)
+            while len(unvisited_neighbors) > 0:
+                random_neighbor = rng.choice(unvisited_neighbors)
+                maze.open_wall(current_cell, random_neighbor)
+
+                if emit:
+                    yield (
+                        (events.WALL_OPENED, current_cell, random_neighbor),
+                        (events.CELL_VISITED, random_neighbor),
+                        (events.CURRENT_CELL, random_neighbor),
+                    )
 
-                random_neighbor = random.choice(current_cell.get_unvisited_neighbors())
-                current_cell.open_wall_with(random_neighbor)
                 current_cell = random_neighbor
 
-                if Window.GENERATE_ANIMATION:
-                    MazeDrawer.colorize_all_cells(
-                        [cell for cell in maze.get_cells() if cell.is_visited]
-                    )
-                    MazeDrawer.colorize_cell(
-                        current_cell, imposed_color=vc.Color.BLUE, priority=1
+                # Marked right away, otherwise the hunt could pick the end of the walk again and
+                # open a second wall around it (making a loop)
+                maze.set_visited(current_cell)
+                remaining_cells -= 1
+                unvisited_in_row[current_cell // maze.width] -= 1
+
+                unvisited_neighbors = maze.get_unvisited_neighbors(current_cell)
+
+            # Look for the first unvisited cell (which is adjacent to a visited cell), starting
+            # from the first row that still has some
+            while hunted_row < maze.height and unvisited_in_row[hunted_row] == 0:
+                hunted_row += 1
+
+            if hunted_row < maze.height:
+                row_start = maze.get_index(hunted_row, 0)
+                current_cell = maze.visited.find(0, row_start, row_start + maze.width)
+                visited_neighbor = rng.choice(maze.get_visited_neighbors(current_cell))
+                maze.open_wall(current_cell, visited_neighbor)
+
+                if emit:
+                    yield (
+                        (events.WALL_OPENED, current_cell, visited_neighbor),
+                        (events.CELL_VISITED, current_cell),
+                        (events.CURRENT_CELL, current_cell),
                     )
-                    MazeDrawer.refresh_drawing_on_screen(maze)
-
-            # Scan the whole maze to look for an unvisited cell that is adjacent to a visited cell
-            for cell in maze.get_cells():
-                if not cell.is_visited:
-                    current_cell = cell
-                    current_cell.open_wall_with(
-                        random.choice(current_cell.get_visited_neighbors())
-                    )
-                    if Window.GENERATE_ANIMATION:
-                        MazeDrawer.colorize_all_cells(
-                            [c for c in maze.get_cells() if c.is_visited]
-                        )
-                        MazeDrawer.colorize_cell(
-                            current_cell, imposed_color=vc.Color.BLUE, priority=1
-                        )
-                        MazeDrawer.colorize_all_cells(
-                            [
-                                c
-                                for c in maze.cells[
-                                    maze.get_flat_coords(current_cell)[0]
-                                ]
-                                if maze.get_flat_coords(c)[1]
-                                <= maze.get_flat_coords(current_cell)[1]
-                            ],
-                            imposed_color=vc.Color.GREEN,
-                            priority=2,
-                        )
-                        MazeDrawer.refresh_drawing_on_screen(maze)
-
-                    break
 
     @staticmethod
-    def binary_tree(maze: m.Maze) -> None:
-        for cell in maze.get_cells():
-            top_and_left_neighbors = [cell.top_cell, cell.left_cell]
+    @register(ALGORITHMS)
+    @animated("GENERATE_ANIMATION")
+    def binary_tree(maze: m.Maze, rng: random.Random = None, emit: bool = False):
+        rng = rng or random
+        for cell in range(maze.size):
+            top_and_left_neighbors = [maze.get_top(cell), maze.get_left(cell)]
             top_and_left_neighbors = list(
                 filter(lambda x: x is not None, top_and_left_neighbors)
             )
@@ -353,243 +431,586 @@ class MazeGenerator:
             if len(top_and_left_neighbors) == 0:
                 continue
 
-            toss_coin = random.randint(0, len(top_and_left_neighbors) - 1)
-            cell.open_wall_with(top_and_left_neighbors[toss_coin])
+            toss_coin = rng.randint(0, len(top_and_left_neighbors) - 1)
+            maze.open_wall(cell, top_and_left_neighbors[toss_coin])
 
-            if Window.GENERATE_ANIMATION:
-                MazeDrawer.colorize_cell(cell, imposed_color=vc.Color.BLUE, priority=1)
-                MazeDrawer.refresh_drawing_on_screen(maze)
+            if emit:
+                yield (
+                    (events.WALL_OPENED, cell, top_and_left_neighbors[toss_coin]),
+                    (events.CURRENT_CELL, cell),
+                )
 
     @staticmethod
-    def sidewinder(maze: m.Maze) -> None:
+    @register(ALGORITHMS)
+    @animated("GENERATE_ANIMATION")
+    def sidewinder(maze: m.Maze, rng: random.Random = None, emit: bool = False):
+        rng = rng or random
         run_set = []
 
-        for cell in maze.get_cells():
+        for cell in range(maze.size):
+            top_cell = maze.get_top(cell)
+            right_cell = maze.get_right(cell)
 
             # First row case
-            if cell.top_cell is None and cell.right_cell is not None:
-                cell.open_wall_with(cell.right_cell)
+            if top_cell is None and right_cell is not None:
+                maze.open_wall(cell, right_cell)
+
+                if emit:
+                    yield ((events.WALL_OPENED, cell, right_cell), (events.CURRENT_CELL, cell))
                 continue
-            elif cell.top_cell is None and cell.right_cell is None:
+            elif top_cell is None and right_cell is None:
                 continue
 
             # First case of each row
-            if cell.left_cell is None:
+            if maze.get_left(cell) is None:
                 run_set = [cell]
 
             # Other cells of each row
-            if random.getrandbits(1):
-                if cell.right_cell is not None:
-                    cell.open_wall_with(cell.right_cell)
-                    run_set.append(cell.right_cell)
+            if rng.getrandbits(1):
+                if right_cell is not None:
+                    opened_wall = (cell, right_cell)
+                    run_set.append(right_cell)
                 else:
-                    chosen_cell = random.choice(run_set)
-                    chosen_cell.open_wall_with(chosen_cell.top_cell)
+                    chosen_cell = rng.choice(run_set)
+                    opened_wall = (chosen_cell, maze.get_top(chosen_cell))
             else:
-                chosen_cell = random.choice(run_set)
-                chosen_cell.open_wall_with(chosen_cell.top_cell)
-                last_cell = run_set[-1].right_cell
+                chosen_cell = rng.choice(run_set)
+                opened_wall = (chosen_cell, maze.get_top(chosen_cell))
+                last_cell = maze.get_right(run_set[-1])
                 run_set = [last_cell]
+            maze.open_wall(*opened_wall)
 
             # Visual
-            if Window.GENERATE_ANIMATION:
-                MazeDrawer.colorize_cell(cell, imposed_color=vc.Color.BLUE, priority=1)
-                MazeDrawer.refresh_drawing_on_screen(maze)
+            if emit:
+                yield ((events.WALL_OPENED, *opened_wall), (events.CURRENT_CELL, cell))
+
+    @staticmethod
+    @register(ALGORITHMS)
+    @animated("GENERATE_ANIMATION")
+    def wilson(maze: m.Maze, rng: random.Random = None, emit: bool = False):
+        """Wilson's algorithm: loop-erased random walks from each cell outside of the maze
+        until they reach it
+
+        Args:
+            maze (Maze): An untouched maze object to be built upon
+            rng (random.Random, optional): Source of randomness, the random module if None.
+            Defaults to None.
+            emit (bool, optional): Yields the events of each step (see maze.events). Defaults to False.
+        """
+        rng = rng or random
+        # Last exit taken from each cell during the current walk, so loops get erased by
+        # simply overwriting it when the walk comes back on its steps
+        next_cell = array("q", bytes(8 * maze.size))
+
+        first_cell = rng.randrange(maze.size)
+        maze.set_visited(first_cell)
+        remaining_cells = maze.size - 1
+        walk_start = 0
+
+        if emit:
+            yield ((events.CELL_VISITED, first_cell),)
+
+        while remaining_cells > 0:
+            walk_start = maze.visited.find(0, walk_start)
+
+            # Walking randomly until the maze is reached
+            current_cell = walk_start
+            while not maze.visited[current_cell]:
+                random_neighbor = rng.choice(maze.get_neighbors(current_cell))
+                next_cell[current_cell] = random_neighbor
+                current_cell = random_neighbor
+
+                if emit:
+                    yield ((events.CURRENT_CELL, current_cell),)
+
+            # Carving the loop-erased walk into the maze
+            step = []
+            current_cell = walk_start
+            while not maze.visited[current_cell]:
+                maze.set_visited(current_cell)
+                maze.open_wall(current_cell, next_cell[current_cell])
+
+                if emit:
+                    step.append((events.CELL_VISITED, current_cell))
+                    step.append((events.WALL_OPENED, current_cell, next_cell[current_cell]))
+
+                current_cell = next_cell[current_cell]
+                remaining_cells -= 1
+
+            if emit:
+                yield tuple(step)
 
 
 class MazeSolver:
-    ALGORITHMS = []
+    ALGORITHMS = {}  # Name -> algorithm, filled by register as the algorithms are defined
+    HEURISTIC = heuristics.manhattan  # Default heuristic of A*
+    CONTRACT_CORRIDORS = False  # A* and Dijkstra search the junction graph of the maze if True
 
-    def __init__(self, num: int):
-        self.num = num
+    def __init__(self, algorithm):
+        """Runs one of the solving algorithms of ALGORITHMS
 
-        # This block of code allows me to retreive every method of this class (except the "system" and hidden ones)
-        MazeSolver.ALGORITHMS = {
-            method_name.title().replace("_", " "): getattr(self, method)
-            for method_name, method in zip(dir(self), dir(self))
-            if callable(getattr(self, method_name))
-            and not method_name.startswith("_")
-            and method_name.lower() != "solve"
-        }
+        Args:
+            algorithm (int | str): Position of the algorithm in ALGORITHMS, or its name (e.g.
+            "a_star")
 
-        self.algorithm = list(MazeSolver.ALGORITHMS.values())[num]
+        Raises:
+            ValueError: If there is no algorithm with this name
+        """
+        names = list(MazeSolver.ALGORITHMS)
+        if isinstance(algorithm, str):
+            self.algorithm = get_algorithm(MazeSolver, algorithm)
+            self.num = names.index(algorithm)
+        else:
+            self.num = algorithm
+            self.algorithm = MazeSolver.ALGORITHMS[names[algorithm]]
+        self.name = names[self.num]
+        self.last_stats = None  # Statistics of the last solving, if asked for
+
+    def solve(
+        self,
+        maze: m.Maze,
+        stats: bool = False,
+        profile: bool = False,
+        trace_memory: bool = False,
+    ) -> list[m.Cell]:
+        """Solves the maze with the chosen algorithm
+
+        Args:
+            maze (Maze): A generated maze
+            stats (bool, optional): Gathers the statistics of the run into last_stats (see
+            maze.stats). Defaults to False.
+            profile (bool, optional): Also profiles the run with cProfile. Defaults to False.
+            trace_memory (bool, optional): Also traces its memory allocations. Defaults to False.
+
+        Returns:
+            list[Cell]: The path found
+        """
+        if stats or profile or trace_memory:
+            import maze.stats as run_stats  # Only loaded when asked for
 
-    def solve(self, maze: m.Maze) -> list[m.Cell]:
-        res = self.algorithm(maze)
+            self.last_stats = run_stats.measure(
+                self.algorithm, maze, profile=profile, trace_memory=trace_memory
+            )
+            res = self.last_stats.result
+        else:
+            res = self.algorithm(maze)
         maze.is_solved = True
         return res
 
     @staticmethod
-    def __reconstruct_path(cameFrom: dict, current: m.Cell) -> list[m.Cell]:
-        total_path = [current]
-        while current in cameFrom.keys():
+    def __reconstruct_path(maze: m.Maze, cameFrom, current: int) -> list[m.Cell]:
+        """Walks back the parents from the given cell up to the start
+
+        Args:
+            maze (Maze): The maze being solved
+            cameFrom (dict | array): Parent of each reached cell, None or -1 for the start
+            current (int): The cell to walk back from
+
+        Returns:
+            list[Cell]: The path from the start to the given cell
+        """
+        total_path = []
+        while current is not None and current != -1:
+            total_path.append(current)
             current = cameFrom[current]
-            total_path.insert(0, current)
-        return total_path
+        total_path.reverse()
+        return maze.cells_of(total_path)
 
     @staticmethod
-    def __heuristic(c1: m.Cell, c2: m.Cell) -> int:
-        return abs(c1.x - c2.x) + abs(c1.y - c2.y)  # Manhattan distance
+    def __search_junctions(maze: m.Maze, heuristic=None, emit: bool = False):
+        """Searches the junction graph of the maze (built once then cached on it), only junctions
+        and dead ends being expanded, then gives the path back cell by cell
+
+        Args:
+            maze (Maze): The maze being solved
+            heuristic (function, optional): Estimation of the distance between two cells, Dijkstra
+            if None. Defaults to None.
+            emit (bool, optional): Yields the events of each step, about the nodes of the graph
+            (see maze.events). Defaults to False.
+
+        Returns:
+            list[Cell]: The shortest path found
+        """
+        graph = maze.get_junction_graph()
+        path = maze.cells_of((yield from graph.search_steps(heuristic, emit)))
+        if emit and len(path) > 0:
+            yield ((events.PATH_FOUND, [cell.id for cell in path]),)
+        return path
 
     @staticmethod
-    def a_star(maze: m.Maze) -> list[m.Cell]:
+    @register(ALGORITHMS)
+    @animated("SOLVE_ANIMATION")
+    def a_star(maze: m.Maze, heuristic=None, contracted: bool = None, emit: bool = False):
         """A* algorithm
 
         Args:
-            maze (Maze): An untouched maze object to be built upon
+            maze (Maze): A generated maze to solve
+            heuristic (function, optional): Estimation of the distance between two cells, taking
+            the maze and both cell indexes (see maze.heuristics). MazeSolver.HEURISTIC if None.
+            Defaults to None.
+            contracted (bool, optional): Searches the junction graph instead of the grid (only
+            its nodes being animated). MazeSolver.CONTRACT_CORRIDORS if None. Defaults to None.
+            emit (bool, optional): Yields the events of each step (see maze.events). Defaults to False.
 
         Returns:
             list[Cell]: The shortest path found
         """
+        if heuristic is None:
+            heuristic = MazeSolver.HEURISTIC
+        if contracted is None:
+            contracted = MazeSolver.CONTRACT_CORRIDORS
+        if contracted:
+            return (yield from MazeSolver.__search_junctions(maze, heuristic, emit))
 
-        start = maze.cells[0][0]
-        goal = maze.cells[-1][-1]
+        start = maze.start
+        goal = maze.end
 
-        closedSet = set()
-        openSet = {start}
-        cameFrom = {}
-        gScore = {start: 0}
-        fScore = {start: MazeSolver.__heuristic(start, goal)}
+        # Outdated entries of the open set are not removed from the heap but skipped once popped
+        closedSet = bytearray(maze.size)
+        openSet = [(heuristic(maze, start, goal), start)]
+        cameFrom = array("q", [-1]) * maze.size
+        gScore = array("q", [-1]) * maze.size
+        gScore[start] = 0
+
+        # Pops of the outdated entries skipped since the last step, shown with the next one
+        skipped = []
+
+        if emit:
+            yield ((events.FRONTIER_PUSH, start),)
 
         while len(openSet) > 0:
-            current = min(openSet, key=lambda x: fScore[x])
+            current = heapq.heappop(openSet)[1]
+            if closedSet[current]:
+                if emit:
+                    skipped.append((events.FRONTIER_POP, current))
+                continue
             if current == goal:
-                return MazeSolver.__reconstruct_path(cameFrom, current)
+                path = MazeSolver.__reconstruct_path(maze, cameFrom, current)
+                if emit:
+                    yield tuple(skipped) + (
+                        (events.FRONTIER_POP, current),
+                        (events.PATH_FOUND, [cell.id for cell in path]),
+                    )
+                return path
 
-            openSet.remove(current)
-            closedSet.add(current)
+            closedSet[current] = 1
+            if emit:
+                step = skipped + [(events.FRONTIER_POP, current), (events.CURRENT_CELL, current)]
+                skipped = []
 
-            for neighbor in current.get_neighbors_according_to_walls():
-                if neighbor in closedSet:
+            for neighbor in maze.get_open_neighbors(current):
+                if closedSet[neighbor]:
                     continue
 
                 tentative_gScore = gScore[current] + 1
-                if neighbor not in openSet:
-                    openSet.add(neighbor)
-                elif tentative_gScore >= gScore[neighbor]:
+                if gScore[neighbor] != -1 and tentative_gScore >= gScore[neighbor]:
                     continue
 
                 cameFrom[neighbor] = current
                 gScore[neighbor] = tentative_gScore
-                fScore[neighbor] = gScore[neighbor] + MazeSolver.__heuristic(
-                    neighbor, goal
+                heapq.heappush(
+                    openSet,
+                    (tentative_gScore + heuristic(maze, neighbor, goal), neighbor),
                 )
 
-                if Window.SOLVE_ANIMATION:
-                    MazeDrawer.colorize_cell(
-                        current, imposed_color=vc.Color.BLUE, priority=3
-                    )
-                    MazeDrawer.colorize_all_cells(
-                        list(closedSet),
-                        imposed_color=vc.Color.GREEN,
-                        priority=2,
-                    )
-                    MazeDrawer.colorize_all_cells(
-                        list(openSet),
-                        imposed_color=vc.Color.YELLOW,
-                        priority=2,
-                    )
-                    MazeDrawer.refresh_drawing_on_screen(maze)
+                if emit:
+                    step.append((events.FRONTIER_PUSH, neighbor))
 
+            if emit:
+                yield tuple(step)
+
+        if emit and len(skipped) > 0:
+            yield tuple(skipped)
         return []
 
     @staticmethod
-    def breadth_first_search(maze: m.Maze) -> list[m.Cell]:
+    @register(ALGORITHMS)
+    @animated("SOLVE_ANIMATION")
+    def bidirectional_breadth_first_search(maze: m.Maze, emit: bool = False):
+        """Breadth-first search from both the start and the goal, one level at a time on the
+        smallest side, until both searches meet
+
+        Args:
+            maze (Maze): A generated maze to solve
+            emit (bool, optional): Yields the events of each step (see maze.events). Defaults to False.
+
+        Returns:
+            list[Cell]: The shortest path found
+        """
+        start = maze.start
+        goal = maze.end
+
+        # Distance and parent of each cell reached from the start (index 0) and from the goal (1)
+        distances = (array("q", [-1]) * maze.size, array("q", [-1]) * maze.size)
+        came_from = (array("q", [-1]) * maze.size, array("q", [-1]) * maze.size)
+        frontiers = ([start], [goal])
+        distances[0][start] = 0
+        distances[1][goal] = 0
+
+        if emit:
+            yield ((events.FRONTIER_PUSH, start), (events.FRONTIER_PUSH, goal))
+
+        meeting_cell = start if start == goal else -1
+
+        while meeting_cell == -1 and len(frontiers[0]) > 0 and len(frontiers[1]) > 0:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            distance, other_distance = distances[side], distances[1 - side]
+            next_frontier = []
+            best_length = -1
+
+            # The whole level is expanded so that the shortest of the meetings is kept
+            for current in frontiers[side]:
+                if emit:
+                    step = [(events.FRONTIER_POP, current), (events.CURRENT_CELL, current)]
+
+                for neighbor in maze.get_open_neighbors(current):
+                    if distance[neighbor] != -1:
+                        continue
+
+                    distance[neighbor] = distance[current] + 1
+                    came_from[side][neighbor] = current
+                    next_frontier.append(neighbor)
+
+                    if emit:
+                        step.append((events.FRONTIER_PUSH, neighbor))
+
+                    if other_distance[neighbor] != -1:
+                        length = distance[neighbor] + other_distance[neighbor]
+                        if best_length == -1 or length < best_length:
+                            best_length = length
+                            meeting_cell = neighbor
+
+                if emit:
+                    yield tuple(step)
+
+            frontiers = (
+                (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+            )
+
+        if meeting_cell == -1:
+            return []
+
+        path = MazeSolver.__reconstruct_path(maze, came_from[0], meeting_cell)
+        current = came_from[1][meeting_cell]
+        while current != -1:
+            path.append(maze.cell(current))
+            current = came_from[1][current]
+
+        if emit:
+            yield ((events.PATH_FOUND, [cell.id for cell in path]),)
+        return path
+
+    @staticmethod
+    @register(ALGORITHMS)
+    @animated("SOLVE_ANIMATION")
+    def breadth_first_search(maze: m.Maze, emit: bool = False):
         """Breadth-first search algorithm
 
         Args:
-            maze (Maze): An untouched maze object to be built upon
+            maze (Maze): A generated maze to solve
+            emit (bool, optional): Yields the events of each step (see maze.events). Defaults to False.
 
         Returns:
             list[Cell]: The shortest path found
         """
         frontier = deque()
-        frontier.append(maze.cells[0][0])
+        frontier.append(maze.start)
 
         came_from = {}
-        came_from[maze.cells[0][0]] = None
+        came_from[maze.start] = None
+
+        if emit:
+            yield ((events.FRONTIER_PUSH, maze.start),)
 
         while len(frontier) > 0:
 
             current = frontier.popleft()
-            if current == maze.cells[-1][-1]:
-                return MazeSolver.__reconstruct_path(came_from, current)
+            if current == maze.end:
+                path = MazeSolver.__reconstruct_path(maze, came_from, current)
+                if emit:
+                    yield (
+                        (events.FRONTIER_POP, current),
+                        (events.PATH_FOUND, [cell.id for cell in path]),
+                    )
+                return path
 
-            for neighbor in current.get_neighbors_according_to_walls():
+            if emit:
+                step = [(events.FRONTIER_POP, current), (events.CURRENT_CELL, current)]
 
-                if neighbor not in came_from.keys():
+            for neighbor in maze.get_open_neighbors(current):
+
+                if neighbor not in came_from:
                     frontier.append(neighbor)
                     came_from[neighbor] = current
 
-                    if Window.SOLVE_ANIMATION:
-                        MazeDrawer.colorize_all_cells(
-                            list(came_from.keys()),
-                            imposed_color=vc.Color.YELLOW,
-                            priority=2,
-                        )
-                        MazeDrawer.colorize_all_cells(
-                            [cell for cell in frontier] + [current],
-                            imposed_color=vc.Color.BLUE,
-                            priority=3,
-                        )
-                        MazeDrawer.refresh_drawing_on_screen(maze)
+                    if emit:
+                        step.append((events.FRONTIER_PUSH, neighbor))
+
+            if emit:
+                yield tuple(step)
+
         return []
 
     @staticmethod
-    def dijkstra(maze: m.Maze) -> list[m.Cell]:
+    @register(ALGORITHMS)
+    @animated("SOLVE_ANIMATION")
+    def dead_end_filling(maze: m.Maze, emit: bool = False):
+        """Dead-end filling on NumPy arrays: every dead end (cell with a single opening) is filled,
+        which may turn its neighbor into a new dead end, until only the solution remains. Meant
+        for perfect mazes, where what remains is exactly the path (loops would also be left)
+
+        Args:
+            maze (Maze): A generated maze to solve
+            emit (bool, optional): Yields the events of each step (see maze.events), one step per
+            round of filling. Defaults to False.
+
+        Returns:
+            list[Cell]: The shortest path found
+        """
+        import numpy as np  # Only needed by this solver
+
+        start = maze.start
+        goal = maze.end
+        width = maze.width
+
+        walls = maze.walls
+        if not isinstance(walls, bytearray):
+            # Packed walls (see maze.maze_file.MappedMaze) are unpacked, like every other array
+            # of this solver they take one byte or more per cell
+            walls = bytes(walls)
+        walls = np.frombuffer(walls, dtype=np.uint8)
+        opened_east = (walls & m.OPEN_EAST).astype(bool)
+        opened_south = (walls & m.OPEN_SOUTH).astype(bool)
+        has_left = np.arange(maze.size) % width != 0
+
+        # Number of opened walls of each cell, the west and north ones being owned by the neighbors
+        degree = opened_east.astype(np.int32) + opened_south
+        degree[1:] += opened_east[:-1]
+        degree[width:] += opened_south[:-width]
+
+        filled = np.zeros(maze.size, dtype=bool)
+        kept = np.zeros(maze.size, dtype=bool)
+        kept[[start, goal]] = True
+        last_position = np.empty(maze.size, dtype=np.intp)
+
+        # Only the newest dead ends are looked at on each round, so each cell is handled once
+        dead_ends = np.flatnonzero((degree <= 1) & ~kept)
+
+        while dead_ends.size > 0:
+            filled[dead_ends] = True
+
+            if emit:
+                yield tuple((events.CELL_FILLED, cell) for cell in dead_ends.tolist())
+
+            left = dead_ends[has_left[dead_ends]] - 1
+            top = dead_ends[dead_ends >= width] - width
+            neighbors = np.concatenate(
+                (
+                    dead_ends[opened_east[dead_ends]] + 1,
+                    left[opened_east[left]],
+                    dead_ends[opened_south[dead_ends]] + width,
+                    top[opened_south[top]],
+                )
+            )
+            neighbors = neighbors[~filled[neighbors]]
+
+            # A cell may be the neighbor of several dead ends: one occurrence of each is found
+            # without sorting, by writing positions and keeping the one that stayed
+            positions = np.arange(neighbors.size)
+            last_position[neighbors] = positions
+            is_unique = last_position[neighbors] == positions
+            unique_neighbors = neighbors[is_unique]
+            degree[unique_neighbors] -= 1
+            np.subtract.at(degree, neighbors[~is_unique], 1)
+
+            dead_ends = unique_neighbors[
+                (degree[unique_neighbors] <= 1) & ~kept[unique_neighbors]
+            ]
+
+        # Only the path is left (plus loops, if any), a breadth-first search walks it in order
+        frontier = deque([start])
+        came_from = {start: None}
+        while len(frontier) > 0:
+            current = frontier.popleft()
+            if current == goal:
+                path = MazeSolver.__reconstruct_path(maze, came_from, current)
+                if emit:
+                    yield ((events.PATH_FOUND, [cell.id for cell in path]),)
+                return path
+            for neighbor in maze.get_open_neighbors(current):
+                if not filled[neighbor] and neighbor not in came_from:
+                    came_from[neighbor] = current
+                    frontier.append(neighbor)
+
+        return []
+
+    @staticmethod
+    @register(ALGORITHMS)
+    @animated("SOLVE_ANIMATION")
+    def dijkstra(maze: m.Maze, contracted: bool = None, emit: bool = False):
         """Dijkstra algorithm
 
         Args:
-            maze (Maze): An untouched maze object to be built upon
+            maze (Maze): A generated maze to solve
+            contracted (bool, optional): Searches the junction graph instead of the grid (only
+            its nodes being animated). MazeSolver.CONTRACT_CORRIDORS if None. Defaults to None.
+            emit (bool, optional): Yields the events of each step (see maze.events). Defaults to False.
 
         Returns:
             list[Cell]: The shortest path found
         """
-        
+        if contracted is None:
+            contracted = MazeSolver.CONTRACT_CORRIDORS
+        if contracted:
+            return (yield from MazeSolver.__search_junctions(maze, emit=emit))
+
         pq = []  # min-heap priority queue
-        start = maze.cells[0][0]
-        goal = maze.cells[-1][-1]
-        
+        start = maze.start
+        goal = maze.end
+        distance = maze.distance
+
         came_from = {}
-        came_from[maze.cells[0][0]] = None
-        
+        came_from[start] = None
+
         # Setting every node distance to infinity
-        for cell in maze.get_cells():
-            cell.distance = float("inf")
-           
-        # Start to 0 
-        start.distance = 0
-        
+        distance[:] = array("d", [float("inf")]) * maze.size
+
+        # Start to 0
+        distance[start] = 0
+
         # maintain min-heap invariant (minimum d Vertex at list index 0)
-        heapq.heappush(pq, (start.distance, start))
-        
+        heapq.heappush(pq, (distance[start], start))
+
+        if emit:
+            yield ((events.FRONTIER_PUSH, start),)
+
         while len(pq) > 0:
             current = heapq.heappop(pq)[1]
             if current == goal:
-                return MazeSolver.__reconstruct_path(came_from, current)
-            
-            for neighbor in current.get_neighbors_according_to_walls():
-                if neighbor.distance > current.distance + 1:
-                    neighbor.distance = current.distance + 1
+                path = MazeSolver.__reconstruct_path(maze, came_from, current)
+                if emit:
+                    yield (
+                        (events.FRONTIER_POP, current),
+                        (events.PATH_FOUND, [cell.id for cell in path]),
+                    )
+                return path
+
+            if emit:
+                step = [(events.FRONTIER_POP, current), (events.CURRENT_CELL, current)]
+
+            for neighbor in maze.get_open_neighbors(current):
+                if distance[neighbor] > distance[current] + 1:
+                    distance[neighbor] = distance[current] + 1
                     came_from[neighbor] = current
-                    heapq.heappush(pq, (neighbor.distance, neighbor))
-                    
-                    if Window.SOLVE_ANIMATION:
-                        MazeDrawer.colorize_all_cells(
-                            list(came_from.keys()),
-                            imposed_color=vc.Color.YELLOW,
-                            priority=2,
-                        )
-                        MazeDrawer.colorize_all_cells(
-                            [cell[1] for cell in pq] + [current],
-                            imposed_color=vc.Color.BLUE,
-                            priority=3,
-                        )
-                        MazeDrawer.refresh_drawing_on_screen(maze)
+                    heapq.heappush(pq, (distance[neighbor], neighbor))
+
+                    if emit:
+                        step.append((events.FRONTIER_PUSH, neighbor))
+
+            if emit:
+                yield tuple(step)
+
         return []
-        
-            
-        
 
 
 class Window:
@@ -601,8 +1022,17 @@ class Window:
     CLOCK = None
     GENERATE_ANIMATION = True
     SOLVE_ANIMATION = True
+    SHOW_STATS = False  # Prints the statistics of each run (see maze.stats)
 
     def __init__(self):
+        global pygame, keyboard
+        import pygame
+
+        try:
+            import keyboard
+        except (ImportError, OSError):
+            keyboard = None  # Needs root access on Linux, the keys are then ignored
+
         pygame.init()
         Window.SCREEN = pygame.display.set_mode((Window.WIDTH, Window.HEIGHT))
         Window.SCREEN.fill(vc.Color.WHITE)
@@ -648,19 +1078,45 @@ class Window:
         )
 
     @staticmethod
-    def _refresh_background() -> None:
-        Window.SCREEN.fill(vc.Color.WHITE)
+    def refresh_all(areas: list[tuple] = None) -> None:
+        """Shows what was drawn on the screen
 
-    @staticmethod
-    def refresh_all() -> None:
+        Args:
+            areas (list[tuple], optional): Rectangles that changed, the whole screen if None.
+            Defaults to None.
+        """
         pygame.event.pump()
-        pygame.display.update()
-        pygame.display.flip()
-        Window._refresh_background()
+        if areas is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(areas)
 
 
 class MazeDrawer(Window):
     CELL_SIZE = -1
+    ORIGIN_X = 0  # Left of the maze on the screen, so it is centered
+
+    # Off-screen surface holding the background and the walls, only redrawn where a wall changed
+    WALL_LAYER = None
+    _LAYER_MAZE = None
+    _LAYER_WALLS = None  # Copy of the walls drawn on the layer
+    _LAYER_VERSION = -1
+    _STALE_AREAS = []  # Parts of the layer redrawn since the last frame
+    _STALE_CELLS = set()
+
+    # Cell index -> list of (rect, color) drawn during the current and the previous frame
+    _FRAME = {}
+    _PREVIOUS_FRAME = {}
+
+    # Cell index -> color given by the events of the algorithm being played, kept across frames
+    _CELL_COLORS = {}
+    _CHANGED_CELLS = set()
+    EVENT_COLORS = {
+        events.CELL_VISITED: vc.Color.YELLOW,
+        events.FRONTIER_PUSH: vc.Color.BLUE,
+        events.FRONTIER_POP: vc.Color.GREEN,
+        events.CELL_FILLED: vc.Color.YELLOW,
+    }
 
     def __init__(
         self, maze_generator: MazeGenerator, maze_solver: MazeSolver, maze: m.Maze
@@ -669,17 +1125,29 @@ class MazeDrawer(Window):
         self.maze_generator = maze_generator
         self.maze_solver = maze_solver
         self.maze = maze
-
-        MazeDrawer.CELL_SIZE = min(
-            (Window.HEIGHT - 100) / maze.height, (Window.WIDTH - 100) / maze.width
-        )  # Width and height of the cell
+        MazeDrawer.fit_to_window(maze)
 
         self.final_res = []
 
         pygame.display.set_caption(
-            f"Gen: {list(MazeGenerator.ALGORITHMS.keys())[self.maze_generator.num]} - Solve: {list(MazeSolver.ALGORITHMS.keys())[self.maze_solver.num]}"
+            f"Gen: {get_title(maze_generator.name)} - Solve: {get_title(maze_solver.name)}"
         )
 
+    @staticmethod
+    def fit_to_window(maze: m.Maze) -> None:
+        """Sizes the cells so the maze fits in the window, centered
+
+        Args:
+            maze (Maze): The maze to be drawn
+        """
+        # Width and height of the cell, whole pixels so walls can be redrawn one by one
+        MazeDrawer.CELL_SIZE = max(
+            1,
+            int(min((Window.HEIGHT - 100) / maze.height, (Window.WIDTH - 100) / maze.width)),
+        )
+        MazeDrawer.ORIGIN_X = int(Window.WIDTH / 2 - (maze.width * MazeDrawer.CELL_SIZE) / 2)
+        MazeDrawer._LAYER_MAZE = None
+
     @staticmethod
     def refresh_drawing_on_screen(maze: m.Maze) -> None:
         """Refreshes the drawing on screen and also does every related methods and functions to the refresh
@@ -688,16 +1156,98 @@ class MazeDrawer(Window):
             maze (Maze): The maze to be drawn on screen
         """
         Window.CLOCK.tick(Window.FPS)  # Limit FPS
-        Window.refresh_all()
-        MazeDrawer.draw_maze(maze)
+        MazeDrawer.render(maze)
         Window.handle_quit_keyboard()
         Window.handle_speed_keys()
 
     @staticmethod
-    def _draw_line(
-        start_coords: tuple, end_coords: tuple, color: vc.Color = vc.Color.BLACK
-    ) -> None:
-        pygame.draw.line(Window.SCREEN, color, start_coords, end_coords)
+    def render(maze: m.Maze) -> None:
+        """Draws the current frame on screen, without waiting for the clock nor the keyboard
+
+        Args:
+            maze (Maze): The maze to be drawn on screen
+        """
+        MazeDrawer.draw_maze(maze)
+        MazeDrawer._render_frame()
+
+    @staticmethod
+    def maze_area(maze: m.Maze) -> tuple:
+        """Rectangle of the screen taken by the maze, walls included
+
+        Args:
+            maze (Maze): The maze drawn on screen
+
+        Returns:
+            tuple: The rectangle (x, y, width, height)
+        """
+        x = max(0, MazeDrawer.ORIGIN_X)
+        width = min(maze.width * MazeDrawer.CELL_SIZE + 1, Window.WIDTH - x)
+        height = min(maze.height * MazeDrawer.CELL_SIZE + 1, Window.HEIGHT)
+        return (x, 0, width, height)
+
+    @staticmethod
+    def play(maze: m.Maze, steps: Generator) -> object:
+        """Animates the steps of an algorithm (see maze.events), one frame per step
+
+        Args:
+            maze (Maze): The maze the algorithm works on
+            steps (Generator): The steps of the algorithm
+
+        Returns:
+            object: What the algorithm returned (the path for the solvers)
+        """
+        MazeDrawer.clear_cell_colors()
+        try:
+            while True:
+                try:
+                    step = next(steps)
+                except StopIteration as stop:
+                    return stop.value
+
+                MazeDrawer.apply_events(maze, step)
+                MazeDrawer.refresh_drawing_on_screen(maze)
+        finally:
+            MazeDrawer.clear_cell_colors()
+
+    @staticmethod
+    def apply_events(maze: m.Maze, step: tuple, show_current: bool = True) -> None:
+        """Updates the colors of the cells from the events of a step. Opened walls need nothing,
+        they are picked up by draw_maze through the walls version of the maze
+
+        Args:
+            maze (Maze): The maze the algorithm works on
+            step (tuple): The events of the step
+            show_current (bool, optional): Highlights the current cell on the next frame (not
+            wanted when skipping steps). Defaults to True.
+        """
+        colors = MazeDrawer._CELL_COLORS
+        for event in step:
+            kind = event[0]
+            if kind in MazeDrawer.EVENT_COLORS:
+                if colors.get(event[1]) != MazeDrawer.EVENT_COLORS[kind]:
+                    colors[event[1]] = MazeDrawer.EVENT_COLORS[kind]
+                    MazeDrawer._CHANGED_CELLS.add(event[1])
+            elif kind == events.CURRENT_CELL and show_current:
+                MazeDrawer.colorize_cell(
+                    maze.cell(event[1]), imposed_color=vc.Color.BLUE, priority=1
+                )
+            elif kind == events.PATH_FOUND:
+                MazeDrawer.clear_cell_colors()
+                for cell in event[1]:
+                    colors[cell] = vc.Color.YELLOW
+                MazeDrawer._CHANGED_CELLS.update(event[1])
+
+    @staticmethod
+    def clear_cell_colors() -> None:
+        MazeDrawer._CHANGED_CELLS.update(MazeDrawer._CELL_COLORS)
+        MazeDrawer._CELL_COLORS = {}
+
+    @staticmethod
+    def _cell_position(cell: m.Cell) -> tuple[int, int]:
+        return (
+            MazeDrawer.ORIGIN_X + cell.col * MazeDrawer.CELL_SIZE,
+            cell.row * MazeDrawer.CELL_SIZE,
+        )
 
     @staticmethod
     def colorize_all_cells(
@@ -710,116 +1260,184 @@ class MazeDrawer(Window):
     def colorize_cell(
         cell: m.Cell, imposed_color: vc.Color = None, priority: int = 0
     ) -> None:
-        """Colorizes the cell according to its state"""
+        """Colorizes the cell according to its state, for the current frame only"""
         spacement = 1
 
         if cell is not None:
+            x, y = MazeDrawer._cell_position(cell)
+            length = MazeDrawer.CELL_SIZE
+            inner_rect = (x + spacement, y + spacement, length - spacement, length - spacement)
+            drawings = MazeDrawer._FRAME.setdefault(cell.id, [])
+
             if imposed_color is not None:
-                pygame.draw.rect(
-                    Window.SCREEN,
-                    imposed_color,
-                    (
-                        cell.x + spacement,
-                        cell.y + spacement,
-                        cell.length - spacement,
-                        cell.length - spacement,
-                    ),
-                )
+                drawings.append((inner_rect, imposed_color))
 
             if imposed_color is None or priority <= 0:
                 if cell.is_visited and not cell.is_start and not cell.is_end:
                     if cell.number_of_uses == 1:
-                        pygame.draw.rect(
-                            Window.SCREEN,
-                            vc.Color.YELLOW,
-                            (
-                                cell.x + spacement,
-                                cell.y + spacement,
-                                cell.length - spacement,
-                                cell.length - spacement,
-                            ),
-                        )
+                        drawings.append((inner_rect, vc.Color.YELLOW))
                     # Will be used as a trick to colorize the cell again after passing on it again
                     else:
-                        pygame.draw.rect(
-                            Window.SCREEN,
-                            vc.Color.WHITE,
-                            (
-                                cell.x + spacement,
-                                cell.y + spacement,
-                                cell.length - spacement,
-                                cell.length - spacement,
-                            ),
-                        )
+                        drawings.append((inner_rect, vc.Color.WHITE))
 
             if cell.is_start:
-                pygame.draw.rect(
-                    Window.SCREEN,
-                    vc.Color.RED,
-                    (cell.x, cell.y, cell.length, cell.length),
-                )
+                drawings.append(((x, y, length, length), vc.Color.RED))
             elif cell.is_end:
-                pygame.draw.rect(
-                    Window.SCREEN,
-                    vc.Color.GREEN,
-                    (cell.x, cell.y, cell.length, cell.length),
-                )
+                drawings.append(((x, y, length, length), vc.Color.GREEN))
 
     @staticmethod
     def draw_start_and_end_cells(maze) -> None:
         """Draws the start and end cells of the maze"""
-        cells = maze.get_cells()
-        for cell in cells:
-            if cell.is_start or cell.is_end:
-                MazeDrawer.colorize_cell(cell)
+        MazeDrawer.colorize_cell(maze.cell(maze.start))
+        MazeDrawer.colorize_cell(maze.cell(maze.end))
 
     @staticmethod
-    def draw_maze(maze: m.Maze) -> None:
-        """Draw the maze on pygame's window"""
-        center_x_start = Window.WIDTH / 2 - (maze.width * MazeDrawer.CELL_SIZE) / 2
-
-        x_coord = center_x_start
-        y_coord = 0
-
-        for x in range(0, len(maze.cells)):
-            for y in range(0, len(maze.cells[0])):
-                cell = maze.cells[x][y]
-                cell.x = x_coord
-                cell.y = y_coord
-                cell.length = MazeDrawer.CELL_SIZE
-
-                if not cell.top_wall.is_opened:
-                    MazeDrawer._draw_line(
-                        (x_coord, y_coord),
-                        (x_coord + MazeDrawer.CELL_SIZE, y_coord),
-                    )
-                if not cell.bottom_wall.is_opened:
-                    MazeDrawer._draw_line(
-                        (x_coord, y_coord + MazeDrawer.CELL_SIZE),
-                        (
-                            x_coord + MazeDrawer.CELL_SIZE,
-                            y_coord + MazeDrawer.CELL_SIZE,
-                        ),
-                    )
-                if not cell.left_wall.is_opened:
-                    MazeDrawer._draw_line(
-                        (x_coord, y_coord),
-                        (x_coord, y_coord + MazeDrawer.CELL_SIZE),
+    def _draw_wall(index: int, is_south: bool, is_opened: bool) -> tuple:
+        """Draws the east or south wall of a cell on the wall layer
+
+        Returns:
+            tuple: The rectangle of the layer covered by the wall
+        """
+        length = MazeDrawer.CELL_SIZE
+        row, col = divmod(index, MazeDrawer._LAYER_MAZE.width)
+        x = MazeDrawer.ORIGIN_X + col * length
+        y = row * length
+
+        # Corners are always black, they belong to the perpendicular walls as well
+        if is_south:
+            start = (x + 1, y + length)
+            end = (x + length - 1, y + length)
+            area = (x + 1, y + length, length - 1, 1)
+        else:
+            start = (x + length, y + 1)
+            end = (x + length, y + length - 1)
+            area = (x + length, y + 1, 1, length - 1)
+
+        if length > 1:
+            color = vc.Color.WHITE if is_opened else vc.Color.BLACK
+            pygame.draw.line(MazeDrawer.WALL_LAYER, color, start, end)
+        return area
+
+    @staticmethod
+    def _build_wall_layer(maze: m.Maze) -> None:
+        length = MazeDrawer.CELL_SIZE
+        left = MazeDrawer.ORIGIN_X
+
+        MazeDrawer.WALL_LAYER = pygame.Surface((Window.WIDTH, Window.HEIGHT))
+        MazeDrawer.WALL_LAYER.fill(vc.Color.WHITE)
+        MazeDrawer._LAYER_MAZE = maze
+        MazeDrawer._LAYER_WALLS = bytearray(maze.walls)
+        MazeDrawer._LAYER_VERSION = maze.walls_version
+
+        # The whole grid, one line per row and column, then the opened walls are erased
+        right = left + maze.width * length
+        bottom = maze.height * length
+        for row in range(maze.height + 1):
+            pygame.draw.line(
+                MazeDrawer.WALL_LAYER, vc.Color.BLACK, (left, row * length), (right, row * length)
+            )
+        for col in range(maze.width + 1):
+            x = left + col * length
+            pygame.draw.line(MazeDrawer.WALL_LAYER, vc.Color.BLACK, (x, 0), (x, bottom))
+        for index, walls in enumerate(maze.walls):
+            if walls & m.OPEN_EAST:
+                MazeDrawer._draw_wall(index, False, True)
+            if walls & m.OPEN_SOUTH:
+                MazeDrawer._draw_wall(index, True, True)
+
+        # Everything on screen is outdated
+        Window.SCREEN.blit(MazeDrawer.WALL_LAYER, (0, 0))
+        MazeDrawer._PREVIOUS_FRAME = {}
+        MazeDrawer._STALE_AREAS = []
+        MazeDrawer._STALE_CELLS = set(MazeDrawer._CELL_COLORS)
+        Window.refresh_all()
+
+    @staticmethod
+    def _update_wall_layer(maze: m.Maze) -> None:
+        """Redraws on the layer the walls that changed since the last call, found row by row"""
+        drawn = MazeDrawer._LAYER_WALLS
+        walls = maze.walls
+        width = maze.width
+
+        for row_start in range(0, maze.size, width):
+            row_end = row_start + width
+            if walls[row_start:row_end] == drawn[row_start:row_end]:
+                continue
+
+            for index in range(row_start, row_end):
+                changed = walls[index] ^ drawn[index]
+                if changed & m.OPEN_EAST:
+                    MazeDrawer._STALE_AREAS.append(
+                        MazeDrawer._draw_wall(index, False, walls[index] & m.OPEN_EAST)
                     )
-                if not cell.right_wall.is_opened:
-                    MazeDrawer._draw_line(
-                        (x_coord + MazeDrawer.CELL_SIZE, y_coord),
-                        (
-                            x_coord + MazeDrawer.CELL_SIZE,
-                            y_coord + MazeDrawer.CELL_SIZE,
-                        ),
+                    MazeDrawer._STALE_CELLS.update((index, index + 1))
+                if changed & m.OPEN_SOUTH:
+                    MazeDrawer._STALE_AREAS.append(
+                        MazeDrawer._draw_wall(index, True, walls[index] & m.OPEN_SOUTH)
                     )
-                x_coord += MazeDrawer.CELL_SIZE
-            y_coord += MazeDrawer.CELL_SIZE
-            x_coord = center_x_start
+                    MazeDrawer._STALE_CELLS.update((index, index + width))
+            drawn[row_start:row_end] = walls[row_start:row_end]
+
+        MazeDrawer._LAYER_VERSION = maze.walls_version
+
+    @staticmethod
+    def draw_maze(maze: m.Maze) -> None:
+        """Draw the maze on pygame's window"""
+        if maze is not MazeDrawer._LAYER_MAZE:
+            MazeDrawer._build_wall_layer(maze)
+        elif maze.walls_version != MazeDrawer._LAYER_VERSION:
+            MazeDrawer._update_wall_layer(maze)
 
         MazeDrawer.draw_start_and_end_cells(maze)
 
+    @staticmethod
+    def _render_frame() -> None:
+        """Puts on screen the cells whose colors changed since the last frame, and the walls
+        that changed, updating only those rectangles of the display"""
+        screen = Window.SCREEN
+        layer = MazeDrawer.WALL_LAYER
+        length = MazeDrawer.CELL_SIZE
+        maze = MazeDrawer._LAYER_MAZE
+        colors = MazeDrawer._CELL_COLORS
+        frame = MazeDrawer._FRAME
+        previous_frame = MazeDrawer._PREVIOUS_FRAME
+        areas = MazeDrawer._STALE_AREAS
+        cells = MazeDrawer._STALE_CELLS | MazeDrawer._CHANGED_CELLS
+
+        for index in frame.keys() | previous_frame.keys():
+            if frame.get(index) != previous_frame.get(index):
+                cells.add(index)
+
+        for area in areas:
+            screen.blit(layer, area, area)
+
+        # Each cell is put back from the layer (its square also holds its top and left walls)
+        # then drawn again, the squares of two cells never overlapping
+        for index in cells:
+            if index >= maze.size:
+                continue
+            row, col = divmod(index, maze.width)
+            square = (MazeDrawer.ORIGIN_X + col * length, row * length, length, length)
+            screen.blit(layer, square, square)
+            areas.append(square)
+
+            if index in colors:
+                pygame.draw.rect(
+                    screen,
+                    colors[index],
+                    (square[0] + 1, square[1] + 1, length - 1, length - 1),
+                )
+            for rect, color in frame.get(index, ()):
+                pygame.draw.rect(screen, color, rect)
+
+        Window.refresh_all(areas)
+
+        MazeDrawer._PREVIOUS_FRAME = frame
+        MazeDrawer._FRAME = {}
+        MazeDrawer._STALE_AREAS = []
+        MazeDrawer._STALE_CELLS = set()
+        MazeDrawer._CHANGED_CELLS = set()
+
     def handle_events(self) -> None:
         # Looking for any event
         for event in pygame.event.get():
@@ -830,12 +1448,18 @@ class MazeDrawer(Window):
                 if event.key == pygame.K_SPACE:
                     if not self.maze.is_generated:
                         print("\nGenerating...")
-                        self.maze_generator.generate(self.maze)
+                        self.maze_generator.generate(self.maze, stats=Window.SHOW_STATS)
                         print(vc.CMDColors.GREEN + "Generated!" + vc.CMDColors.RESET)
+                        if Window.SHOW_STATS:
+                            print(self.maze_generator.last_stats)
                     elif not self.maze.is_solved:
                         print("\nSolving...")
-                        self.final_res = self.maze_solver.solve(self.maze)
+                        self.final_res = self.maze_solver.solve(
+                            self.maze, stats=Window.SHOW_STATS
+                        )
                         print(vc.CMDColors.GREEN + "Solved!" + vc.CMDColors.RESET)
+                        if Window.SHOW_STATS:
+                            print(self.maze_solver.last_stats)
 
     def start(self) -> None:
         Window.RUNNING = True
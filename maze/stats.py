@@ -0,0 +1,255 @@
+"""Opt-in statistics of a single run of a generation or solving algorithm.
+
+The work counters are read from the step events of the algorithm (see maze.events), counted on
+a separate run over a scratch copy of the maze, with its source of randomness in the same state.
+The run measured is the usual one, its wall time, profile and memory not including the events
+being built. Both runs are checked to give the same maze (or path), so a run depending on some
+other state can't report the counters of another. Nothing of this runs unless asked for.
+
+The frontier counters are those of the solvers (contracted A* and Dijkstra counting the nodes
+of the junction graph) but dead_end_filling, which has none, and of depth_first_search among the
+generators. randomized_prim only pushes the cells next to the maze, so its pops and peak mean
+nothing, and the other generators have no frontier of cells. cells_visited counts the cells
+joining the maze, so it is only set for the generators (randomized_kruskal counting both cells of
+each wall it opens), the cells dead_end_filling fills being counted in cells_filled.
+"""
+
+import copy
+import cProfile
+import json
+import pstats
+import random
+import time
+import tracemalloc
+
+import maze.events as events
+import maze.maze as m
+
+PROFILE_ENTRIES = 20  # Functions of the profile kept by to_dict, the slowest ones first
+MEMORY_ENTRIES = 10  # Lines of the tracemalloc snapshot kept by to_dict, the biggest ones first
+
+
+class RunStats:
+    def __init__(self, algorithm: str, width: int, height: int):
+        """Statistics of a run of an algorithm on a maze
+
+        Args:
+            algorithm (str): Name of the algorithm
+            width (int): Width of the maze
+            height (int): Height of the maze
+        """
+        self.algorithm = algorithm
+        self.width = width
+        self.height = height
+
+        self.seconds = 0.0
+        self.steps = 0
+        self.cells_visited = 0  # Joined the maze, generators only: the solvers push and pop
+        self.walls_opened = 0
+        self.frontier_pushes = 0  # Into the stack, queue or heap of the algorithm
+        self.frontier_pops = 0
+        self.frontier_peak = 0  # Biggest size of the frontier
+        # Solvers only: cells whose neighbors were looked at, which every solver shows as its
+        # current cell (junction nodes for the contracted searches, none for dead_end_filling)
+        self.cells_expanded = None
+        self.cells_filled = 0  # dead_end_filling only
+        self.path_length = None  # Solvers only
+
+        self.profile = None  # pstats.Stats of the run, if profiled
+        self.memory_peak = None  # Bytes, if the memory was traced
+        self.memory_snapshot = None  # tracemalloc.Snapshot at the end of the run, if traced
+
+        self.result = None  # What the algorithm returned (the path for the solvers)
+        self._current_cells = 0
+
+    def __str__(self):
+        s = (
+            f"{self.algorithm} on {self.width}x{self.height}: {self.seconds * 1e3:.1f} ms, "
+            f"{self.steps} steps, {self.cells_visited} cells visited, "
+            f"{self.walls_opened} walls opened, frontier of {self.frontier_peak} cells at most "
+            f"({self.frontier_pushes} pushes, {self.frontier_pops} pops)"
+        )
+        if self.cells_expanded is not None:
+            s += f", {self.cells_expanded} cells expanded"
+        if self.cells_filled > 0:
+            s += f", {self.cells_filled} cells filled"
+        if self.path_length is not None:
+            s += f", path of {self.path_length} cells"
+        if self.memory_peak is not None:
+            s += f", {self.memory_peak / 1e6:.2f} MB at most"
+        return s
+
+    def count(self, step: tuple) -> None:
+        """Adds the events of a step to the counters
+
+        Args:
+            step (tuple): The events of the step
+        """
+        self.steps += 1
+        for event in step:
+            kind = event[0]
+            if kind == events.CELL_VISITED:
+                self.cells_visited += 1
+            elif kind == events.WALL_OPENED:
+                self.walls_opened += 1
+            elif kind == events.FRONTIER_PUSH:
+                self.frontier_pushes += 1
+                self.frontier_peak = max(
+                    self.frontier_peak, self.frontier_pushes - self.frontier_pops
+                )
+            elif kind == events.FRONTIER_POP:
+                self.frontier_pops += 1
+            elif kind == events.CURRENT_CELL:
+                self._current_cells += 1
+            elif kind == events.CELL_FILLED:
+                self.cells_filled += 1
+
+    def to_dict(self) -> dict:
+        """Gets the statistics as plain values, the profile and the memory snapshot being cut
+        down to their biggest entries
+
+        Returns:
+            dict: The statistics
+        """
+        d = {
+            "algorithm": self.algorithm,
+            "width": self.width,
+            "height": self.height,
+            "seconds": self.seconds,
+            "steps": self.steps,
+            "cells_visited": self.cells_visited,
+            "walls_opened": self.walls_opened,
+            "frontier_pushes": self.frontier_pushes,
+            "frontier_pops": self.frontier_pops,
+            "frontier_peak": self.frontier_peak,
+            "cells_expanded": self.cells_expanded,
+            "cells_filled": self.cells_filled,
+            "path_length": self.path_length,
+            "memory_peak": self.memory_peak,
+        }
+
+        if self.profile is not None:
+            entries = sorted(self.profile.stats.items(), key=lambda item: -item[1][3])
+            d["profile"] = [
+                {
+                    "function": f"{file}:{line}({name})",
+                    "calls": calls,
+                    "seconds": own_time,
+                    "cumulative_seconds": cumulative_time,
+                }
+                for (file, line, name), (_, calls, own_time, cumulative_time, _) in entries[
+                    :PROFILE_ENTRIES
+                ]
+            ]
+
+        if self.memory_snapshot is not None:
+            d["memory"] = [
+                {"line": str(stat.traceback), "bytes": stat.size, "blocks": stat.count}
+                for stat in self.memory_snapshot.statistics("lineno")[:MEMORY_ENTRIES]
+            ]
+
+        return d
+
+    def to_json(self, **kwargs) -> str:
+        """Gets the statistics as JSON (see to_dict)
+
+        Args:
+            **kwargs: Arguments of json.dumps (e.g. indent)
+
+        Returns:
+            str: The JSON document
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def _scratch_copy(maze: m.Maze) -> m.Maze:
+    if maze.is_generated:
+        # The solvers only read the walls, shared rather than copied so a mapped maze stays
+        # mapped. The cell views are built again, bound to the copy
+        scratch = copy.copy(maze)
+        scratch._cell_views = {}
+        scratch._cells = None
+        scratch._rows = None
+        return scratch
+
+    scratch = m.Maze(maze.width, maze.height)
+    scratch.walls[:] = bytes(maze.walls)
+    scratch.visited[:] = maze.visited
+    scratch.start = maze.start
+    scratch.end = maze.end
+    return scratch
+
+
+def measure(
+    algorithm,
+    maze: m.Maze,
+    *args,
+    profile: bool = False,
+    trace_memory: bool = False,
+    **kwargs,
+) -> RunStats:
+    """Runs an algorithm on a maze, gathering the statistics of the run. The events are counted
+    on a scratch copy of the maze first, then the run on the maze itself is the one measured
+
+    Args:
+        algorithm (function): A generator or a solver (e.g. MazeGenerator.wilson), animated
+        if its Window flag is set
+        maze (Maze): The maze to run the algorithm on
+        *args, **kwargs: Other arguments of the algorithm
+        profile (bool, optional): Profiles the run with cProfile. Defaults to False.
+        trace_memory (bool, optional): Traces the memory allocations of the run with
+        tracemalloc. Defaults to False.
+
+    Raises:
+        RuntimeError: If both runs did not give the same maze or path
+
+    Returns:
+        RunStats: The statistics, with what the algorithm returned as result
+    """
+    stats = RunStats(algorithm.__name__, maze.width, maze.height)
+
+    # The source of randomness (the rng argument of the generators, or the random module) is put
+    # back as it was once the events are counted
+    rng = kwargs.get("rng") or random
+    state = rng.getstate()
+    scratch = _scratch_copy(maze)
+    counted = events.run(
+        events.observe(algorithm.steps(scratch, *args, emit=True, **kwargs), stats.count)
+    )
+    rng.setstate(state)
+
+    profiler = cProfile.Profile() if profile else None
+    # Someone else may be tracing already (e.g. a benchmark), their tracing is left running
+    was_tracing = tracemalloc.is_tracing()
+    if trace_memory:
+        if was_tracing:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+
+    start = time.perf_counter()
+    try:
+        stats.result = algorithm(maze, *args, **kwargs)
+    finally:
+        stats.seconds = time.perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+            stats.profile = pstats.Stats(profiler)
+        if trace_memory:
+            stats.memory_peak = tracemalloc.get_traced_memory()[1]
+            stats.memory_snapshot = tracemalloc.take_snapshot()
+            if not was_tracing:
+                tracemalloc.stop()
+
+    if (scratch.walls is not maze.walls and bytes(scratch.walls) != bytes(maze.walls)) or (
+        isinstance(stats.result, list)
+        and [cell.id for cell in counted] != [cell.id for cell in stats.result]
+    ):
+        raise RuntimeError(f"The counted run of {stats.algorithm} differs from the measured one")
+
+    if isinstance(stats.result, list):
+        stats.cells_expanded = stats._current_cells
+        stats.path_length = len(stats.result)
+    return stats
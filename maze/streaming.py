@@ -0,0 +1,150 @@
+"""Row by row maze generation, keeping only the current row in memory so mazes can be as
+high as wanted (or endless). Usable from the command line with:
+
+    python -m maze.streaming WIDTH [--height HEIGHT] [--seed SEED] [--format text|binary] [--output FILE]
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import BinaryIO, Iterator, TextIO
+
+from maze.disjoint_set import DisjointSet
+from maze.maze import OPEN_EAST, OPEN_SOUTH
+
+
+def eller_rows(
+    width: int, height: int = None, rng: random.Random = None
+) -> Iterator[bytearray]:
+    """Eller's algorithm yielding each row once finished. Only the set labels of the current row
+    are kept, so the memory used only depends on the width
+
+    Args:
+        width (int): Width of the maze
+        height (int, optional): Height of the maze, None for an endless one. Defaults to None.
+        rng (random.Random, optional): Source of randomness, the random module if None.
+        Defaults to None.
+
+    Yields:
+        bytearray: Walls of the row, one OPEN_EAST | OPEN_SOUTH byte per cell
+    """
+    rng = rng or random
+
+    # Set label of each cell of the row, labels always being in range(width)
+    labels = list(range(width))
+    row_number = 0
+
+    while height is None or row_number < height:
+        is_last_row = height is not None and row_number == height - 1
+        walls = bytearray(width)
+        sets = DisjointSet(width)
+
+        # Randomly joining adjacent cells of distinct sets, all of them on the last row
+        for col in range(width - 1):
+            if (is_last_row or rng.getrandbits(1)) and sets.union(
+                labels[col], labels[col + 1]
+            ):
+                walls[col] |= OPEN_EAST
+
+        if not is_last_row:
+            row_sets = {}
+            for col in range(width):
+                row_sets.setdefault(sets.find(labels[col]), []).append(col)
+
+            # Each set must go down at least once, otherwise it would be cut from the rest
+            next_labels = [-1] * width
+            for label, set_ in row_sets.items():
+                chosen_col = rng.choice(set_)
+                for col in set_:
+                    if col == chosen_col or rng.getrandbits(1):
+                        walls[col] |= OPEN_SOUTH
+                        next_labels[col] = label
+
+            # Cells not connected from above start their own set with a free label
+            free_labels = iter(set(range(width)).difference(next_labels))
+            for col in range(width):
+                if next_labels[col] == -1:
+                    next_labels[col] = next(free_labels)
+            labels = next_labels
+
+        yield walls
+        row_number += 1
+
+
+def write_text(rows: Iterator[bytearray], width: int, stream: TextIO) -> None:
+    """Writes the rows as ASCII art, line by line
+
+    Args:
+        rows (Iterator[bytearray]): Walls of each row
+        width (int): Width of the maze
+        stream (TextIO): Where to write
+    """
+    stream.write("+" + "--+" * width + "\n")
+    for walls in rows:
+        stream.write(
+            "|"
+            + "".join("   " if wall & OPEN_EAST else "  |" for wall in walls)
+            + "\n+"
+            + "".join("  +" if wall & OPEN_SOUTH else "--+" for wall in walls)
+            + "\n"
+        )
+
+
+def write_binary(rows: Iterator[bytearray], stream: BinaryIO) -> None:
+    """Writes the rows as raw bytes, one OPEN_EAST | OPEN_SOUTH byte per cell
+
+    Args:
+        rows (Iterator[bytearray]): Walls of each row
+        stream (BinaryIO): Where to write
+    """
+    for walls in rows:
+        stream.write(walls)
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m maze.streaming",
+        description="Generates a maze row by row with Eller's algorithm",
+    )
+    parser.add_argument("width", type=int, help="width of the maze")
+    parser.add_argument(
+        "--height", type=int, default=None, help="height of the maze (endless if omitted)"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed of the generation")
+    parser.add_argument(
+        "--format", choices=["text", "binary"], default="text", help="output format"
+    )
+    parser.add_argument(
+        "--output", "-o", default=None, help="output file (standard output if omitted)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.width < 1 or (args.height is not None and args.height < 1):
+        parser.error("the maze must be at least 1x1")
+
+    rows = eller_rows(args.width, args.height, random.Random(args.seed))
+
+    try:
+        if args.format == "text":
+            if args.output is None:
+                write_text(rows, args.width, sys.stdout)
+            else:
+                with open(args.output, "w") as f:
+                    write_text(rows, args.width, f)
+        else:
+            if args.output is None:
+                write_binary(rows, sys.stdout.buffer)
+            else:
+                with open(args.output, "wb") as f:
+                    write_binary(rows, f)
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # Endless mazes are meant to be cut by the reader (e.g. piped to head), the remaining
+        # output goes to devnull so the interpreter does not fail again when flushing it on exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+if __name__ == "__main__":
+    main()
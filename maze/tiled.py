@@ -0,0 +1,364 @@
+"""Generation of giant mazes in tiles, each tile being generated by any registered generator in
+a pool of processes writing to shared memory, then joined to its neighbors through a few seam
+walls so the whole stays a perfect maze. Usable from the command line with:
+
+    python -m maze.tiled ALGORITHM WIDTH HEIGHT [--tile SIZE] [--seed SEED] [--workers WORKERS] [--output FILE] [--verify]
+
+The seams are chosen by a randomized Kruskal over the tiles: each tile being a spanning tree of
+its cells, opening one wall per edge of a spanning tree of the tiles gives a spanning tree of
+the whole grid.
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import maze.maze as m
+import maze.maze_file as mf
+import maze.maze_tools as mt
+from maze.disjoint_set import DisjointSet
+
+TILE_SIZE = 512
+
+# Set in each worker process by _init_worker
+_shared = None
+_width = None
+_height = None
+_generator = None
+_pool = None
+
+
+def get_tiles(width: int, height: int, tile_size: int) -> list[tuple[int, int, int, int]]:
+    """Splits a grid into tiles, the last ones of each row and column being smaller if needed
+
+    Args:
+        width (int): Width of the grid
+        height (int): Height of the grid
+        tile_size (int): Width and height of the tiles
+
+    Returns:
+        list[tuple[int, int, int, int]]: Column, row, width and height of each tile, row by row
+    """
+    return [
+        (col, row, min(tile_size, width - col), min(tile_size, height - row))
+        for row in range(0, height, tile_size)
+        for col in range(0, width, tile_size)
+    ]
+
+
+def _init_worker(name: str, width: int, height: int, algorithm: str) -> None:
+    global _shared, _width, _height, _generator, _pool
+
+    mt.Window.GENERATE_ANIMATION = False
+    _shared = shared_memory.SharedMemory(name=name)
+    _width = width
+    _height = height
+    if algorithm is not None:
+        _generator = mt.get_algorithm(mt.MazeGenerator, algorithm)
+    _pool = m.MazePool(max_per_size=1)
+
+
+def _generate_tile(task: tuple) -> None:
+    (col, row, tile_width, tile_height), seed = task
+
+    # Seeded from the position of the tile, so the maze doesn't depend on the number of workers
+    rng = random.Random(f"{seed}:{col}:{row}")
+    buffer = _shared.buf
+    with _pool.maze(tile_width, tile_height) as maze:
+        _generator(maze, rng)
+        for tile_row in range(tile_height):
+            start = (row + tile_row) * _width + col
+            buffer[start : start + tile_width] = maze.walls[
+                tile_row * tile_width : (tile_row + 1) * tile_width
+            ]
+
+
+def stitch(walls: bytearray, width: int, height: int, tile_size: int, rng: random.Random) -> int:
+    """Joins the tiles by opening one wall of the seam between each pair of tiles linked by a
+    random spanning tree of the tiles
+
+    Args:
+        walls (bytearray): OPEN_EAST | OPEN_SOUTH state of each cell, every tile being generated
+        width (int): Width of the maze
+        height (int): Height of the maze
+        tile_size (int): Width and height of the tiles
+        rng (Random): Random generator choosing the seams
+
+    Returns:
+        int: Number of walls opened
+    """
+    columns = -(-width // tile_size)
+    rows = -(-height // tile_size)
+
+    # (tile, neighbor tile, True if the neighbor is below, False if it is on the right)
+    seams = [
+        (row * columns + col, row * columns + col + 1, False)
+        for row in range(rows)
+        for col in range(columns - 1)
+    ] + [
+        (row * columns + col, (row + 1) * columns + col, True)
+        for row in range(rows - 1)
+        for col in range(columns)
+    ]
+    rng.shuffle(seams)
+
+    tiles = DisjointSet(columns * rows)
+    opened = 0
+    for tile, neighbor, is_below in seams:
+        if not tiles.union(tile, neighbor):
+            continue
+
+        row, col = divmod(tile, columns)
+        if is_below:
+            # A random cell of the bottom row of the tile goes down
+            last_row = min((row + 1) * tile_size, height) - 1
+            cell_col = rng.randrange(col * tile_size, min((col + 1) * tile_size, width))
+            walls[last_row * width + cell_col] |= m.OPEN_SOUTH
+        else:
+            # A random cell of the last column of the tile goes right
+            last_col = min((col + 1) * tile_size, width) - 1
+            cell_row = rng.randrange(row * tile_size, min((row + 1) * tile_size, height))
+            walls[cell_row * width + last_col] |= m.OPEN_EAST
+        opened += 1
+
+    return opened
+
+
+def generate_walls(
+    algorithm: str,
+    width: int,
+    height: int,
+    tile_size: int = TILE_SIZE,
+    seed: int = 0,
+    workers: int = None,
+) -> bytearray:
+    """Generates a perfect maze tile by tile across a pool of processes, then stitches the tiles
+
+    Args:
+        algorithm (str): Name of the generator run on each tile (e.g. "depth_first_search")
+        width (int): Width of the maze
+        height (int): Height of the maze
+        tile_size (int, optional): Width and height of the tiles. Defaults to TILE_SIZE.
+        seed (int, optional): Seed of the generation, the maze being the same whatever the
+        number of workers. Defaults to 0.
+        workers (int, optional): Number of processes, one per CPU if None. Defaults to None.
+
+    Raises:
+        ValueError: If there is no generator with this name
+
+    Returns:
+        bytearray: OPEN_EAST | OPEN_SOUTH state of each cell
+    """
+    mt.get_algorithm(mt.MazeGenerator, algorithm)  # Fails early on unknown names
+    workers = workers or os.cpu_count() or 1
+    tiles = get_tiles(width, height, tile_size)
+
+    # Zero-filled on creation, so every wall starts closed. It may be a bit bigger than asked
+    shared = shared_memory.SharedMemory(create=True, size=width * height)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shared.name, width, height, algorithm),
+        ) as executor:
+            for _ in executor.map(_generate_tile, [(tile, seed) for tile in tiles]):
+                pass
+        walls = bytearray(shared.buf[: width * height])
+    finally:
+        shared.close()
+        shared.unlink()
+
+    stitch(walls, width, height, tile_size, random.Random(f"{seed}:seams"))
+    return walls
+
+
+def generate_tiled(
+    algorithm: str,
+    width: int,
+    height: int,
+    tile_size: int = TILE_SIZE,
+    seed: int = 0,
+    workers: int = None,
+) -> m.Maze:
+    """Generates a perfect maze tile by tile across a pool of processes (see generate_walls)
+
+    Args:
+        algorithm (str): Name of the generator run on each tile (e.g. "depth_first_search")
+        width (int): Width of the maze
+        height (int): Height of the maze
+        tile_size (int, optional): Width and height of the tiles. Defaults to TILE_SIZE.
+        seed (int, optional): Seed of the generation. Defaults to 0.
+        workers (int, optional): Number of processes, one per CPU if None. Defaults to None.
+
+    Returns:
+        Maze: The generated maze
+    """
+    maze = m.Maze(width, height)
+    maze.walls[:] = generate_walls(algorithm, width, height, tile_size, seed, workers)
+    maze.walls_version += 1
+    maze.is_generated = True
+    return maze
+
+
+def _verify_tile(tile: tuple) -> tuple:
+    col, row, tile_width, tile_height = tile
+    width = _width
+    height = _height
+    walls = _shared.buf
+    sets = DisjointSet(tile_width * tile_height)
+    components = tile_width * tile_height
+    problem = None
+
+    for tile_row in range(tile_height):
+        start = (row + tile_row) * width + col
+        for tile_col in range(tile_width):
+            cell_walls = walls[start + tile_col]
+            cell = tile_row * tile_width + tile_col
+
+            if cell_walls & m.OPEN_EAST:
+                if tile_col < tile_width - 1:
+                    if sets.union(cell, cell + 1):
+                        components -= 1
+                    else:
+                        problem = problem or f"cycle through cell {start + tile_col}"
+                elif col + tile_width == width:
+                    problem = problem or f"cell {start + tile_col} opens onto the east border"
+
+            if cell_walls & m.OPEN_SOUTH:
+                if tile_row < tile_height - 1:
+                    if sets.union(cell, cell + tile_width):
+                        components -= 1
+                    else:
+                        problem = problem or f"cycle through cell {start + tile_col}"
+                elif row + tile_height == height:
+                    problem = problem or f"cell {start + tile_col} opens onto the south border"
+
+    # Each cell of the edges of the tile gets the (grid) index of the root of its set, so the
+    # seams can be joined without knowing anything else of the tile
+    edge_cells = {0, tile_height - 1}
+    labels = {}
+    for tile_row in range(tile_height):
+        cols = range(tile_width) if tile_row in edge_cells else {0, tile_width - 1}
+        for tile_col in cols:
+            root_row, root_col = divmod(sets.find(tile_row * tile_width + tile_col), tile_width)
+            labels[(row + tile_row) * width + col + tile_col] = (
+                (row + root_row) * width + col + root_col
+            )
+
+    return components, problem, labels
+
+
+def verify_perfect(
+    walls: bytes,
+    width: int,
+    height: int,
+    tile_size: int = TILE_SIZE,
+    workers: int = None,
+) -> None:
+    """Checks that a maze is perfect: all of its cells connected, with no cycle and no wall
+    opened onto the borders. The tiles are checked across a pool of processes with a union-find
+    each, then the seams between them with a union-find over the sets found in the tiles
+
+    Args:
+        walls (bytes): OPEN_EAST | OPEN_SOUTH state of each cell
+        width (int): Width of the maze
+        height (int): Height of the maze
+        tile_size (int, optional): Width and height of the tiles checked at once, whatever the
+        tiles of the generation. Defaults to TILE_SIZE.
+        workers (int, optional): Number of processes, one per CPU if None. Defaults to None.
+
+    Raises:
+        ValueError: If the maze is not perfect, telling why
+    """
+    workers = workers or os.cpu_count() or 1
+    tiles = get_tiles(width, height, tile_size)
+
+    shared = shared_memory.SharedMemory(create=True, size=width * height)
+    try:
+        shared.buf[: width * height] = walls
+        components = 0
+        labels = {}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shared.name, width, height, None),
+        ) as executor:
+            for tile_components, problem, tile_labels in executor.map(_verify_tile, tiles):
+                if problem is not None:
+                    raise ValueError(f"The maze is not perfect: {problem}")
+                components += tile_components
+                labels.update(tile_labels)
+    finally:
+        shared.close()
+        shared.unlink()
+
+    ids = {label: i for i, label in enumerate(set(labels.values()))}
+    sets = DisjointSet(len(ids))
+
+    def join(cell: int, neighbor: int) -> None:
+        nonlocal components
+        if not sets.union(ids[labels[cell]], ids[labels[neighbor]]):
+            raise ValueError(f"The maze is not perfect: cycle through cell {cell}")
+        components -= 1
+
+    for seam_col in range(tile_size - 1, width - 1, tile_size):
+        for cell in range(seam_col, width * height, width):
+            if walls[cell] & m.OPEN_EAST:
+                join(cell, cell + 1)
+    for seam_row in range(tile_size - 1, height - 1, tile_size):
+        for cell in range(seam_row * width, (seam_row + 1) * width):
+            if walls[cell] & m.OPEN_SOUTH:
+                join(cell, cell + width)
+
+    if components != 1:
+        raise ValueError(f"The maze is not perfect: {components} separate parts")
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m maze.tiled",
+        description="Generates a giant maze in tiles, across a pool of processes",
+    )
+    parser.add_argument("algorithm", choices=list(mt.MazeGenerator.ALGORITHMS))
+    parser.add_argument("width", type=int, help="width of the maze")
+    parser.add_argument("height", type=int, help="height of the maze")
+    parser.add_argument(
+        "--tile", type=int, default=TILE_SIZE, help="width and height of the tiles"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generation")
+    parser.add_argument(
+        "--workers", "-j", type=int, default=None, help="number of processes (one per CPU by default)"
+    )
+    parser.add_argument("--output", "-o", default=None, help="maze file to write (see maze.maze_file)")
+    parser.add_argument("--verify", action="store_true", help="check that the maze is perfect")
+    args = parser.parse_args(argv)
+
+    if args.width < 1 or args.height < 1:
+        parser.error("the maze must be at least 1x1")
+    if args.tile < 1:
+        parser.error("the tiles must be at least 1x1")
+
+    start = time.perf_counter()
+    walls = generate_walls(
+        args.algorithm, args.width, args.height, args.tile, args.seed, args.workers
+    )
+    elapsed = time.perf_counter() - start
+    cells = args.width * args.height
+    print(f"Generated {cells} cells in {elapsed:.2f}s ({cells / elapsed:.0f} cells/s)")
+
+    if args.verify:
+        start = time.perf_counter()
+        verify_perfect(walls, args.width, args.height, args.tile, args.workers)
+        print(f"Verified perfect in {time.perf_counter() - start:.2f}s")
+
+    if args.output is not None:
+        header = mf.MazeHeader(args.width, args.height, 0, cells - 1, args.algorithm, args.seed)
+        with open(args.output, "wb") as f:
+            mf.write_walls(f, header, walls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""Compact binary traces of the steps of the algorithms (see maze.events), replayable at any
+speed without running the algorithms again. Usable from the command line with:
+
+    python -m maze.trace record GENERATOR WIDTH HEIGHT [--solver SOLVER] [--seed SEED] --output FILE
+    python -m maze.trace replay FILE [--steps-per-frame STEPS] [--start STEP]
+    python -m maze.trace info FILE
+
+A trace starts with MAGIC, the format version and the varints of the width, height, start, end
+and seed of the maze. Then comes one byte per event: its opcode, with LAST_OF_STEP set on the
+last event of each step, followed by its cells. Each cell is written as the zigzag varint of its
+difference with the previous cell, which takes a single byte for most moves. The trace ends with
+END and the number of steps.
+"""
+
+import argparse
+import os
+import random
+import struct
+from typing import BinaryIO, Iterator
+
+import maze.events as events
+import maze.maze as m
+import maze.maze_tools as mt
+
+MAGIC = b"MZTR"
+VERSION = 1
+FOOTER = struct.Struct("<q")  # Number of steps
+
+LAST_OF_STEP = 0x80
+RUN_STARTED = 0x10  # Followed by the name of the algorithm
+EMPTY_STEP = 0x11
+END = 0x12
+
+FLUSH_SIZE = 1 << 20
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value >> 1) + 1)
+
+
+class TraceWriter:
+    def __init__(self, stream: BinaryIO, maze: m.Maze, seed: int = None):
+        """Records the steps of the algorithms run on a maze. The generators recorded draw from
+        a random.Random of the seed (the random module being left alone), so the trace tells how
+        to get the same maze again
+
+        Args:
+            stream (BinaryIO): Where to write the trace
+            maze (Maze): The maze the algorithms will work on
+            seed (int, optional): Seed of the generation, a random one if None. Defaults to None.
+        """
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little") >> 1
+
+        self.stream = stream
+        self.maze = maze
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.step_count = 0
+
+        self._buffer = bytearray(MAGIC)
+        self._buffer.append(VERSION)
+        for value in (maze.width, maze.height, maze.start, maze.end, _zigzag(seed)):
+            _write_varint(self._buffer, value)
+        self._previous_cell = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record(self, algorithm, *args, **kwargs) -> object:
+        """Runs an algorithm on the maze, writing down each of its steps
+
+        Args:
+            algorithm (function): A generator or a solver (e.g. MazeGenerator.wilson)
+            *args, **kwargs: Other arguments of the algorithm
+
+        Returns:
+            object: What the algorithm returned (the path for the solvers)
+        """
+        if algorithm in mt.MazeGenerator.ALGORITHMS.values():
+            kwargs.setdefault("rng", self.rng)
+
+        name = algorithm.__name__.encode()
+        self._buffer.append(RUN_STARTED)
+        _write_varint(self._buffer, len(name))
+        self._buffer += name
+
+        steps = algorithm.steps(self.maze, *args, emit=True, **kwargs)
+        while True:
+            try:
+                step = next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+            self._write_step(step)
+            if len(self._buffer) > FLUSH_SIZE:
+                self.flush()
+
+    def _write_step(self, step: tuple) -> None:
+        buffer = self._buffer
+        previous = self._previous_cell
+        last = len(step) - 1
+        self.step_count += 1
+
+        if last == -1:
+            buffer.append(EMPTY_STEP | LAST_OF_STEP)
+
+        for position, event in enumerate(step):
+            kind = event[0]
+            buffer.append(kind | LAST_OF_STEP if position == last else kind)
+
+            if kind == events.PATH_FOUND:
+                cells = event[1]
+                _write_varint(buffer, len(cells))
+            else:
+                cells = event[1:]
+
+            for cell in cells:
+                delta = cell - previous
+                value = delta << 1 if delta >= 0 else (-delta << 1) - 1
+                while value > 0x7F:
+                    buffer.append(value & 0x7F | 0x80)
+                    value >>= 7
+                buffer.append(value)
+                previous = cell
+
+        self._previous_cell = previous
+
+    def flush(self) -> None:
+        self.stream.write(self._buffer)
+        self._buffer = bytearray()
+
+    def close(self) -> None:
+        """Writes the end of the trace"""
+        self._buffer.append(END)
+        self._buffer += FOOTER.pack(self.step_count)
+        self.flush()
+
+
+class Trace:
+    def __init__(self, data: bytes):
+        """A recorded trace, held in memory as it was written
+
+        Args:
+            data (bytes): Content of the trace
+
+        Raises:
+            ValueError: If the data is not a (whole) trace
+        """
+        if data[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a maze trace")
+        if len(data) == len(MAGIC):
+            raise ValueError("The trace is truncated")
+        if data[len(MAGIC)] != VERSION:
+            raise ValueError(f"Unsupported trace version {data[len(MAGIC)]}")
+        body_end = len(data) - FOOTER.size - 1
+        if body_end <= len(MAGIC) or data[body_end] != END:
+            raise ValueError("The trace is truncated")
+
+        # Width, height, start, end and seed, which must end before the footer
+        header = memoryview(data)[:body_end]
+        position = len(MAGIC) + 1
+        values = []
+        try:
+            for _ in range(5):
+                value, position = _read_varint(header, position)
+                values.append(value)
+        except IndexError:
+            raise ValueError("The trace is truncated")
+
+        self.data = data
+        self.width, self.height, self.start, self.end, seed = values
+        self.seed = _unzigzag(seed)
+        self._body = position
+        self.step_count = FOOTER.unpack_from(data, len(data) - FOOTER.size)[0]
+
+    @classmethod
+    def load(cls, path: str) -> "Trace":
+        """Loads a trace from a file, in a single read
+
+        Args:
+            path (str): Path of the file
+
+        Returns:
+            Trace: The trace
+        """
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def __len__(self):
+        return self.step_count
+
+    def __iter__(self) -> Iterator:
+        """Decodes the trace
+
+        Yields:
+            tuple | str: The events of each step, or the name of the algorithm whose steps follow
+        """
+        data = self.data
+        position = self._body
+        end = len(data) - FOOTER.size - 1
+        previous = 0
+        step = []
+
+        while position < end:
+            byte = data[position]
+            position += 1
+            kind = byte & 0x7F
+
+            if kind == RUN_STARTED:
+                length, position = _read_varint(data, position)
+                yield data[position : position + length].decode()
+                position += length
+                continue
+            if kind == EMPTY_STEP:
+                yield ()
+                continue
+
+            if kind == events.PATH_FOUND:
+                count, position = _read_varint(data, position)
+            else:
+                count = 2 if kind == events.WALL_OPENED else 1
+
+            cells = []
+            for _ in range(count):
+                value = data[position]
+                position += 1
+                if value > 0x7F:
+                    value, position = _read_varint(data, position - 1)
+                previous += value >> 1 if not value & 1 else -((value >> 1) + 1)
+                cells.append(previous)
+
+            step.append((kind, cells) if kind == events.PATH_FOUND else (kind, *cells))
+            if byte & LAST_OF_STEP:
+                yield tuple(step)
+                step = []
+
+
+class TraceReplayer:
+    def __init__(self, trace: Trace):
+        """Replays a trace step by step on a maze of its own, opening its walls as recorded
+
+        Args:
+            trace (Trace): The trace to replay
+        """
+        self.trace = trace
+        self.on_step = None  # Called with the maze and the events of each step replayed
+        self.on_run = None  # Called with the name of the algorithm when its steps begin
+        self.reset()
+
+    def reset(self) -> None:
+        """Goes back to the beginning of the trace, on a new untouched maze"""
+        self.maze = m.Maze(self.trace.width, self.trace.height)
+        self.maze.start = self.trace.start
+        self.maze.end = self.trace.end
+        self.position = 0
+        self.run_name = None
+        self._decoder = iter(self.trace)
+
+    def is_finished(self) -> bool:
+        return self.position >= len(self.trace)
+
+    def step(self) -> tuple:
+        """Replays the next step
+
+        Returns:
+            tuple: Its events, None if the trace is over
+        """
+        for item in self._decoder:
+            if isinstance(item, str):
+                self.run_name = item
+                if self.on_run is not None:
+                    self.on_run(item)
+                continue
+
+            for event in item:
+                if event[0] == events.WALL_OPENED:
+                    self.maze.open_wall(event[1], event[2])
+            self.position += 1
+            if self.on_step is not None:
+                self.on_step(self.maze, item)
+            return item
+
+        return None
+
+    def fast_forward(self, count: int) -> int:
+        """Replays several steps at once
+
+        Args:
+            count (int): Number of steps
+
+        Returns:
+            int: Number of steps actually replayed (less at the end of the trace)
+        """
+        for replayed in range(count):
+            if self.step() is None:
+                return replayed
+        return count
+
+    def seek(self, position: int) -> None:
+        """Goes to the given step, starting over if it was already passed
+
+        Args:
+            position (int): Number of steps replayed once there
+        """
+        if position < self.position:
+            self.reset()
+        self.fast_forward(position - self.position)
+
+    def play(self, steps_per_frame: int = 1, start: int = 0) -> None:
+        """Shows the replay in a window, until the trace is over or the window closed
+
+        Args:
+            steps_per_frame (int, optional): Steps replayed between two frames. Defaults to 1.
+            start (int, optional): Step to start from, the ones before being skipped. Defaults to 0.
+        """
+        mt.Window()
+        mt.MazeDrawer.fit_to_window(self.maze)
+        mt.pygame.display.set_caption(f"Replay - {len(self.trace)} steps")
+
+        self.on_run = lambda name: mt.MazeDrawer.clear_cell_colors()
+        self.on_step = lambda maze, step: mt.MazeDrawer.apply_events(maze, step, False)
+        self.reset()
+        self.seek(start)
+
+        self.on_step = mt.MazeDrawer.apply_events
+        mt.Window.RUNNING = True
+        while mt.Window.RUNNING and not self.is_finished():
+            self.fast_forward(steps_per_frame)
+            mt.MazeDrawer.refresh_drawing_on_screen(self.maze)
+            for event in mt.pygame.event.get():
+                if event.type == mt.pygame.QUIT:
+                    mt.Window.RUNNING = False
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m maze.trace",
+        description="Records the steps of the algorithms and replays them",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="record a generation (and solving)")
+    record_parser.add_argument("generator", help="e.g. aldous_broder")
+    record_parser.add_argument("width", type=int, help="width of the maze")
+    record_parser.add_argument("height", type=int, help="height of the maze")
+    record_parser.add_argument("--solver", default=None, help="e.g. a_star")
+    record_parser.add_argument("--seed", type=int, default=None, help="seed of the generation")
+    record_parser.add_argument("--output", "-o", required=True, help="output file")
+
+    replay_parser = subparsers.add_parser("replay", help="replay a trace in a window")
+    replay_parser.add_argument("trace", help="trace file")
+    replay_parser.add_argument(
+        "--steps-per-frame", type=int, default=1, help="steps replayed between two frames"
+    )
+    replay_parser.add_argument("--start", type=int, default=0, help="step to start from")
+
+    info_parser = subparsers.add_parser("info", help="describe a trace")
+    info_parser.add_argument("trace", help="trace file")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        if args.width < 1 or args.height < 1:
+            parser.error("the maze must be at least 1x1")
+        try:
+            generator = mt.get_algorithm(mt.MazeGenerator, args.generator)
+            solver = None if args.solver is None else mt.get_algorithm(mt.MazeSolver, args.solver)
+        except ValueError as e:
+            parser.error(str(e))
+
+        maze = m.Maze(args.width, args.height)
+        with open(args.output, "wb") as f, TraceWriter(f, maze, args.seed) as writer:
+            writer.record(generator)
+            maze.is_generated = True
+            maze.reset_cells_state()
+            if solver is not None:
+                writer.record(solver)
+        print(f"Recorded {writer.step_count} steps (seed {writer.seed})")
+
+    elif args.command == "replay":
+        TraceReplayer(Trace.load(args.trace)).play(args.steps_per_frame, args.start)
+
+    else:
+        size = os.path.getsize(args.trace)
+        trace = Trace.load(args.trace)
+        print(
+            f"{trace.width}x{trace.height} maze, seed {trace.seed}, {len(trace)} steps, "
+            f"{size} bytes ({size / max(1, len(trace)):.2f} bytes/step)"
+        )
+
+
+if __name__ == "__main__":
+    main()
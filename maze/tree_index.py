@@ -0,0 +1,143 @@
+from array import array
+
+import maze.maze as m
+
+
+class TreeIndex:
+    def __init__(self, maze: m.Maze, root: int = None):
+        """Index answering shortest path queries between any two cells of a perfect maze (every
+        generator builds one: a spanning tree of the grid). Built in O(N) once, after which the
+        distance between two cells costs O(log N) and the path itself O(path length)
+
+        The tree is rooted and split into heavy paths (heavy-light decomposition), so that the
+        lowest common ancestor of two cells is found by jumping from path to path
+
+        Args:
+            maze (Maze): A generated perfect maze
+            root (int, optional): Index of the root cell, the start of the maze if None. Defaults to None.
+
+        Raises:
+            ValueError: If the maze is not perfect (some cells unreachable or loops)
+        """
+        self.maze = maze
+        self.root = maze.start if root is None else root
+
+        size = maze.size
+        self.parent = array("q", [-1]) * size
+        self.depth = array("q", [0]) * size
+        self.head = array("q", [0]) * size
+
+        # Breadth-first order, so that every cell comes after its parent
+        order = array("q", [self.root])
+        seen = bytearray(size)
+        seen[self.root] = 1
+        edges = 0
+        position = 0
+        while position < len(order):
+            cell = order[position]
+            position += 1
+            for neighbor in maze.get_open_neighbors(cell):
+                edges += 1
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    self.parent[neighbor] = cell
+                    self.depth[neighbor] = self.depth[cell] + 1
+                    order.append(neighbor)
+
+        # Each wall was counted from both of its sides
+        if len(order) != size or edges != 2 * (size - 1):
+            raise ValueError("The maze is not perfect, it can't be indexed as a tree")
+
+        # The heavy child of a cell is the one with the biggest subtree
+        subtree_size = array("q", [1]) * size
+        heavy_child = array("q", [-1]) * size
+        for cell in reversed(order):
+            parent = self.parent[cell]
+            if parent != -1:
+                subtree_size[parent] += subtree_size[cell]
+                if (
+                    heavy_child[parent] == -1
+                    or subtree_size[cell] > subtree_size[heavy_child[parent]]
+                ):
+                    heavy_child[parent] = cell
+
+        for cell in order:
+            parent = self.parent[cell]
+            if parent != -1 and heavy_child[parent] == cell:
+                self.head[cell] = self.head[parent]
+            else:
+                self.head[cell] = cell
+
+    def lowest_common_ancestor(self, cell1: int, cell2: int) -> int:
+        """Finds the deepest cell having both cells in its subtree, in O(log N)
+
+        Args:
+            cell1 (int): Index of the first cell
+            cell2 (int): Index of the second cell
+
+        Returns:
+            int: Index of the lowest common ancestor
+        """
+        head = self.head
+        depth = self.depth
+        parent = self.parent
+
+        while head[cell1] != head[cell2]:
+            if depth[head[cell1]] > depth[head[cell2]]:
+                cell1 = parent[head[cell1]]
+            else:
+                cell2 = parent[head[cell2]]
+
+        return cell1 if depth[cell1] < depth[cell2] else cell2
+
+    def distance(self, cell1: int, cell2: int) -> int:
+        """Length of the path between two cells, in number of moves
+
+        Args:
+            cell1 (int): Index of the first cell
+            cell2 (int): Index of the second cell
+
+        Returns:
+            int: Number of moves from one cell to the other
+        """
+        ancestor = self.lowest_common_ancestor(cell1, cell2)
+        return self.depth[cell1] + self.depth[cell2] - 2 * self.depth[ancestor]
+
+    def path(self, cell1: int, cell2: int) -> list[int]:
+        """The path between two cells (the only one, the maze being perfect)
+
+        Args:
+            cell1 (int): Index of the first cell
+            cell2 (int): Index of the second cell
+
+        Returns:
+            list[int]: Indexes of the cells of the path, both ends included
+        """
+        ancestor = self.lowest_common_ancestor(cell1, cell2)
+        parent = self.parent
+
+        path = []
+        while cell1 != ancestor:
+            path.append(cell1)
+            cell1 = parent[cell1]
+        path.append(ancestor)
+
+        second_half = []
+        while cell2 != ancestor:
+            second_half.append(cell2)
+            cell2 = parent[cell2]
+        second_half.reverse()
+
+        return path + second_half
+
+    def get_path_cells(self, cell1: int, cell2: int) -> list[m.Cell]:
+        """Same as path, as cells (like the paths given by MazeSolver)
+
+        Args:
+            cell1 (int): Index of the first cell
+            cell2 (int): Index of the second cell
+
+        Returns:
+            list[Cell]: The cells of the path, both ends included
+        """
+        return self.maze.cells_of(self.path(cell1, cell2))
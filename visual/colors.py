@@ -1,6 +1,3 @@
-import pygame
-
-
 class CMDColors:
     HEADER = "\033[95m"
     BLUE = "\033[94m"
@@ -14,10 +11,11 @@ class CMDColors:
     UNDERLINE = "\033[4m"
 
 
+# Plain RGB tuples, which pygame accepts anywhere a color is expected
 class Color:
-    WHITE = pygame.Color("white")
-    BLACK = pygame.Color("black")
-    RED = pygame.Color("red")
-    BLUE = pygame.Color("blue")
-    GREEN = pygame.Color("green")
-    YELLOW = pygame.Color("yellow")
+    WHITE = (255, 255, 255)
+    BLACK = (0, 0, 0)
+    RED = (255, 0, 0)
+    BLUE = (0, 0, 255)
+    GREEN = (0, 255, 0)
+    YELLOW = (255, 255, 0)